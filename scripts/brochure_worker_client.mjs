@@ -0,0 +1,75 @@
+import { spawn } from 'node:child_process';
+import { createInterface } from 'node:readline';
+
+// Talks to `create_aktonz_lettings_brochure.py --worker`, a long-lived Python
+// process that keeps the decoded logo, fonts and static pages warm between
+// renders. Requests and responses are line-delimited JSON-RPC 2.0.
+export function startBrochureWorker({ cwd, python = 'python', args = [] } = {}) {
+  const child = spawn(python, ['scripts/create_aktonz_lettings_brochure.py', '--worker', ...args], {
+    cwd,
+    stdio: ['pipe', 'pipe', 'inherit'],
+  });
+  const pending = new Map();
+  let nextId = 1;
+  let exitError = null;
+
+  const failPending = (error) => {
+    exitError = error;
+    for (const { reject } of pending.values()) {
+      reject(error);
+    }
+    pending.clear();
+  };
+
+  child.once('error', failPending);
+  child.stdin.on('error', failPending);
+  child.once('exit', (code) => failPending(new Error(`Brochure worker exited with code ${code}`)));
+
+  createInterface({ input: child.stdout }).on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+    let response;
+    try {
+      response = JSON.parse(line);
+    } catch (error) {
+      // Anything but JSON-RPC on stdout means the protocol is lost; fail over to the caller's fallback.
+      failPending(new Error(`Brochure worker wrote a non-JSON line: ${line.slice(0, 200)}`, { cause: error }));
+      child.kill();
+      return;
+    }
+    const entry = pending.get(response.id);
+    if (!entry) {
+      return;
+    }
+    pending.delete(response.id);
+    if (response.error) {
+      entry.reject(new Error(`Brochure worker error ${response.error.code}: ${response.error.message}`));
+    } else {
+      entry.resolve(response.result);
+    }
+  });
+
+  function request(method, params = {}) {
+    if (exitError) {
+      return Promise.reject(exitError);
+    }
+    const id = nextId++;
+    return new Promise((resolve, reject) => {
+      pending.set(id, { resolve, reject });
+      child.stdin.write(`${JSON.stringify({ jsonrpc: '2.0', id, method, params })}\n`);
+    });
+  }
+
+  async function close() {
+    if (exitError) {
+      return;
+    }
+    const exited = new Promise((resolve) => child.once('exit', resolve));
+    await request('shutdown').catch(() => {});
+    child.stdin.end();
+    await exited;
+  }
+
+  return { request, close };
+}
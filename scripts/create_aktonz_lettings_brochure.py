@@ -2,27 +2,59 @@ from __future__ import annotations
 
 import argparse
 import base64
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import shutil
 import struct
 import sys
+import tempfile
 import textwrap
+import time
 import zlib
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Generator, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from data.aktonz_logo_modern_transparent import LOGO_PNG_BASE64
+import data.aktonz_logo_modern_transparent as logo_asset
+import embedded_assets
+import generate_aktonz_logo
+
+LISTINGS_PATH = ROOT / "data" / "listings.json"
+DEFAULT_OUTPUT = Path("docs/aktonz-lettings-brochure.pdf")
+DEFAULT_PUBLIC_OUTPUT = Path("public/brochures/aktonz-lettings-brochure.pdf")
+INLINE_MODULE_OUTPUT = Path("data/aktonz-lettings-brochure-inline.mjs")
 
 
 class PDFBuilder:
+    """Collects PDF objects and writes each one out in the order it is finished.
+
+    Objects are final once added or, for reserved numbers, once set, so
+    :meth:`drain` can hand them to a client while later pages are still being
+    laid out. Only the xref waits for the end, and by then it just needs the
+    offsets recorded along the way.
+    """
+
+    HEADER = b"%PDF-1.4\n"
+
     def __init__(self) -> None:
         self.objects: List[Optional[bytes]] = []
         self.root_object: Optional[int] = None
+        self._finished: List[int] = []
+        self._drained = 0
+        self._offsets: dict = {}
+        self._position = 0
 
     def add_object(self, content: bytes) -> int:
         self.objects.append(content)
+        self._finished.append(len(self.objects))
         return len(self.objects)
 
     def reserve_object(self) -> int:
@@ -30,44 +62,77 @@ class PDFBuilder:
         return len(self.objects)
 
     def set_object(self, obj_id: int, content: bytes) -> None:
+        if self.objects[obj_id - 1] is not None:
+            raise ValueError(f"Object {obj_id} has already been set")
         self.objects[obj_id - 1] = content
+        self._finished.append(obj_id)
 
     def set_root(self, obj_id: int) -> None:
         self.root_object = obj_id
 
-    def build(self) -> bytes:
+    def _serialise(self, obj_id: int) -> bytes:
+        obj = self.objects[obj_id - 1]
+        assert obj is not None
+        return b"".join((f"{obj_id} 0 obj\n".encode("ascii"), obj, b"" if obj.endswith(b"\n") else b"\n", b"endobj\n"))
+
+    def _trailer(self, offsets: dict, position: int) -> bytes:
         if self.root_object is None:
             raise ValueError("Root object not set")
-        if any(obj is None for obj in self.objects):
+        if len(offsets) != len(self.objects):
             raise ValueError("Not all objects have been set")
-
-        pdf = bytearray(b"%PDF-1.4\n")
-        offsets: List[int] = []
-        for index, obj in enumerate(self.objects, start=1):
-            assert obj is not None
-            offsets.append(len(pdf))
-            pdf.extend(f"{index} 0 obj\n".encode("ascii"))
-            pdf.extend(obj)
-            if not obj.endswith(b"\n"):
-                pdf.extend(b"\n")
-            pdf.extend(b"endobj\n")
-
-        xref_offset = len(pdf)
-        pdf.extend(f"xref\n0 {len(self.objects) + 1}\n".encode("ascii"))
-        pdf.extend(b"0000000000 65535 f \n")
-        for offset in offsets:
-            pdf.extend(f"{offset:010d} 00000 n \n".encode("ascii"))
-
-        trailer = (
+        xref = [f"xref\n0 {len(self.objects) + 1}\n", "0000000000 65535 f \n"]
+        xref.extend(f"{offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, len(self.objects) + 1))
+        xref.append(
             f"trailer\n<< /Size {len(self.objects) + 1} /Root {self.root_object} 0 R >>\n"
-            f"startxref\n{xref_offset}\n%%EOF\n"
+            f"startxref\n{position}\n%%EOF\n"
         )
-        pdf.extend(trailer.encode("ascii"))
-        return bytes(pdf)
+        return "".join(xref).encode("ascii")
+
+    def drain(self) -> Iterator[bytes]:
+        """Yield the objects finished since the last call, starting with the file header."""
+
+        if self._position == 0:
+            self._position = len(self.HEADER)
+            yield self.HEADER
+        while self._drained < len(self._finished):
+            obj_id = self._finished[self._drained]
+            self._drained += 1
+            chunk = self._serialise(obj_id)
+            self._offsets[obj_id] = self._position
+            self._position += len(chunk)
+            yield chunk
+
+    def finish(self) -> Iterator[bytes]:
+        """Drain the remaining objects, then yield the xref and trailer."""
+
+        yield from self.drain()
+        yield self._trailer(self._offsets, self._position)
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the whole file from the start, in the same order :meth:`drain` uses.
+
+        Unlike draining, this needs every object set first and can be repeated.
+        """
+
+        if any(obj is None for obj in self.objects):
+            raise ValueError("Not all objects have been set")
+        yield self.HEADER
+        position = len(self.HEADER)
+        offsets: dict = {}
+        for obj_id in self._finished:
+            chunk = self._serialise(obj_id)
+            offsets[obj_id] = position
+            position += len(chunk)
+            yield chunk
+        yield self._trailer(offsets, position)
+
+    def build(self) -> bytes:
+        return b"".join(self.iter_chunks())
 
 
 def make_stream(contents: str) -> bytes:
-    stream_data = contents.encode("utf-8")
+    # Text operands are already escaped to ASCII, so this is a straight byte copy.
+    stream_data = contents.encode("latin-1")
     header = f"<< /Length {len(stream_data)} >>\nstream\n".encode("ascii")
     footer = b"\nendstream\n"
     return header + stream_data + footer
@@ -78,6 +143,574 @@ def make_binary_stream(dict_entries: str, data: bytes) -> bytes:
     return prefix + data + b"\nendstream\n"
 
 
+# --- Fonts ----------------------------------------------------------------
+
+STANDARD_FONTS = {"F1": "Helvetica", "F2": "Helvetica-Bold", "F3": "Helvetica-Oblique"}
+FONT_CACHE_DIR = ROOT / ".cache" / "brochure-fonts"
+HELVETICA_METRICS_PATH = ROOT / "data" / "helvetica-metrics.json"
+
+# Tables a CIDFontType2 FontFile2 program needs; everything else is dropped from subsets.
+_SUBSET_TABLES = (b"cvt ", b"fpgm", b"glyf", b"head", b"hhea", b"hmtx", b"loca", b"maxp", b"prep")
+
+
+def _table_checksum(data: bytes) -> int:
+    padded = data + b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(padded) // 4}I", padded)) & 0xFFFFFFFF
+
+
+def _build_sfnt(tables: dict) -> bytes:
+    tags = sorted(tables)
+    count = len(tags)
+    entry_selector = max(count.bit_length() - 1, 0)
+    search_range = (1 << entry_selector) * 16
+    header = struct.pack(">IHHHH", 0x00010000, count, search_range, entry_selector, count * 16 - search_range)
+
+    directory = bytearray()
+    body = bytearray()
+    offset = 12 + count * 16
+    for tag in tags:
+        data = tables[tag]
+        directory.extend(struct.pack(">4sIII", tag, _table_checksum(data), offset + len(body), len(data)))
+        body.extend(data)
+        body.extend(b"\0" * (-len(data) % 4))
+
+    font = bytearray(header + directory + body)
+    if b"head" in tables:
+        head_offset = offset + sum(len(tables[tag]) + (-len(tables[tag]) % 4) for tag in tags[: tags.index(b"head")])
+        adjustment = (0xB1B0AFBA - _table_checksum(bytes(font))) & 0xFFFFFFFF
+        font[head_offset + 8 : head_offset + 12] = struct.pack(">I", adjustment)
+    return bytes(font)
+
+
+class TrueTypeFont:
+    """TrueType font embedded as a glyph subset (Type0 / CIDFontType2, Identity-H).
+
+    Text drawn with the font is encoded as glyph IDs and every glyph used in the
+    current document is recorded, so :meth:`write_objects` can embed only those
+    outlines together with matching ``/W`` widths and a ``/ToUnicode`` CMap.
+    Parsed metrics and finished subsets are cached on disk, keyed by the font's
+    SHA-256 and the glyph set, so repeated runs skip parsing and subsetting.
+    """
+
+    def __init__(self, path: Path, *, cache_dir: Optional[Path] = FONT_CACHE_DIR) -> None:
+        self.path = Path(path)
+        self.cache_dir = cache_dir
+        self._data = self.path.read_bytes()
+        self.digest = hashlib.sha256(self._data).hexdigest()
+        self._tables: Optional[dict] = None
+        self.used: dict = {}
+
+        metrics = self._load_cached_metrics()
+        if metrics is None:
+            metrics = self._parse_metrics()
+            self._store_cached_metrics(metrics)
+        self.postscript_name = metrics["name"]
+        self.units_per_em = metrics["units_per_em"]
+        self.bbox = metrics["bbox"]
+        self.ascent = metrics["ascent"]
+        self.descent = metrics["descent"]
+        self.cap_height = metrics["cap_height"]
+        self.italic_angle = metrics["italic_angle"]
+        self.cmap = {int(code): gid for code, gid in metrics["cmap"].items()}
+        self.advances = metrics["advances"]
+
+    # -- parsing ---------------------------------------------------------
+
+    def _table(self, tag: bytes) -> Optional[bytes]:
+        if self._tables is None:
+            data = self._data
+            version, count = struct.unpack(">IH", data[:6])
+            if version not in (0x00010000, 0x74727565):
+                raise ValueError(f"{self.path} is not a TrueType font (CFF-based OpenType is unsupported)")
+            tables = {}
+            for index in range(count):
+                tag_name, _, offset, length = struct.unpack(">4sIII", data[12 + index * 16 : 28 + index * 16])
+                tables[tag_name] = data[offset : offset + length]
+            self._tables = tables
+        return self._tables.get(tag)
+
+    def _parse_cmap(self) -> dict:
+        cmap = self._table(b"cmap")
+        if cmap is None:
+            raise ValueError(f"{self.path} has no cmap table")
+        count = struct.unpack(">H", cmap[2:4])[0]
+        subtables = {}
+        for index in range(count):
+            platform, encoding, offset = struct.unpack(">HHI", cmap[4 + index * 8 : 12 + index * 8])
+            subtables[(platform, encoding)] = offset
+        for key in ((3, 10), (0, 4), (3, 1), (0, 3)):
+            if key in subtables:
+                offset = subtables[key]
+                break
+        else:
+            raise ValueError(f"{self.path} has no Unicode cmap subtable")
+
+        mapping = {}
+        fmt = struct.unpack(">H", cmap[offset : offset + 2])[0]
+        if fmt == 4:
+            seg_count = struct.unpack(">H", cmap[offset + 6 : offset + 8])[0] // 2
+            ends_at = offset + 14
+            starts_at = ends_at + seg_count * 2 + 2
+            deltas_at = starts_at + seg_count * 2
+            ranges_at = deltas_at + seg_count * 2
+            for segment in range(seg_count):
+                end = struct.unpack(">H", cmap[ends_at + segment * 2 : ends_at + segment * 2 + 2])[0]
+                start = struct.unpack(">H", cmap[starts_at + segment * 2 : starts_at + segment * 2 + 2])[0]
+                delta = struct.unpack(">h", cmap[deltas_at + segment * 2 : deltas_at + segment * 2 + 2])[0]
+                range_pos = ranges_at + segment * 2
+                range_offset = struct.unpack(">H", cmap[range_pos : range_pos + 2])[0]
+                for code in range(start, end + 1):
+                    if code == 0xFFFF:
+                        continue
+                    if range_offset == 0:
+                        gid = (code + delta) & 0xFFFF
+                    else:
+                        glyph_pos = range_pos + range_offset + (code - start) * 2
+                        gid = struct.unpack(">H", cmap[glyph_pos : glyph_pos + 2])[0]
+                        if gid:
+                            gid = (gid + delta) & 0xFFFF
+                    if gid:
+                        mapping[code] = gid
+        elif fmt == 12:
+            groups = struct.unpack(">I", cmap[offset + 12 : offset + 16])[0]
+            for group in range(groups):
+                start, end, first_gid = struct.unpack(
+                    ">III", cmap[offset + 16 + group * 12 : offset + 28 + group * 12]
+                )
+                for code in range(start, end + 1):
+                    mapping[code] = first_gid + code - start
+        else:
+            raise ValueError(f"Unsupported cmap format {fmt} in {self.path}")
+        return mapping
+
+    def _parse_name(self) -> str:
+        table = self._table(b"name")
+        if table is not None:
+            count, string_offset = struct.unpack(">HH", table[2:6])
+            for index in range(count):
+                platform, _, _, name_id, length, offset = struct.unpack(
+                    ">HHHHHH", table[6 + index * 12 : 18 + index * 12]
+                )
+                if name_id != 6:
+                    continue
+                raw = table[string_offset + offset : string_offset + offset + length]
+                name = raw.decode("utf-16-be" if platform in (0, 3) else "latin-1", errors="ignore")
+                name = "".join(char for char in name if char.isalnum() or char in "-_")
+                if name:
+                    return name
+        return "".join(char for char in self.path.stem if char.isalnum() or char in "-_") or "Embedded"
+
+    def _parse_metrics(self) -> dict:
+        head = self._table(b"head")
+        hhea = self._table(b"hhea")
+        maxp = self._table(b"maxp")
+        hmtx = self._table(b"hmtx")
+        if head is None or hhea is None or maxp is None or hmtx is None:
+            raise ValueError(f"{self.path} is missing required TrueType tables")
+        units_per_em = struct.unpack(">H", head[18:20])[0]
+        bbox = list(struct.unpack(">hhhh", head[36:44]))
+        ascent, descent = struct.unpack(">hh", hhea[4:8])
+        metric_count = struct.unpack(">H", hhea[34:36])[0]
+        glyph_count = struct.unpack(">H", maxp[4:6])[0]
+        advances = [struct.unpack(">H", hmtx[index * 4 : index * 4 + 2])[0] for index in range(metric_count)]
+        advances.extend([advances[-1]] * (glyph_count - metric_count))
+
+        cap_height = int(ascent * 0.7)
+        os2 = self._table(b"OS/2")
+        if os2 is not None and len(os2) >= 90 and struct.unpack(">H", os2[0:2])[0] >= 2:
+            cap_height = struct.unpack(">h", os2[88:90])[0]
+        italic_angle = 0.0
+        post = self._table(b"post")
+        if post is not None:
+            italic_angle = struct.unpack(">i", post[4:8])[0] / 65536.0
+
+        return {
+            "name": self._parse_name(),
+            "units_per_em": units_per_em,
+            "bbox": bbox,
+            "ascent": ascent,
+            "descent": descent,
+            "cap_height": cap_height,
+            "italic_angle": italic_angle,
+            "cmap": self._parse_cmap(),
+            "advances": advances,
+        }
+
+    # -- caching ---------------------------------------------------------
+
+    def _cache_path(self, name: str) -> Optional[Path]:
+        return self.cache_dir / name if self.cache_dir is not None else None
+
+    def _load_cached_metrics(self) -> Optional[dict]:
+        path = self._cache_path(f"{self.digest}.json")
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_metrics(self, metrics: dict) -> None:
+        path = self._cache_path(f"{self.digest}.json")
+        if path is not None:
+            self._store_cache_file(path, json.dumps(metrics, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _store_cache_file(path: Path, data: bytes) -> None:
+        """Publish a cache entry atomically; concurrent workers each write their own temporary file."""
+
+        temporary: Optional[Path] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+            ) as handle:
+                temporary = Path(handle.name)
+                handle.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            if temporary is not None:
+                temporary.unlink(missing_ok=True)
+
+    # -- text ------------------------------------------------------------
+
+    def scaled_advance(self, gid: int) -> int:
+        advance = self.advances[gid] if gid < len(self.advances) else 0
+        return round(advance * 1000 / self.units_per_em)
+
+    def encode_hex(self, text: str) -> str:
+        """Encode ``text`` as a hex string of glyph IDs, recording each glyph used."""
+
+        codes = []
+        for char in text:
+            gid = self.cmap.get(ord(char), 0)
+            if gid and gid not in self.used:
+                self.used[gid] = char
+            codes.append(f"{gid:04X}")
+        return "<" + "".join(codes) + ">"
+
+    # -- subsetting ------------------------------------------------------
+
+    def _glyph_ranges(self) -> List[Tuple[int, int]]:
+        head = self._table(b"head")
+        loca = self._table(b"loca")
+        assert head is not None and loca is not None
+        long_offsets = struct.unpack(">h", head[50:52])[0] == 1
+        if long_offsets:
+            offsets = struct.unpack(f">{len(loca) // 4}I", loca)
+        else:
+            offsets = [value * 2 for value in struct.unpack(f">{len(loca) // 2}H", loca)]
+        return [(offsets[index], offsets[index + 1]) for index in range(len(offsets) - 1)]
+
+    def _with_components(self, gids: Iterable[int]) -> List[int]:
+        glyf = self._table(b"glyf")
+        assert glyf is not None
+        ranges = self._glyph_ranges()
+        closed = set()
+        pending = [0, *gids]
+        while pending:
+            gid = pending.pop()
+            if gid in closed or gid >= len(ranges):
+                continue
+            closed.add(gid)
+            start, end = ranges[gid]
+            if end - start < 10 or struct.unpack(">h", glyf[start : start + 2])[0] >= 0:
+                continue
+            position = start + 10
+            while True:
+                flags, component = struct.unpack(">HH", glyf[position : position + 4])
+                pending.append(component)
+                position += 4 + (4 if flags & 0x0001 else 2)
+                if flags & 0x0008:
+                    position += 2
+                elif flags & 0x0040:
+                    position += 4
+                elif flags & 0x0080:
+                    position += 8
+                if not flags & 0x0020:
+                    break
+        return sorted(closed)
+
+    def subset_bytes(self, gids: Iterable[int]) -> bytes:
+        """Return a font program keeping only ``gids`` (and their components).
+
+        Glyph IDs are preserved, so the subset pairs with ``/CIDToGIDMap /Identity``;
+        unused glyphs simply have empty outlines.
+        """
+
+        requested = sorted(set(gids))
+        key = hashlib.sha256(f"{self.digest}:{','.join(map(str, requested))}".encode("ascii")).hexdigest()
+        cache_path = self._cache_path(f"{key}.ttf")
+        if cache_path is not None and cache_path.exists():
+            return cache_path.read_bytes()
+
+        glyf = self._table(b"glyf")
+        head = self._table(b"head")
+        if glyf is None or head is None:
+            raise ValueError(f"{self.path} has no glyf outlines to subset")
+        keep = set(self._with_components(requested))
+        new_glyf = bytearray()
+        offsets = []
+        for gid, (start, end) in enumerate(self._glyph_ranges()):
+            offsets.append(len(new_glyf))
+            if gid in keep and end > start:
+                new_glyf.extend(glyf[start:end])
+                new_glyf.extend(b"\0" * (-len(new_glyf) % 4))
+        offsets.append(len(new_glyf))
+
+        tables = {tag: self._table(tag) for tag in _SUBSET_TABLES if self._table(tag) is not None}
+        tables[b"glyf"] = bytes(new_glyf)
+        tables[b"loca"] = struct.pack(f">{len(offsets)}I", *offsets)
+        tables[b"head"] = head[:8] + b"\0\0\0\0" + head[12:50] + struct.pack(">h", 1) + head[52:]
+        subset = _build_sfnt(tables)
+
+        if cache_path is not None:
+            self._store_cache_file(cache_path, subset)
+        return subset
+
+    def _subset_tag(self, gids: Sequence[int]) -> str:
+        digest = hashlib.sha256(",".join(map(str, gids)).encode("ascii")).digest()
+        return "".join(chr(ord("A") + byte % 26) for byte in digest[:6])
+
+    def _widths_array(self, gids: Sequence[int]) -> str:
+        runs: List[str] = []
+        run_start: Optional[int] = None
+        run_widths: List[str] = []
+        previous = -2
+        for gid in gids:
+            if gid != previous + 1 and run_start is not None:
+                runs.append(f"{run_start} [{' '.join(run_widths)}]")
+                run_start = None
+            if run_start is None:
+                run_start = gid
+                run_widths = []
+            run_widths.append(str(self.scaled_advance(gid)))
+            previous = gid
+        if run_start is not None:
+            runs.append(f"{run_start} [{' '.join(run_widths)}]")
+        return "[" + " ".join(runs) + "]"
+
+    def _to_unicode_cmap(self) -> bytes:
+        entries = []
+        for gid in sorted(self.used):
+            encoded = self.used[gid].encode("utf-16-be").hex().upper()
+            entries.append(f"<{gid:04X}> <{encoded}>")
+        lines = [
+            "/CIDInit /ProcSet findresource begin",
+            "12 dict begin",
+            "begincmap",
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def",
+            "/CMapName /Adobe-Identity-UCS def",
+            "/CMapType 2 def",
+            "1 begincodespacerange",
+            "<0000> <FFFF>",
+            "endcodespacerange",
+        ]
+        for start in range(0, len(entries), 100):
+            chunk = entries[start : start + 100]
+            lines.append(f"{len(chunk)} beginbfchar")
+            lines.extend(chunk)
+            lines.append("endbfchar")
+        lines.extend(["endcmap", "CMapName currentdict /CMap defineresource pop", "end", "end"])
+        return "\n".join(lines).encode("ascii")
+
+    def write_objects(self, builder: "PDFBuilder", font_obj: int) -> None:
+        """Embed the subset for the glyphs used so far into ``font_obj`` and its dependants."""
+
+        gids = sorted({0, *self.used})
+        base_font = f"{self._subset_tag(gids)}+{self.postscript_name}"
+        subset = self.subset_bytes(gids)
+        font_file = builder.add_object(
+            make_binary_stream(f"/Length1 {len(subset)} /Filter /FlateDecode", zlib.compress(subset))
+        )
+        scale = 1000 / self.units_per_em
+        bbox = " ".join(str(round(value * scale)) for value in self.bbox)
+        flags = 32 | (64 if self.italic_angle else 0)
+        descriptor = builder.add_object(
+            (
+                f"<< /Type /FontDescriptor /FontName /{base_font} /Flags {flags} /FontBBox [{bbox}] "
+                f"/ItalicAngle {self.italic_angle:g} /Ascent {round(self.ascent * scale)} "
+                f"/Descent {round(self.descent * scale)} /CapHeight {round(self.cap_height * scale)} "
+                f"/StemV 80 /FontFile2 {font_file} 0 R >>\n"
+            ).encode("ascii")
+        )
+        descendant = builder.add_object(
+            (
+                f"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /{base_font} "
+                "/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> "
+                f"/FontDescriptor {descriptor} 0 R /DW {self.scaled_advance(0)} /W {self._widths_array(gids)} "
+                "/CIDToGIDMap /Identity >>\n"
+            ).encode("ascii")
+        )
+        cmap = self._to_unicode_cmap()
+        to_unicode = builder.add_object(make_binary_stream("/Filter /FlateDecode", zlib.compress(cmap)))
+        builder.set_object(
+            font_obj,
+            (
+                f"<< /Type /Font /Subtype /Type0 /BaseFont /{base_font} /Encoding /Identity-H "
+                f"/DescendantFonts [{descendant} 0 R] /ToUnicode {to_unicode} 0 R >>\n"
+            ).encode("ascii"),
+        )
+
+
+EMBEDDED_FONTS: dict = {}
+
+
+def register_truetype_font(resource: str, path: Path, *, cache_dir: Optional[Path] = FONT_CACHE_DIR) -> TrueTypeFont:
+    """Draw text set in ``resource`` (``F1``/``F2``/``F3``) with an embedded TrueType font."""
+
+    if resource not in STANDARD_FONTS:
+        raise ValueError(f"Unknown font resource: {resource}")
+    font = TrueTypeFont(path, cache_dir=cache_dir)
+    EMBEDDED_FONTS[resource] = font
+    KERNED_FONTS.pop(resource, None)
+    return font
+
+
+def reset_font_usage(baseline: Optional[dict] = None) -> None:
+    """Forget recorded glyphs, optionally keeping a :func:`font_usage` snapshot."""
+
+    for resource, font in EMBEDDED_FONTS.items():
+        font.used.clear()
+        if baseline is not None:
+            font.used.update(baseline.get(resource, {}))
+
+
+def font_usage() -> dict:
+    """Snapshot the glyphs recorded so far, so pre-rendered pages can be reused."""
+
+    return {resource: dict(font.used) for resource, font in EMBEDDED_FONTS.items()}
+
+
+def encode_text_operand(text: str, font: str) -> str:
+    """Return the string operand that shows ``text`` in ``font``."""
+
+    embedded = EMBEDDED_FONTS.get(font)
+    if embedded is not None:
+        return embedded.encode_hex(text)
+    return f"({escape_pdf_text(text)})"
+
+
+def write_font_objects(builder: "PDFBuilder", reserved: dict) -> None:
+    """Fill the reserved font objects once every page has been rendered."""
+
+    for resource, obj_id in reserved.items():
+        embedded = EMBEDDED_FONTS.get(resource)
+        if embedded is not None:
+            embedded.write_objects(builder, obj_id)
+        else:
+            font_dict = (
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{STANDARD_FONTS[resource]} /Encoding /WinAnsiEncoding >>\n"
+            )
+            builder.set_object(obj_id, font_dict.encode("ascii"))
+
+
+# --- Kerning --------------------------------------------------------------
+
+
+class FontMetrics:
+    """Adobe AFM advance widths and kern pairs for one standard font, in 1/1000 em.
+
+    Kern pairs are stored as a dict of arrays: each left character maps to the
+    string of right characters it kerns against and a parallel ``array`` of
+    adjustments, which keeps the table small and the lookup a single ``find``.
+    """
+
+    __slots__ = ("advances", "kerning", "fallback")
+
+    def __init__(self, widths: str, advances: Sequence[int], kerning: dict) -> None:
+        self.advances = dict(zip(widths, advances))
+        self.kerning = {left: (rights, array("h", values)) for left, (rights, values) in kerning.items()}
+        # Characters outside WinAnsiEncoding are shown as "?", so measure them that way.
+        self.fallback = self.advances["?"]
+
+    def kern(self, left: str, right: str) -> int:
+        entry = self.kerning.get(left)
+        if entry is None:
+            return 0
+        index = entry[0].find(right)
+        return entry[1][index] if index >= 0 else 0
+
+    def width(self, text: str) -> int:
+        advances = self.advances
+        fallback = self.fallback
+        kerning = self.kerning
+        total = 0
+        previous = ""
+        for char in text:
+            total += advances.get(char, fallback)
+            entry = kerning.get(previous)
+            if entry is not None:
+                index = entry[0].find(char)
+                if index >= 0:
+                    total += entry[1][index]
+            previous = char
+        return total
+
+    def show(self, text: str) -> str:
+        """Return a ``TJ`` operation that applies every kern pair in ``text``."""
+
+        kerning = self.kerning
+        parts: List[str] = []
+        start = 0
+        previous = ""
+        for position, char in enumerate(text):
+            entry = kerning.get(previous)
+            if entry is not None:
+                index = entry[0].find(char)
+                if index >= 0:
+                    parts.append(f"({escape_pdf_text(text[start:position])})")
+                    parts.append(str(-entry[1][index]))
+                    start = position
+            previous = char
+        if not parts:
+            return f"({escape_pdf_text(text)}) Tj"
+        parts.append(f"({escape_pdf_text(text[start:])})")
+        return f"[{' '.join(parts)}] TJ"
+
+
+_FONT_METRICS: dict = {}
+KERNED_FONTS: dict = {}
+
+
+def load_font_metrics(path: Path = HELVETICA_METRICS_PATH) -> dict:
+    """Load the standard font metrics once per process, keyed by base font name."""
+
+    metrics = _FONT_METRICS.get(path)
+    if metrics is None:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        metrics = {
+            name: FontMetrics(entry["widths"], entry["advances"], entry["kerning"])
+            for name, entry in data["fonts"].items()
+        }
+        _FONT_METRICS[path] = metrics
+    return metrics
+
+
+def enable_kerning(enabled: bool = True, *, path: Path = HELVETICA_METRICS_PATH) -> None:
+    """Kern the built-in Helvetica faces and wrap text with their real advances.
+
+    Embedded TrueType faces are left untouched; they keep the width estimate.
+    """
+
+    KERNED_FONTS.clear()
+    if not enabled:
+        return
+    metrics = load_font_metrics(path)
+    for resource, base_font in STANDARD_FONTS.items():
+        if resource not in EMBEDDED_FONTS:
+            KERNED_FONTS[resource] = metrics[base_font]
+
+
+def show_text(text: str, font: str) -> str:
+    """Return the complete text-showing operation for ``text`` in ``font``."""
+
+    metrics = KERNED_FONTS.get(font)
+    if metrics is not None:
+        return metrics.show(text)
+    return f"{encode_text_operand(text, font)} Tj"
+
+
 # --- Layout helpers -------------------------------------------------------
 
 DEEP_BLUE = "0 0.294 0.553"
@@ -121,8 +754,46 @@ def tidy_items(items: Sequence[str]) -> List[str]:
     return cleaned
 
 
+class _WinAnsiTable(dict):
+    """``str.translate`` table that records characters WinAnsiEncoding cannot show."""
+
+    def __missing__(self, code_point: int) -> str:
+        UNMAPPABLE_CHARACTERS.add(chr(code_point))
+        return "?"
+
+
+def _build_winansi_table() -> _WinAnsiTable:
+    table = _WinAnsiTable()
+    for byte in range(256):
+        try:
+            char = bytes([byte]).decode("cp1252")
+        except UnicodeDecodeError:
+            continue
+        if char in "\\()":
+            table[ord(char)] = "\\" + char
+        elif 0x20 <= byte < 0x7F:
+            table[ord(char)] = char
+        else:
+            table[ord(char)] = f"\\{byte:03o}"
+    return table
+
+
+# Maps each code point straight to its escaped WinAnsiEncoding byte (or octal escape).
+WINANSI_ESCAPES = _build_winansi_table()
+UNMAPPABLE_CHARACTERS: set = set()
+
+
 def escape_pdf_text(text: str) -> str:
-    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    """Encode ``text`` for a WinAnsi string operand in a single ``translate`` pass."""
+
+    return text.translate(WINANSI_ESCAPES)
+
+
+def report_unmappable_characters() -> None:
+    if UNMAPPABLE_CHARACTERS:
+        listed = " ".join(f"{char!r} (U+{ord(char):04X})" for char in sorted(UNMAPPABLE_CHARACTERS))
+        print(f"Warning: replaced characters outside WinAnsiEncoding with '?': {listed}", file=sys.stderr)
+        UNMAPPABLE_CHARACTERS.clear()
 
 
 def text_block(
@@ -141,11 +812,11 @@ def text_block(
     if leading is None:
         leading = size + 4
 
-    escaped = [escape_pdf_text(line) for line in lines_list]
-    commands = [f"{color} rg", "BT", f"/{font} {size} Tf", f"{x:.2f} {y:.2f} Td", f"({escaped[0]}) Tj"]
-    for line in escaped[1:]:
+    operations = [show_text(line, font) for line in lines_list]
+    commands = [f"{color} rg", "BT", f"/{font} {size} Tf", f"{x:.2f} {y:.2f} Td", operations[0]]
+    for operation in operations[1:]:
         commands.append(f"0 {-leading:.2f} Td")
-        commands.append(f"({line}) Tj")
+        commands.append(operation)
     commands.append("ET")
     return "\n".join(commands)
 
@@ -153,6 +824,18 @@ def text_block(
 CHAR_WIDTH_ESTIMATE = {"F1": 0.5, "F2": 0.52, "F3": 0.5}
 
 
+def text_width(text: str, *, font: str = "F1", size: float = 12) -> float:
+    """Advance width of ``text`` in points, matching the wrapping model.
+
+    Kerned fonts use their AFM metrics; everything else uses the per-character estimate.
+    """
+
+    metrics = KERNED_FONTS.get(font)
+    if metrics is not None:
+        return metrics.width(text) * size / 1000
+    return len(text) * size * CHAR_WIDTH_ESTIMATE.get(font, 0.5)
+
+
 def filled_rect(x: float, y: float, width: float, height: float, color: str) -> str:
     return "\n".join(
         [
@@ -174,6 +857,33 @@ def _estimate_text_height(line_count: int, size: float, leading: float) -> float
     return size * 1.2 + (line_count - 1) * leading
 
 
+class BlockMeasure(NamedTuple):
+    """Size of a block computed without emitting any content stream operators."""
+
+    line_count: int
+    height: float
+    bottom: float
+
+
+def measure_text_panel(
+    baseline_y: float,
+    lines: Sequence[str],
+    *,
+    size: float,
+    leading: Optional[float] = None,
+    padding_top: float = 14.0,
+    padding_bottom: float = 18.0,
+) -> BlockMeasure:
+    text_height = _estimate_text_height(len(lines), size, _resolved_leading(size, leading))
+    if text_height == 0:
+        return BlockMeasure(0, 0.0, baseline_y)
+    return BlockMeasure(
+        len(lines),
+        text_height + padding_top + padding_bottom,
+        baseline_y - text_height - padding_bottom,
+    )
+
+
 def text_panel_background(
     x: float,
     baseline_y: float,
@@ -186,87 +896,266 @@ def text_panel_background(
     padding_bottom: float = 18.0,
     fill_color: str = SOFT_BLUE,
 ) -> str:
-    resolved_leading = _resolved_leading(size, leading)
-    text_height = _estimate_text_height(len(lines), size, resolved_leading)
-    if text_height == 0:
+    measured = measure_text_panel(
+        baseline_y,
+        lines,
+        size=size,
+        leading=leading,
+        padding_top=padding_top,
+        padding_bottom=padding_bottom,
+    )
+    if measured.height == 0:
         return ""
-    bottom = baseline_y - text_height - padding_bottom
-    height = text_height + padding_top + padding_bottom
-    return filled_rect(x, bottom, width, height, fill_color)
+    return filled_rect(x, measured.bottom, width, measured.height, fill_color)
 
 
-def contact_card(
-    x: float,
+# Resolved text runs are (baseline_y, lines, font, size, color, leading).
+TextRun = Tuple[float, List[str], str, float, str, float]
+
+
+def _contact_card_layout(
     top: float,
     width: float,
     title: str,
     sections: Sequence[Tuple[str, str]],
     *,
-    fill_color: str = SOFT_BLUE,
-) -> Tuple[List[str], float]:
+    value_size: float = 11,
+    value_leading: float = 14,
+) -> Tuple[List[TextRun], float]:
     padding_side = 16.0
     padding_top = 20.0
     padding_bottom = 20.0
     section_gap = 10.0
-    commands: List[str] = []
+    runs: List[TextRun] = []
     text_width = width - 2 * padding_side
     y = top - padding_top
 
     title_lines = wrapped_lines([title], width=text_width, font="F2", size=13)
     if title_lines:
-        commands.append(
-            text_block(
-                x + padding_side,
-                y,
-                title_lines,
-                font="F2",
-                size=13,
-                color=DEEP_BLUE,
-                leading=16,
-            )
-        )
+        runs.append((y, title_lines, "F2", 13, DEEP_BLUE, 16))
         y -= _estimate_text_height(len(title_lines), 13, 16) + section_gap
 
     for label, value in sections:
         label_lines = [label]
-        commands.append(
-            text_block(
-                x + padding_side,
-                y,
-                label_lines,
-                font="F2",
-                size=11,
-                color=DEEP_BLUE,
-                leading=14,
-            )
-        )
+        runs.append((y, label_lines, "F2", 11, DEEP_BLUE, 14))
         y -= _estimate_text_height(len(label_lines), 11, 14) + 4
 
-        value_lines = wrapped_lines([value], width=text_width, font="F1", size=11)
+        value_lines = wrapped_lines([value], width=text_width, font="F1", size=value_size)
         if value_lines:
-            commands.append(
-                text_block(
-                    x + padding_side,
-                    y,
-                    value_lines,
-                    font="F1",
-                    size=11,
-                    color=BLACK,
-                    leading=14,
-                )
-            )
-            y -= _estimate_text_height(len(value_lines), 11, 14)
+            runs.append((y, value_lines, "F1", value_size, BLACK, value_leading))
+            y -= _estimate_text_height(len(value_lines), value_size, value_leading)
         y -= section_gap
 
     if sections:
         y += section_gap
 
-    bottom = y - padding_bottom
-    height = top - bottom
-    panel = filled_rect(x, bottom, width, height, fill_color)
+    return runs, y - padding_bottom
+
+
+def measure_contact_card(
+    top: float,
+    width: float,
+    title: str,
+    sections: Sequence[Tuple[str, str]],
+    *,
+    value_size: float = 11,
+    value_leading: float = 14,
+) -> BlockMeasure:
+    runs, bottom = _contact_card_layout(
+        top, width, title, sections, value_size=value_size, value_leading=value_leading
+    )
+    return BlockMeasure(sum(len(run[1]) for run in runs), top - bottom, bottom)
+
+
+def contact_card(
+    x: float,
+    top: float,
+    width: float,
+    title: str,
+    sections: Sequence[Tuple[str, str]],
+    *,
+    fill_color: str = SOFT_BLUE,
+    value_size: float = 11,
+    value_leading: float = 14,
+) -> Tuple[List[str], float]:
+    runs, bottom = _contact_card_layout(
+        top, width, title, sections, value_size=value_size, value_leading=value_leading
+    )
+    commands = [
+        text_block(x + 16.0, y, lines, font=font, size=size, color=color, leading=leading)
+        for y, lines, font, size, color, leading in runs
+    ]
+    panel = filled_rect(x, bottom, width, top - bottom, fill_color)
     return [panel, *commands], bottom
 
 
+def fit_font_size(
+    measure: Callable[[float], float],
+    max_height: float,
+    *,
+    minimum: float,
+    maximum: float,
+    step: float = 0.25,
+) -> float:
+    """Binary-search the largest font size whose measured height fits ``max_height``.
+
+    ``measure`` maps a candidate size to the height it would occupy (for example
+    ``lambda size: TextNode(lines, size=size).measure(width)``). Sizes are searched on a
+    ``step`` grid and ``minimum`` is returned when nothing fits.
+    """
+
+    steps = int((maximum - minimum) / step)
+    low, high = 0, steps
+    while low < high:
+        middle = (low + high + 1) // 2
+        if measure(minimum + middle * step) <= max_height:
+            low = middle
+        else:
+            high = middle - 1
+    return minimum + low * step
+
+
+def fit_leading(
+    measure: Callable[[float], float],
+    max_height: float,
+    *,
+    minimum: float,
+    preferred: float,
+    step: float = 0.25,
+) -> float:
+    """Binary-search the leading closest to ``preferred`` that fits ``max_height``.
+
+    Leading is only reduced as far as needed, so the result is the smallest
+    reduction from ``preferred`` (never lower than ``minimum``).
+    """
+
+    return fit_font_size(measure, max_height, minimum=minimum, maximum=preferred, step=step)
+
+
+WRAP_MODES = ("greedy", "optimal")
+
+
+def _line_metrics(
+    words: Sequence[str],
+    *,
+    initial_indent: str,
+    subsequent_indent: str,
+    metrics: Optional[FontMetrics],
+) -> Tuple[List[int], List[int], List[int]]:
+    """Return word widths, inter-word gaps and per-start indent widths.
+
+    Without ``metrics`` everything is counted in characters (the estimate model).
+    With ``metrics`` widths are in 1/1000 em and include every kern pair the
+    rendered line will apply, including those across spaces and after the indent.
+    """
+
+    if metrics is None:
+        widths = [len(word) for word in words]
+        gaps = [1] * len(words)
+        indents = [len(subsequent_indent)] * len(words)
+        if words:
+            indents[0] = len(initial_indent)
+        return widths, gaps, indents
+
+    space = metrics.width(" ")
+    widths = [metrics.width(word) for word in words]
+    gaps = [
+        space + metrics.kern(word[-1], " ") + metrics.kern(" ", following[0])
+        for word, following in zip(words, words[1:])
+    ] + [space]
+    indents = []
+    for index, word in enumerate(words):
+        indent = initial_indent if index == 0 else subsequent_indent
+        indents.append(metrics.width(indent) + metrics.kern(indent[-1], word[0]) if indent else 0)
+    return widths, gaps, indents
+
+
+def _greedy_line_breaks(
+    words: Sequence[str],
+    *,
+    limit: float,
+    initial_indent: str = "",
+    subsequent_indent: str = "",
+    metrics: Optional[FontMetrics] = None,
+) -> List[str]:
+    """First-fit line breaking on measured widths (``textwrap`` semantics)."""
+
+    widths, gaps, indents = _line_metrics(
+        words, initial_indent=initial_indent, subsequent_indent=subsequent_indent, metrics=metrics
+    )
+    lines: List[str] = []
+    start = 0
+    while start < len(words):
+        run = indents[start] + widths[start]
+        end = start + 1
+        while end < len(words) and run + gaps[end - 1] + widths[end] <= limit:
+            run += gaps[end - 1] + widths[end]
+            end += 1
+        indent = initial_indent if start == 0 else subsequent_indent
+        lines.append(indent + " ".join(words[start:end]))
+        start = end
+    return lines
+
+
+def _optimal_line_breaks(
+    words: Sequence[str],
+    *,
+    limit: float,
+    initial_indent: str = "",
+    subsequent_indent: str = "",
+    metrics: Optional[FontMetrics] = None,
+) -> List[str]:
+    """Break ``words`` into lines using a total-fit (Knuth–Plass style) search.
+
+    Every word boundary is a candidate breakpoint. The dynamic programme picks the
+    sequence of breaks that first minimises the number of lines and then the sum of
+    squared slack on every line but the last, so paragraphs never grow taller than
+    the greedy result while their right edge evens out. Predecessors are pruned as
+    soon as a line would overflow, which keeps the search near-linear in practice.
+    """
+
+    count = len(words)
+    if count == 0:
+        return []
+
+    widths, gaps, indents = _line_metrics(
+        words, initial_indent=initial_indent, subsequent_indent=subsequent_indent, metrics=metrics
+    )
+    best: List[Tuple[int, float]] = [(0, 0)] + [(count + 1, 0)] * count
+    previous = [0] * (count + 1)
+
+    for end in range(1, count + 1):
+        run = widths[end - 1]
+        for start in range(end - 1, -1, -1):
+            if start < end - 1:
+                run += widths[start] + gaps[start]
+            line_length = indents[start] + run
+            if line_length > limit and start < end - 1:
+                break
+            slack = max(limit - line_length, 0)
+            cost = 0 if end == count else slack * slack
+            lines_so_far, demerits = best[start]
+            candidate = (lines_so_far + 1, demerits + cost)
+            if candidate < best[end]:
+                best[end] = candidate
+                previous[end] = start
+
+    breaks: List[int] = []
+    end = count
+    while end > 0:
+        breaks.append(end)
+        end = previous[end]
+    breaks.reverse()
+
+    lines: List[str] = []
+    start = 0
+    for end in breaks:
+        indent = initial_indent if start == 0 else subsequent_indent
+        lines.append(indent + " ".join(words[start:end]))
+        start = end
+    return lines
+
+
 def _wrap_text(
     paragraphs: Sequence[str],
     *,
@@ -274,15 +1163,22 @@ def _wrap_text(
     font: str,
     size: float,
     bullet: Optional[str] = None,
+    mode: str = "greedy",
 ) -> List[str]:
+    if mode not in WRAP_MODES:
+        raise ValueError(f"Unsupported wrap mode: {mode}")
+    metrics = KERNED_FONTS.get(font)
     char_width = CHAR_WIDTH_ESTIMATE.get(font, 0.5)
     max_chars = max(int(width / (size * char_width)), 1)
+    # Kerned fonts break on their real advances (1/1000 em); others count characters.
+    limit = width * 1000 / size if metrics is not None else max_chars
     lines: List[str] = []
+    subsequent_indent = "    " if bullet else ""
     wrapper = textwrap.TextWrapper(
         width=max_chars,
         break_long_words=False,
         break_on_hyphens=False,
-        subsequent_indent="    " if bullet else "",
+        subsequent_indent=subsequent_indent,
     )
 
     for paragraph in paragraphs:
@@ -293,7 +1189,24 @@ def _wrap_text(
             wrapper.initial_indent = f"{bullet} "
         else:
             wrapper.initial_indent = ""
-        wrapped = wrapper.wrap(paragraph)
+        if mode == "optimal":
+            wrapped = _optimal_line_breaks(
+                paragraph.split(),
+                limit=limit,
+                initial_indent=wrapper.initial_indent,
+                subsequent_indent=subsequent_indent,
+                metrics=metrics,
+            )
+        elif metrics is not None:
+            wrapped = _greedy_line_breaks(
+                paragraph.split(),
+                limit=limit,
+                initial_indent=wrapper.initial_indent,
+                subsequent_indent=subsequent_indent,
+                metrics=metrics,
+            )
+        else:
+            wrapped = wrapper.wrap(paragraph)
         if not wrapped:
             lines.append(wrapper.initial_indent.rstrip())
         else:
@@ -307,8 +1220,9 @@ def wrapped_lines(
     width: float,
     font: str = "F1",
     size: float = 12,
+    mode: str = "greedy",
 ) -> List[str]:
-    return _wrap_text(paragraphs, width=width, font=font, size=size)
+    return _wrap_text(paragraphs, width=width, font=font, size=size, mode=mode)
 
 
 def wrapped_bullets(
@@ -318,8 +1232,9 @@ def wrapped_bullets(
     font: str = "F1",
     size: float = 12,
     bullet: str = "•",
+    mode: str = "greedy",
 ) -> List[str]:
-    return _wrap_text(items, width=width, font=font, size=size, bullet=bullet)
+    return _wrap_text(items, width=width, font=font, size=size, bullet=bullet, mode=mode)
 
 
 def wrapped_text_block(
@@ -332,8 +1247,9 @@ def wrapped_text_block(
     size: float = 12,
     color: str = BLACK,
     leading: Optional[float] = None,
+    mode: str = "greedy",
 ) -> str:
-    lines = wrapped_lines(paragraphs, width=width, font=font, size=size)
+    lines = wrapped_lines(paragraphs, width=width, font=font, size=size, mode=mode)
     return text_block(x, y, lines, font=font, size=size, color=color, leading=leading)
 
 
@@ -348,8 +1264,9 @@ def wrapped_bullet_block(
     color: str = BLACK,
     leading: Optional[float] = None,
     bullet: str = "•",
+    mode: str = "greedy",
 ) -> str:
-    lines = wrapped_bullets(items, width=width, font=font, size=size, bullet=bullet)
+    lines = wrapped_bullets(items, width=width, font=font, size=size, bullet=bullet, mode=mode)
     return text_block(x, y, lines, font=font, size=size, color=color, leading=leading)
 
 
@@ -364,8 +1281,9 @@ def measured_bullet_block(
     color: str = BLACK,
     leading: Optional[float] = None,
     bullet: str = "•",
+    mode: str = "greedy",
 ) -> Tuple[str, float]:
-    lines = wrapped_bullets(items, width=width, font=font, size=size, bullet=bullet)
+    lines = wrapped_bullets(items, width=width, font=font, size=size, bullet=bullet, mode=mode)
     if not lines:
         return "", y
     if leading is None:
@@ -374,86 +1292,104 @@ def measured_bullet_block(
     return text_block(x, y, lines, font=font, size=size, color=color, leading=leading), lowest_y
 
 
-def stacked_panel(
-    x: float,
+def _stacked_panel_layout(
     top: float,
-    width: float,
     sections: Sequence[dict],
     *,
-    fill_color: str = SOFT_BLUE,
-    padding_side: float = 18.0,
-    padding_top: float = 20.0,
-    padding_bottom: float = 24.0,
-    default_gap: float = 16.0,
-) -> Tuple[List[str], float]:
-    """Render a vertical stack of text sections within a filled background panel."""
+    padding_top: float,
+    default_gap: float,
+) -> Tuple[List[Tuple[dict, float]], float]:
+    """Resolve the baseline of every non-empty section and the lowest point of the text."""
 
     y = top - padding_top
-    text_commands: List[str] = []
-    content_present = False
+    placed: List[Tuple[dict, float]] = []
 
     for section in sections:
         lines = section.get("lines")
         if not lines:
             continue
-        if content_present:
+        if placed:
             y -= section.get("gap_before", default_gap)
-
-        font = section.get("font", "F1")
+        placed.append((section, y))
         size = section.get("size", 12.0)
-        color = section.get("color", BLACK)
-        leading = section.get("leading")
-        x_offset = section.get("x_offset", padding_side)
+        y -= _estimate_text_height(len(lines), size, _resolved_leading(size, section.get("leading")))
 
-        text_commands.append(
-            text_block(
-                x + x_offset,
-                y,
-                lines,
-                font=font,
-                size=size,
-                color=color,
-                leading=leading,
-            )
-        )
+    return placed, y
 
-        section_height = _estimate_text_height(len(lines), size, _resolved_leading(size, leading))
-        y -= section_height
-        content_present = True
 
-    if not content_present:
+def measure_stacked_panel(
+    top: float,
+    sections: Sequence[dict],
+    *,
+    padding_top: float = 20.0,
+    padding_bottom: float = 24.0,
+    default_gap: float = 16.0,
+) -> BlockMeasure:
+    placed, y = _stacked_panel_layout(top, sections, padding_top=padding_top, default_gap=default_gap)
+    if not placed:
+        return BlockMeasure(0, 0.0, top)
+    bottom = y - padding_bottom
+    return BlockMeasure(sum(len(section["lines"]) for section, _ in placed), top - bottom, bottom)
+
+
+def stacked_panel(
+    x: float,
+    top: float,
+    width: float,
+    sections: Sequence[dict],
+    *,
+    fill_color: str = SOFT_BLUE,
+    padding_side: float = 18.0,
+    padding_top: float = 20.0,
+    padding_bottom: float = 24.0,
+    default_gap: float = 16.0,
+) -> Tuple[List[str], float]:
+    """Render a vertical stack of text sections within a filled background panel."""
+
+    placed, y = _stacked_panel_layout(top, sections, padding_top=padding_top, default_gap=default_gap)
+    if not placed:
         return [], top
 
+    text_commands = [
+        text_block(
+            x + section.get("x_offset", padding_side),
+            baseline,
+            section["lines"],
+            font=section.get("font", "F1"),
+            size=section.get("size", 12.0),
+            color=section.get("color", BLACK),
+            leading=section.get("leading"),
+        )
+        for section, baseline in placed
+    ]
+
     bottom = y - padding_bottom
     panel_height = top - bottom
     background = filled_rect(x, bottom, width, panel_height, fill_color)
     return [background, *text_commands], bottom
 
 
-def pricing_card(
-    x: float,
-    top: float,
+PRICING_CARD_PADDING = {"padding_side": 16.0, "padding_top": 40.0, "padding_bottom": 28.0, "default_gap": 18.0}
+AREA_CARD_PADDING = {"padding_side": 12.0, "padding_top": 28.0, "padding_bottom": 24.0, "default_gap": 14.0}
+
+
+def _pricing_card_sections(
     width: float,
     title: str,
     price: str,
     bullets: Sequence[str],
     *,
-    fill_color: str = PALE_BLUE,
-    accent_color: str = GOLD,
-) -> Tuple[List[str], float]:
-    padding_side = 16.0
-    padding_top = 40.0
-    padding_bottom = 28.0
-    accent_height = 8.0
-    accent_offset = 18.0
-    section_gap = 18.0
-
-    inner_width = width - 2 * padding_side
+    price_note: Optional[str] = "VAT-free",
+    bullet_size: float = 11,
+    bullet_leading: float = 14,
+) -> List[dict]:
+    section_gap = PRICING_CARD_PADDING["default_gap"]
+    inner_width = width - 2 * PRICING_CARD_PADDING["padding_side"]
     title_lines = wrapped_lines([title], width=inner_width, font="F2", size=16)
-    price_lines = wrapped_lines([price, "VAT-free"], width=inner_width, font="F1", size=12)
-    bullet_lines = wrapped_bullets(tidy_items(bullets), width=inner_width, font="F1", size=11, bullet="•")
+    price_lines = wrapped_lines([price, price_note] if price_note else [price], width=inner_width, font="F1", size=12)
+    bullet_lines = wrapped_bullets(tidy_items(bullets), width=inner_width, font="F1", size=bullet_size, bullet="•")
 
-    sections = [
+    return [
         {
             "lines": title_lines,
             "font": "F2",
@@ -472,88 +1408,69 @@ def pricing_card(
         {
             "lines": bullet_lines,
             "font": "F1",
-            "size": 11,
+            "size": bullet_size,
             "color": BLACK,
-            "leading": 14,
+            "leading": bullet_leading,
             "gap_before": section_gap,
         },
     ]
 
-    panel_commands, bottom = stacked_panel(
-        x,
+
+def measure_pricing_card(
+    top: float,
+    width: float,
+    title: str,
+    price: str,
+    bullets: Sequence[str],
+    *,
+    price_note: Optional[str] = "VAT-free",
+    bullet_size: float = 11,
+    bullet_leading: float = 14,
+) -> BlockMeasure:
+    sections = _pricing_card_sections(
+        width, title, price, bullets, price_note=price_note, bullet_size=bullet_size, bullet_leading=bullet_leading
+    )
+    return measure_stacked_panel(
         top,
-        width,
         sections,
-        fill_color=fill_color,
-        padding_side=padding_side,
-        padding_top=padding_top,
-        padding_bottom=padding_bottom,
-        default_gap=section_gap,
+        padding_top=PRICING_CARD_PADDING["padding_top"],
+        padding_bottom=PRICING_CARD_PADDING["padding_bottom"],
+        default_gap=PRICING_CARD_PADDING["default_gap"],
     )
 
-    if not panel_commands:
-        return [], top
-
-    accent_y = top - accent_offset
-    accent = filled_rect(x, accent_y, width, accent_height, accent_color)
-    background, *text_blocks = panel_commands
-    return [background, accent, *text_blocks], bottom
 
-
-def area_card(
+def pricing_card(
     x: float,
     top: float,
     width: float,
     title: str,
-    description: Sequence[str],
-    *,
-    fill_color: str = SOFT_BLUE,
+    price: str,
+    bullets: Sequence[str],
+    *,
+    fill_color: str = PALE_BLUE,
     accent_color: str = GOLD,
+    price_note: Optional[str] = "VAT-free",
+    bullet_size: float = 11,
+    bullet_leading: float = 14,
 ) -> Tuple[List[str], float]:
-    padding_side = 12.0
-    padding_top = 28.0
-    padding_bottom = 24.0
-    section_gap = 14.0
-    inner_width = width - 2 * padding_side
-
-    title_lines = wrapped_lines([title], width=inner_width, font="F2", size=16)
-    description_lines = wrapped_lines(tidy_paragraphs(description), width=inner_width, font="F1", size=11)
-
-    sections = [
-        {
-            "lines": title_lines,
-            "font": "F2",
-            "size": 16,
-            "color": DEEP_BLUE,
-            "leading": 18,
-        },
-        {
-            "lines": description_lines,
-            "font": "F1",
-            "size": 11,
-            "color": BLACK,
-            "leading": 16,
-            "gap_before": section_gap,
-        },
-    ]
+    accent_height = 8.0
+    accent_offset = 18.0
 
+    sections = _pricing_card_sections(
+        width, title, price, bullets, price_note=price_note, bullet_size=bullet_size, bullet_leading=bullet_leading
+    )
     panel_commands, bottom = stacked_panel(
         x,
         top,
         width,
         sections,
         fill_color=fill_color,
-        padding_side=padding_side,
-        padding_top=padding_top,
-        padding_bottom=padding_bottom,
-        default_gap=section_gap,
+        **PRICING_CARD_PADDING,
     )
 
     if not panel_commands:
         return [], top
 
-    accent_height = 8.0
-    accent_offset = 18.0
     accent_y = top - accent_offset
     accent = filled_rect(x, accent_y, width, accent_height, accent_color)
     background, *text_blocks = panel_commands
@@ -655,18 +1572,23 @@ def _defilter_png(data: bytes, width: int, height: int, bytes_per_pixel: int) ->
                 result_row[i] = (row_data[i] + paeth) & 0xFF
         else:
             raise ValueError(f"Unsupported PNG filter: {filter_type}")
+        # Slicing a bytearray copies it, so the decoded row has to be written back.
+        output[row * stride : (row + 1) * stride] = result_row
         prev_row[:] = result_row
     return bytes(output)
 
 
-def _load_logo_image() -> tuple[int, int, bytes, Optional[bytes]]:
-    png_path = Path(__file__).resolve().parent.parent / "public" / "aktonz-logo-modern-transparent.png"
-    if png_path.exists():
-        data = png_path.read_bytes()
-    else:
-        data = base64.b64decode(LOGO_PNG_BASE64)
-    if not data.startswith(b"\x89PNG\r\n\x1a\n"):
+def _logo_png_data() -> mmap.mmap:
+    """The embedded logo PNG, memory-mapped; local copies under ``public/`` never change the output."""
+
+    data = logo_asset.logo_png()
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
         raise ValueError("Logo file is not a PNG")
+    return data
+
+
+def _load_logo_image() -> tuple[int, int, bytes, Optional[bytes]]:
+    data = _logo_png_data()
 
     offset = 8
     width = height = None
@@ -735,12 +1657,76 @@ def _load_logo_image() -> tuple[int, int, bytes, Optional[bytes]]:
     return width, height, rgb_stream, alpha_stream
 
 
-LOGO_WIDTH_PX, LOGO_HEIGHT_PX, LOGO_RGB_STREAM, LOGO_ALPHA_STREAM = _load_logo_image()
+class LogoImage(NamedTuple):
+    width: int
+    height: int
+    rgb_stream: bytes
+    alpha_stream: Optional[bytes]
+
+
+_LOGO_IMAGE: list = []
+_LOGO_SIZE: list = []
+# Names that used to be module constants, now resolved on first access (see ``__getattr__``).
+_LOGO_IMAGE_ATTRIBUTES = {
+    "LOGO_WIDTH_PX": "width",
+    "LOGO_HEIGHT_PX": "height",
+    "LOGO_RGB_STREAM": "rgb_stream",
+    "LOGO_ALPHA_STREAM": "alpha_stream",
+}
+_LOGO_STATE = {"vector": False}
+
+
+def logo_image() -> LogoImage:
+    """The decoded logo PNG, loaded on first use rather than at import."""
+
+    if not _LOGO_IMAGE:
+        _LOGO_IMAGE.append(LogoImage(*_load_logo_image()))
+    return _LOGO_IMAGE[0]
+
+
+def logo_size() -> Tuple[int, int]:
+    """Pixel size of the logo PNG, read from its header without decoding the image."""
+
+    if not _LOGO_SIZE:
+        if _LOGO_IMAGE:
+            _LOGO_SIZE.append((_LOGO_IMAGE[0].width, _LOGO_IMAGE[0].height))
+        else:
+            _LOGO_SIZE.append(struct.unpack(">II", _logo_png_data()[16:24]))
+    return _LOGO_SIZE[0]
+
+
+def __getattr__(name: str):
+    field = _LOGO_IMAGE_ATTRIBUTES.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(logo_image(), field)
+
+
+def use_vector_logo(enabled: bool = True) -> None:
+    """Draw the logo as the generated vector wordmark instead of the PNG.
+
+    The wordmark from ``generate_aktonz_logo`` becomes a Form XObject of filled
+    paths, so the PNG is never decoded. It is centred in the box the PNG would
+    occupy, so layouts do not move.
+    """
+
+    _LOGO_STATE["vector"] = enabled
+    _LOGO_OBJECTS.clear()
+
+
+def logo_resource() -> str:
+    return "Fm1" if _LOGO_STATE["vector"] else "Im1"
 
 
 def draw_logo(x: float, y: float, width: float) -> str:
-    scale = width / LOGO_WIDTH_PX
-    height = LOGO_HEIGHT_PX * scale
+    pixel_width, pixel_height = logo_size()
+    scale = width / pixel_width
+    height = pixel_height * scale
+    if _LOGO_STATE["vector"]:
+        form_scale = min(width / generate_aktonz_logo.WIDTH, height / generate_aktonz_logo.HEIGHT)
+        x += (width - generate_aktonz_logo.WIDTH * form_scale) / 2
+        y += (height - generate_aktonz_logo.HEIGHT * form_scale) / 2
+        return "\n".join(["q", f"{form_scale:.4f} 0 0 {form_scale:.4f} {x:.2f} {y:.2f} cm", "/Fm1 Do", "Q"])
     return "\n".join(
         [
             "q",
@@ -751,349 +1737,1400 @@ def draw_logo(x: float, y: float, width: float) -> str:
     )
 
 
-# --- Brochure content -----------------------------------------------------
+# --- Layout tree ----------------------------------------------------------
 
 
-def build_brochure(output_path: Path) -> bytes:
-    builder = PDFBuilder()
+class LayoutNode:
+    """Base class for declarative layout nodes.
 
-    regular_font_obj = builder.add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\n")
-    bold_font_obj = builder.add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>\n")
-    italic_font_obj = builder.add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Oblique >>\n")
+    Layout happens in two passes: :meth:`measure` resolves heights (wrapping text
+    as needed) and :meth:`render` serialises the measured tree into content
+    stream commands. Measurements are cached per width and reused until
+    :meth:`update` marks the node and its ancestors dirty, so regenerating a page
+    after a copy change only re-wraps the nodes that actually changed.
+    """
 
-    logo_smask_obj: Optional[int] = None
-    if LOGO_ALPHA_STREAM is not None:
-        smask_dict = (
-            f"/Type /XObject /Subtype /Image /Width {LOGO_WIDTH_PX} /Height {LOGO_HEIGHT_PX} "
-            "/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode "
-            f"/DecodeParms << /Predictor 15 /Colors 1 /BitsPerComponent 8 /Columns {LOGO_WIDTH_PX} >>"
-        )
-        logo_smask_obj = builder.add_object(make_binary_stream(smask_dict, LOGO_ALPHA_STREAM))
+    __slots__ = ("parent", "gap_before", "keep_with_next", "_dirty", "_measured_width", "_measured_height")
 
-    logo_dict = (
-        f"/Type /XObject /Subtype /Image /Width {LOGO_WIDTH_PX} /Height {LOGO_HEIGHT_PX} "
-        "/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode "
-        f"/DecodeParms << /Predictor 15 /Colors 3 /BitsPerComponent 8 /Columns {LOGO_WIDTH_PX} >>"
-    )
-    if logo_smask_obj is not None:
-        logo_dict += f" /SMask {logo_smask_obj} 0 R"
-    logo_image_obj = builder.add_object(make_binary_stream(logo_dict, LOGO_RGB_STREAM))
+    def __init__(self, *, gap_before: Optional[float] = None, keep_with_next: bool = False) -> None:
+        self.parent: Optional[LayoutNode] = None
+        self.gap_before = gap_before
+        self.keep_with_next = keep_with_next
+        self._dirty = True
+        self._measured_width: Optional[float] = None
+        self._measured_height = 0.0
 
-    resource_dict = (
-        f"<< /Font << /F1 {regular_font_obj} 0 R /F2 {bold_font_obj} 0 R /F3 {italic_font_obj} 0 R >> "
-        f"/XObject << /Im1 {logo_image_obj} 0 R >> >>"
-    )
+    def mark_dirty(self) -> None:
+        node: Optional[LayoutNode] = self
+        while node is not None:
+            node._dirty = True
+            node = node.parent
 
-    media_box = "[0 0 595 842]"
-    pages_obj = builder.reserve_object()
+    def update(self, **changes: object) -> "LayoutNode":
+        for name, value in changes.items():
+            if name.startswith("_") or name == "parent":
+                raise AttributeError(f"Cannot update layout attribute {name!r}")
+            setattr(self, name, value)
+        self.mark_dirty()
+        return self
 
-    page_contents: List[str] = []
+    def measure(self, width: float) -> float:
+        if self._dirty or self._measured_width != width:
+            self._measured_height = self._measure(width)
+            self._measured_width = width
+            self._dirty = False
+        return self._measured_height
 
-    # Page 1 - Cover
-    cover_commands: List[str] = [
-        f"{DEEP_BLUE} rg",
-        "0 0 595 842 re",
-        "f",
-        f"{SOFT_BLUE} rg",
-        "0 0 595 260 re",
-        "f",
-        f"{GOLD} rg",
-        "0 260 595 10 re",
-        "f",
-        draw_logo(187.5, 590, 220),
-        text_block(
-            120,
-            520,
-            [
-                "Premium Lettings & Management",
-                "Modern service. Local expertise. Trusted results.",
-            ],
-            font="F2",
-            size=26,
-            color=WHITE,
-            leading=30,
-        ),
-        wrapped_text_block(
-            120,
-            454,
-            [
-                "Move smarter with Aktonz as your London lettings partner.",
-                "Data-led marketing, curated tenant journeys, and proactive asset care for confident landlords.",
-            ],
-            width=360,
-            font="F1",
-            size=14,
-            color=WHITE,
-            leading=20,
-        ),
-        f"{WHITE} rg",
-        "70 90 455 140 re",
-        "f",
-        f"{GOLD} rg",
-        "70 220 455 4 re",
-        "f",
-        wrapped_text_block(
-            90,
-            210,
-            [
-                "Aktonz delivers concierge-level lettings with a technology core so every landlord enjoys real-time clarity and strategic advice.",
-                "From Canary Wharf penthouses to Hackney townhouses, our team brings local intelligence, rigorous compliance and polished marketing that commands premium tenancies in record time.",
-                "",
-                "99% landlord retention | 14-day average time-to-let | 8.7% rental uplift vs. local averages",
-            ],
-            width=410,
-            font="F1",
-            size=12,
-            color=DEEP_BLUE,
-            leading=16,
-        ),
-    ]
-    page_contents.append("\n".join(cover_commands))
+    def render(self, x: float, top: float, width: float) -> List[str]:
+        self.measure(width)
+        return self._render(x, top, width)
 
-    # Page 2 - Company introduction
-    page2_commands: List[str] = [
-        page_background(),
-        header("Aktonz Lettings", "Modern letting agents with London roots"),
-    ]
+    def split(self, available: float, width: float) -> Optional[Tuple["LayoutNode", "LayoutNode"]]:
+        """Split into a head fitting ``available`` points and a tail, or ``None`` to keep together."""
 
-    intro_padding = 22.0
-    intro_lines = wrapped_lines(
-        tidy_paragraphs(
-            [
-                """
-                Aktonz is a London-based lettings and property management agency built to give landlords total confidence.
-                Our neighbourhood experts combine hyper-local insight with a digital portal that keeps instructions
-                transparent and responsive every step of the tenancy lifecycle.
-                """,
-                "",
-                """
-                We operate across the capital with teams dedicated to East London hubs including Hackney, Shoreditch and
-                Canary Wharf while supporting landlords with single homes or multi-unit portfolios citywide.
-                """,
-            ]
-        ),
-        width=455 - 2 * intro_padding,
-        font="F1",
-        size=12,
-    )
-    intro_panel, intro_bottom = stacked_panel(
-        70,
-        780,
-        455,
-        [
-            {
-                "lines": intro_lines,
-                "font": "F1",
-                "size": 12,
-                "color": BLACK,
-                "leading": 18,
-            }
-        ],
-        fill_color=SOFT_BLUE,
-        padding_side=intro_padding,
-        padding_top=28.0,
-        padding_bottom=32.0,
-        default_gap=20.0,
+        return None
+
+    def min_height(self, width: float) -> float:
+        """Smallest slice of this node that may start at the bottom of a frame."""
+
+        return self.measure(width)
+
+    def _measure(self, width: float) -> float:
+        raise NotImplementedError
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        raise NotImplementedError
+
+
+class TextNode(LayoutNode):
+    """Wrapped paragraphs (or bullets) whose first baseline sits at ``top``.
+
+    ``prewrapped`` nodes treat ``paragraphs`` as final lines; the flow engine uses
+    them for the halves of a paragraph split across frames.
+    """
+
+    __slots__ = (
+        "paragraphs",
+        "font",
+        "size",
+        "color",
+        "leading",
+        "bullet",
+        "mode",
+        "wrap_width",
+        "keep_together",
+        "prewrapped",
+        "lines",
     )
-    page2_commands.extend(intro_panel)
 
-    highlights_title_y = intro_bottom - 34
-    page2_commands.append(
-        text_block(
-            90,
-            highlights_title_y,
-            ["Why landlords choose Aktonz"],
-            font="F2",
-            size=16,
-            color=DEEP_BLUE,
-            leading=20,
+    def __init__(
+        self,
+        paragraphs: Sequence[str],
+        *,
+        font: str = "F1",
+        size: float = 12,
+        color: str = BLACK,
+        leading: Optional[float] = None,
+        bullet: Optional[str] = None,
+        mode: str = "greedy",
+        wrap_width: Optional[float] = None,
+        keep_together: bool = False,
+        prewrapped: bool = False,
+        gap_before: Optional[float] = None,
+        keep_with_next: bool = False,
+    ) -> None:
+        super().__init__(gap_before=gap_before, keep_with_next=keep_with_next)
+        self.paragraphs = list(paragraphs)
+        self.font = font
+        self.size = size
+        self.color = color
+        self.leading = leading
+        self.bullet = bullet
+        self.mode = mode
+        self.wrap_width = wrap_width
+        self.keep_together = keep_together
+        self.prewrapped = prewrapped
+        self.lines: List[str] = []
+
+    def _measure(self, width: float) -> float:
+        if self.prewrapped:
+            self.lines = list(self.paragraphs)
+        else:
+            self.lines = _wrap_text(
+                self.paragraphs,
+                width=self.wrap_width if self.wrap_width is not None else width,
+                font=self.font,
+                size=self.size,
+                bullet=self.bullet,
+                mode=self.mode,
+            )
+        return self._lines_height(len(self.lines))
+
+    def _lines_height(self, line_count: int) -> float:
+        return _estimate_text_height(line_count, self.size, _resolved_leading(self.size, self.leading))
+
+    def _with_lines(self, lines: Sequence[str]) -> "TextNode":
+        return TextNode(
+            lines,
+            font=self.font,
+            size=self.size,
+            color=self.color,
+            leading=self.leading,
+            prewrapped=True,
         )
-    )
 
-    bullet_block, bullet_lowest = measured_bullet_block(
-        90,
-        highlights_title_y - 26,
-        tidy_items(
-            [
-                "Local London experts advising on pricing, positioning and legislation per neighbourhood.",
-                "Modern marketing with cinematic photography, video walk-throughs and relocation networks for reach.",
-                "24/7 portal providing viewing feedback, offers, payments and compliance tracking in real time.",
-                "Transparent fixed fees with no VAT, saving around 20% compared with traditional agency models.",
-            ]
-        ),
-        width=330,
-        font="F1",
-        size=11,
-        color=BLACK,
-        leading=16,
-    )
-    if bullet_block:
-        page2_commands.append(bullet_block)
+    def min_height(self, width: float) -> float:
+        self.measure(width)
+        if self.keep_together:
+            return self._measured_height
+        return self._lines_height(min(len(self.lines), FLOW_MIN_LINES))
+
+    def split(self, available: float, width: float) -> Optional[Tuple["LayoutNode", "LayoutNode"]]:
+        self.measure(width)
+        total = len(self.lines)
+        if self.keep_together or total < 2:
+            return None
+        leading = _resolved_leading(self.size, self.leading)
+        first_line = self._lines_height(1)
+        if available < first_line:
+            return None
+        fitting = min(total - 1, 1 + int((available - first_line) // leading))
+        # Avoid orphans at the foot of a frame and widows at the head of the next one.
+        if total - fitting < FLOW_MIN_LINES:
+            fitting = total - FLOW_MIN_LINES
+        if fitting < FLOW_MIN_LINES:
+            return None
+        head = self._with_lines(self.lines[:fitting])
+        head.gap_before = self.gap_before
+        tail = self._with_lines(self.lines[fitting:])
+        tail.keep_with_next = self.keep_with_next
+        return head, tail
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        if not self.lines:
+            return []
+        return [
+            text_block(x, top, self.lines, font=self.font, size=self.size, color=self.color, leading=self.leading)
+        ]
 
-    page2_commands.append(filled_rect(340, 320, 185, 130, GOLD))
-    page2_commands.append(
-        text_block(
-            355,
-            430,
-            [
-                "Trust that converts",
-                "72% of consumers trust",
-                "businesses with clear value",
-                "proof and testimonials. Aktonz",
-                "leads with measurable results",
-                "to secure instructions swiftly.",
-            ],
-            font="F2",
-            size=12,
-            color=WHITE,
-            leading=16,
+
+class RectNode(LayoutNode):
+    """Solid block of colour; spans the available width unless ``width`` is set."""
+
+    __slots__ = ("height", "color", "width")
+
+    def __init__(
+        self,
+        height: float,
+        color: str,
+        *,
+        width: Optional[float] = None,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        super().__init__(gap_before=gap_before)
+        self.height = height
+        self.color = color
+        self.width = width
+
+    def _measure(self, width: float) -> float:
+        return self.height
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        resolved_width = self.width if self.width is not None else width
+        return [filled_rect(x, top - self.height, resolved_width, self.height, self.color)]
+
+
+class ImageNode(LayoutNode):
+    """Image scaled to ``width`` while keeping its aspect ratio; without ``resource`` it draws the logo."""
+
+    __slots__ = ("width", "resource", "pixel_width", "pixel_height")
+
+    def __init__(
+        self,
+        width: float,
+        *,
+        resource: Optional[str] = None,
+        pixel_width: Optional[int] = None,
+        pixel_height: Optional[int] = None,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        super().__init__(gap_before=gap_before)
+        self.width = width
+        self.resource = resource
+        self.pixel_width = pixel_width
+        self.pixel_height = pixel_height
+
+    def _measure(self, width: float) -> float:
+        if self.pixel_width is None or self.pixel_height is None:
+            self.pixel_width, self.pixel_height = logo_size()
+        return self.pixel_height * self.width / self.pixel_width
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        height = self._measured_height
+        if self.resource is None:
+            return [draw_logo(x, top - height, self.width)]
+        return [
+            "\n".join(
+                [
+                    "q",
+                    f"{self.width:.2f} 0 0 {height:.2f} {x:.2f} {top - height:.2f} cm",
+                    f"/{self.resource} Do",
+                    "Q",
+                ]
+            )
+        ]
+
+
+class ColumnNode(LayoutNode):
+    """Vertical stack; empty children are skipped and gaps only sit between content."""
+
+    __slots__ = ("children", "default_gap")
+
+    def __init__(
+        self,
+        children: Iterable[LayoutNode] = (),
+        *,
+        default_gap: float = 0.0,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        super().__init__(gap_before=gap_before)
+        self.default_gap = default_gap
+        self.children: List[LayoutNode] = []
+        for child in children:
+            self.append(child)
+
+    def append(self, child: LayoutNode) -> LayoutNode:
+        child.parent = self
+        self.children.append(child)
+        self.mark_dirty()
+        return child
+
+    def _gap(self, child: LayoutNode) -> float:
+        return child.gap_before if child.gap_before is not None else self.default_gap
+
+    def _measure(self, width: float) -> float:
+        height = 0.0
+        content_present = False
+        for child in self.children:
+            child_height = child.measure(width)
+            if child_height <= 0:
+                continue
+            if content_present:
+                height += self._gap(child)
+            height += child_height
+            content_present = True
+        return height
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        commands: List[str] = []
+        y = top
+        content_present = False
+        for child in self.children:
+            child_height = child.measure(width)
+            if child_height <= 0:
+                continue
+            if content_present:
+                y -= self._gap(child)
+            commands.extend(child.render(x, y, width))
+            y -= child_height
+            content_present = True
+        return commands
+
+
+class PanelNode(ColumnNode):
+    """Filled panel around a column of children, generalising :func:`stacked_panel`."""
+
+    __slots__ = ("fill_color", "padding_side", "padding_top", "padding_bottom", "accent_color", "accent_offset", "accent_height")
+
+    def __init__(
+        self,
+        children: Iterable[LayoutNode] = (),
+        *,
+        fill_color: str = SOFT_BLUE,
+        padding_side: float = 18.0,
+        padding_top: float = 20.0,
+        padding_bottom: float = 24.0,
+        default_gap: float = 16.0,
+        accent_color: Optional[str] = None,
+        accent_offset: float = 18.0,
+        accent_height: float = 8.0,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        self.fill_color = fill_color
+        self.padding_side = padding_side
+        self.padding_top = padding_top
+        self.padding_bottom = padding_bottom
+        self.accent_color = accent_color
+        self.accent_offset = accent_offset
+        self.accent_height = accent_height
+        super().__init__(children, default_gap=default_gap, gap_before=gap_before)
+
+    def _measure(self, width: float) -> float:
+        content_height = super()._measure(width - 2 * self.padding_side)
+        if content_height <= 0:
+            return 0.0
+        return self.padding_top + content_height + self.padding_bottom
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        height = self._measured_height
+        if height <= 0:
+            return []
+        commands = [filled_rect(x, top - height, width, height, self.fill_color)]
+        if self.accent_color is not None:
+            commands.append(filled_rect(x, top - self.accent_offset, width, self.accent_height, self.accent_color))
+        commands.extend(
+            super()._render(x + self.padding_side, top - self.padding_top, width - 2 * self.padding_side)
         )
+        return commands
+
+
+class RowNode(LayoutNode):
+    """Equal-width columns side by side; with ``fill_color`` each becomes an equal-height card."""
+
+    __slots__ = (
+        "children",
+        "gap",
+        "fill_color",
+        "padding_side",
+        "padding_top",
+        "padding_bottom",
+        "accent_color",
+        "accent_offset",
+        "accent_height",
     )
 
-    mission_title_y = max(360, bullet_lowest - 36)
-    mission_body_y = mission_title_y - 26
-    mission_width = 250
-    mission_lines = wrapped_lines(
+    def __init__(
+        self,
+        children: Iterable[LayoutNode] = (),
+        *,
+        gap: float = 2.0,
+        fill_color: Optional[str] = None,
+        padding_side: float = 0.0,
+        padding_top: float = 0.0,
+        padding_bottom: float = 0.0,
+        accent_color: Optional[str] = None,
+        accent_offset: float = 18.0,
+        accent_height: float = 8.0,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        super().__init__(gap_before=gap_before)
+        self.gap = gap
+        self.fill_color = fill_color
+        self.padding_side = padding_side
+        self.padding_top = padding_top
+        self.padding_bottom = padding_bottom
+        self.accent_color = accent_color
+        self.accent_offset = accent_offset
+        self.accent_height = accent_height
+        self.children: List[LayoutNode] = []
+        for child in children:
+            self.append(child)
+
+    def append(self, child: LayoutNode) -> LayoutNode:
+        child.parent = self
+        self.children.append(child)
+        self.mark_dirty()
+        return child
+
+    def _cell_width(self, width: float) -> float:
+        if not self.children:
+            return 0.0
+        return (width - self.gap * (len(self.children) - 1)) / len(self.children)
+
+    def _measure(self, width: float) -> float:
+        inner_width = self._cell_width(width) - 2 * self.padding_side
+        content_height = max((child.measure(inner_width) for child in self.children), default=0.0)
+        if content_height <= 0:
+            return 0.0
+        return self.padding_top + content_height + self.padding_bottom
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        height = self._measured_height
+        if height <= 0:
+            return []
+        cell_width = self._cell_width(width)
+        commands: List[str] = []
+        for index, child in enumerate(self.children):
+            cell_x = x + index * (cell_width + self.gap)
+            if self.fill_color is not None:
+                commands.append(filled_rect(cell_x, top - height, cell_width, height, self.fill_color))
+            if self.accent_color is not None:
+                commands.append(filled_rect(cell_x, top - self.accent_offset, cell_width, self.accent_height, self.accent_color))
+            commands.extend(
+                child.render(cell_x + self.padding_side, top - self.padding_top, cell_width - 2 * self.padding_side)
+            )
+        return commands
+
+
+def pricing_card_node(
+    title: str,
+    price: str,
+    bullets: Sequence[str],
+    *,
+    fill_color: str = PALE_BLUE,
+    accent_color: str = GOLD,
+    price_note: Optional[str] = "VAT-free",
+    bullet_size: float = 11,
+    bullet_leading: float = 14,
+    gap_before: Optional[float] = None,
+) -> PanelNode:
+    """:func:`pricing_card` as a layout node, for pages laid out with :func:`flow_pages`."""
+
+    return PanelNode(
         [
-            "Maximise rental income while protecting your asset and time through proactive management.",
+            TextNode([title], font="F2", size=16, color=DEEP_BLUE, leading=18),
+            TextNode([price, price_note] if price_note else [price], font="F1", size=12, color=BLACK, leading=16),
+            TextNode(
+                tidy_items(bullets), font="F1", size=bullet_size, color=BLACK, leading=bullet_leading, bullet="•"
+            ),
         ],
-        width=mission_width,
-        font="F1",
-        size=11,
+        fill_color=fill_color,
+        accent_color=accent_color,
+        gap_before=gap_before,
+        **PRICING_CARD_PADDING,
     )
-    if mission_lines:
-        page2_commands.append(
-            text_block(
-                70,
-                mission_title_y,
-                ["Mission"],
-                font="F2",
-                size=14,
-                color=DEEP_BLUE,
-                leading=18,
-            )
-        )
-        page2_commands.append(
-            text_block(
-                70,
-                mission_body_y,
-                mission_lines,
-                font="F1",
-                size=11,
-                color=BLACK,
-                leading=16,
+
+
+def area_card_node(
+    title: str,
+    description: Sequence[str],
+    *,
+    fill_color: str = SOFT_BLUE,
+    accent_color: str = GOLD,
+    body_size: float = 11,
+    body_leading: float = 16,
+    gap_before: Optional[float] = None,
+) -> PanelNode:
+    """A neighbourhood card: title and description under a gold accent."""
+
+    return PanelNode(
+        [
+            TextNode([title], font="F2", size=16, color=DEEP_BLUE, leading=18),
+            TextNode(tidy_paragraphs(description), font="F1", size=body_size, color=BLACK, leading=body_leading),
+        ],
+        fill_color=fill_color,
+        accent_color=accent_color,
+        gap_before=gap_before,
+        **AREA_CARD_PADDING,
+    )
+
+
+class TableNode(LayoutNode):
+    """Grid of wrapped cells under a header row, sized from measured content.
+
+    Every row needs exactly one cell per header label; use ``""`` for blanks.
+    Each column receives at least its longest word and the remaining width is
+    shared in proportion to how much more each column needs to avoid wrapping.
+    The whole grid serialises to one path per fill colour and one text object
+    per row style. With :func:`flow_pages` a table splits between rows and the
+    continuation repeats the header with the same column widths.
+    """
+
+    __slots__ = (
+        "header",
+        "rows",
+        "font",
+        "size",
+        "leading",
+        "color",
+        "header_font",
+        "header_size",
+        "header_color",
+        "header_fill",
+        "fill_color",
+        "stripe_color",
+        "cell_padding",
+        "min_row_height",
+        "column_widths",
+        "_widths",
+        "_header_lines",
+        "_header_height",
+        "_row_lines",
+        "_row_heights",
+    )
+
+    def __init__(
+        self,
+        header: Sequence[str],
+        rows: Sequence[Sequence[str]],
+        *,
+        font: str = "F1",
+        size: float = 11,
+        leading: float = 14,
+        color: str = BLACK,
+        header_font: str = "F2",
+        header_size: float = 12,
+        header_color: str = WHITE,
+        header_fill: str = DEEP_BLUE,
+        fill_color: str = PALE_BLUE,
+        stripe_color: Optional[str] = SOFT_BLUE,
+        cell_padding: float = 8.0,
+        min_row_height: float = 28.0,
+        column_widths: Optional[Sequence[float]] = None,
+        gap_before: Optional[float] = None,
+    ) -> None:
+        super().__init__(gap_before=gap_before)
+        self.header = list(header)
+        self.rows = [list(row) for row in rows]
+        for number, row in enumerate(self.rows, start=1):
+            if len(row) != len(self.header):
+                raise ValueError(f"Table row {number} has {len(row)} cells but the header has {len(self.header)}")
+        self.font = font
+        self.size = size
+        self.leading = leading
+        self.color = color
+        self.header_font = header_font
+        self.header_size = header_size
+        self.header_color = header_color
+        self.header_fill = header_fill
+        self.fill_color = fill_color
+        self.stripe_color = stripe_color
+        self.cell_padding = cell_padding
+        self.min_row_height = min_row_height
+        self.column_widths = list(column_widths) if column_widths is not None else None
+        self._widths: List[float] = []
+        self._header_lines: List[List[str]] = []
+        self._header_height = 0.0
+        self._row_lines: List[List[List[str]]] = []
+        self._row_heights: List[float] = []
+
+    def _columns(self) -> List[List[Tuple[str, str, float]]]:
+        columns: List[List[Tuple[str, str, float]]] = []
+        for index, label in enumerate(self.header):
+            cells = [(label, self.header_font, self.header_size)]
+            cells.extend((row[index], self.font, self.size) for row in self.rows)
+            columns.append(cells)
+        return columns
+
+    def _line_counts(self, cells: Sequence[Tuple[str, str, float]], column_width: float) -> List[int]:
+        inner = column_width - 2 * self.cell_padding
+        return [
+            len(_wrap_text([text], width=inner, font=font, size=size)) if text else 1 for text, font, size in cells
+        ]
+
+    def _auto_widths(self, width: float) -> List[float]:
+        """Size columns from measured content.
+
+        Columns start at their longest word; spare width then goes, one step at a
+        time, to whichever column shortens the table most, and anything left once
+        no column benefits is shared in proportion to the remaining text width.
+        """
+
+        padding = 2 * self.cell_padding + 0.5
+        columns = self._columns()
+        if not columns:
+            return []
+        minimum: List[float] = []
+        natural: List[float] = []
+        for cells in columns:
+            minimum.append(
+                max(
+                    (text_width(word, font=font, size=size) for text, font, size in cells for word in text.split()),
+                    default=0.0,
+                )
+                + padding
             )
+            natural.append(max(text_width(text, font=font, size=size) for text, font, size in cells) + padding)
+
+        if sum(natural) <= width:
+            scale = width / sum(natural)
+            return [value * scale for value in natural]
+        spare = width - sum(minimum)
+        if spare <= 0:
+            scale = width / sum(minimum)
+            return [value * scale for value in minimum]
+
+        widths = list(minimum)
+        counts = [self._line_counts(cells, column) for cells, column in zip(columns, widths)]
+
+        def total_lines(candidate: Sequence[Sequence[int]]) -> int:
+            return sum(max(row) for row in zip(*candidate))
+
+        step = max(spare / 24, 2.0)
+        current = total_lines(counts)
+        while spare >= step:
+            best_total, best_index, best_counts = current, -1, None
+            for index, cells in enumerate(columns):
+                if widths[index] >= natural[index]:
+                    continue
+                trial = self._line_counts(cells, widths[index] + step)
+                candidate = counts[:index] + [trial] + counts[index + 1 :]
+                trial_total = total_lines(candidate)
+                if trial_total < best_total:
+                    best_total, best_index, best_counts = trial_total, index, trial
+            if best_counts is None:
+                break
+            widths[best_index] += step
+            counts[best_index] = best_counts
+            spare -= step
+            current = best_total
+
+        flex = [max(high - low, 0.0) for low, high in zip(widths, natural)]
+        weights = flex if sum(flex) > 0 else natural
+        return [low + spare * weight / sum(weights) for low, weight in zip(widths, weights)]
+
+    def _cell_height(self, line_count: int, size: float, leading: float) -> float:
+        return max(_estimate_text_height(max(line_count, 1), size, leading) + 2 * self.cell_padding, self.min_row_height)
+
+    def _measure(self, width: float) -> float:
+        self._widths = self.column_widths or self._auto_widths(width)
+        inner = [column - 2 * self.cell_padding for column in self._widths]
+        self._header_lines = [
+            _wrap_text([label], width=column, font=self.header_font, size=self.header_size)
+            for label, column in zip(self.header, inner)
+        ]
+        header_leading = _resolved_leading(self.header_size, None)
+        self._header_height = self._cell_height(
+            max((len(lines) for lines in self._header_lines), default=0), self.header_size, header_leading
         )
-    else:
-        page2_commands.append(
-            text_block(
-                70,
-                mission_title_y,
-                ["Mission"],
-                font="F2",
-                size=14,
-                color=DEEP_BLUE,
-                leading=18,
+        self._row_lines = []
+        self._row_heights = []
+        for row in self.rows:
+            wrapped = [
+                _wrap_text([value], width=column, font=self.font, size=self.size) if value else []
+                for value, column in zip(row, inner)
+            ]
+            self._row_lines.append(wrapped)
+            self._row_heights.append(
+                self._cell_height(max((len(lines) for lines in wrapped), default=0), self.size, self.leading)
             )
+        return self._header_height + sum(self._row_heights) + 2 * self.cell_padding
+
+    def split(self, available: float, width: float) -> Optional[Tuple["LayoutNode", "LayoutNode"]]:
+        self.measure(width)
+        remaining = available - self._header_height - 2 * self.cell_padding
+        fitting = 0
+        for height in self._row_heights:
+            if height > remaining:
+                break
+            remaining -= height
+            fitting += 1
+        if fitting == 0 or fitting == len(self.rows):
+            return None
+        head = self._with_rows(self.rows[:fitting])
+        head.gap_before = self.gap_before
+        return head, self._with_rows(self.rows[fitting:])
+
+    def min_height(self, width: float) -> float:
+        self.measure(width)
+        first_row = self._row_heights[0] if self._row_heights else 0.0
+        return self._header_height + first_row + 2 * self.cell_padding
+
+    def _with_rows(self, rows: Sequence[Sequence[str]]) -> "TableNode":
+        return TableNode(
+            self.header,
+            rows,
+            font=self.font,
+            size=self.size,
+            leading=self.leading,
+            color=self.color,
+            header_font=self.header_font,
+            header_size=self.header_size,
+            header_color=self.header_color,
+            header_fill=self.header_fill,
+            fill_color=self.fill_color,
+            stripe_color=self.stripe_color,
+            cell_padding=self.cell_padding,
+            min_row_height=self.min_row_height,
+            column_widths=self._widths,
         )
 
-    mission_lowest = mission_body_y
-    if mission_lines:
-        mission_lowest = mission_body_y - (len(mission_lines) - 1) * 16
+    def _text_object(
+        self,
+        cells: Iterable[Tuple[float, float, List[str]]],
+        *,
+        font: str,
+        size: float,
+        leading: float,
+        color: str,
+    ) -> str:
+        commands = ["BT", f"{color} rg", f"/{font} {size} Tf", f"{leading:.2f} TL"]
+        for x, baseline, lines in cells:
+            if not lines:
+                continue
+            commands.append(f"1 0 0 1 {x:.2f} {baseline:.2f} Tm")
+            commands.append(show_text(lines[0], font))
+            for line in lines[1:]:
+                commands.append("T*")
+                commands.append(show_text(line, font))
+        commands.append("ET")
+        return "\n".join(commands)
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        bottom = top - self._measured_height
+        header_bottom = top - self._header_height
+        column_x: List[float] = []
+        cursor = x
+        for column in self._widths:
+            column_x.append(cursor + self.cell_padding)
+            cursor += column
+
+        commands = [
+            filled_rect(x, bottom, width, header_bottom - bottom, self.fill_color),
+            filled_rect(x, header_bottom, width, self._header_height, self.header_fill),
+        ]
 
-    scope_title_y = mission_lowest - 34
-    scope_body_y = scope_title_y - 26
-    scope_lines = wrapped_lines(
-        tidy_paragraphs(
-            [
-                """
-                From single-apartment landlords to portfolio investors, Aktonz handles marketing, compliance and tenant care
-                with measured communication at every milestone.
-                """
-            ]
-        ),
-        width=420,
-        font="F1",
-        size=11,
-    )
-    page2_commands.append(
-        text_block(
-            70,
-            scope_title_y,
-            ["Scope"],
-            font="F2",
-            size=14,
-            color=DEEP_BLUE,
-            leading=18,
-        )
-    )
-    if scope_lines:
-        page2_commands.append(
-            text_block(
-                70,
-                scope_body_y,
-                scope_lines,
-                font="F1",
-                size=11,
-                color=BLACK,
-                leading=16,
+        header_baseline = top - self.cell_padding - self.header_size
+        body_cells: List[Tuple[float, float, List[str]]] = []
+        stripes: List[str] = []
+        row_top = header_bottom - self.cell_padding
+        for index, (lines_by_column, height) in enumerate(zip(self._row_lines, self._row_heights)):
+            if index % 2 == 0 and self.stripe_color is not None:
+                stripes.append(f"{x:.2f} {row_top - height + 2:.2f} {width:.2f} {height - 4:.2f} re")
+            baseline = row_top - self.cell_padding - self.size
+            body_cells.extend((cell_x, baseline, lines) for cell_x, lines in zip(column_x, lines_by_column))
+            row_top -= height
+
+        if stripes:
+            commands.append("\n".join([f"{self.stripe_color} rg", *stripes, "f"]))
+        commands.append(
+            self._text_object(
+                ((cell_x, header_baseline, lines) for cell_x, lines in zip(column_x, self._header_lines)),
+                font=self.header_font,
+                size=self.header_size,
+                leading=_resolved_leading(self.header_size, None),
+                color=self.header_color,
             )
         )
+        if body_cells:
+            commands.append(
+                self._text_object(body_cells, font=self.font, size=self.size, leading=self.leading, color=self.color)
+            )
+        return commands
 
-    page2_commands.append(footer(2))
-    page_contents.append("\n".join(page2_commands))
 
-    # Page 3 - Landlord services overview
-    services_commands: List[str] = [
-        page_background(),
-        header("Service pathways", "Flexible coverage that matches your involvement"),
-        f"{PALE_BLUE} rg",
-        "70 460 150 250 re",
-        "f",
-        f"{PALE_BLUE} rg",
-        "222 460 150 250 re",
-        "f",
-        f"{PALE_BLUE} rg",
-        "374 460 150 250 re",
-        "f",
-        f"{GOLD} rg",
-        "70 670 150 6 re",
-        "f",
-        f"{GOLD} rg",
-        "222 670 150 6 re",
-        "f",
-        f"{GOLD} rg",
-        "374 670 150 6 re",
-        "f",
-    ]
+class PageNode(LayoutNode):
+    """A full A4 page: background, optional header and footer plus placed children."""
 
-    service_columns = [
-        (
-            78,
-            "Let Only",
-            tidy_items(
-                [
-                    "Strategic multi-portal marketing and social promotion for launch reach.",
-                    "Expert-led accompanied viewings and tenant negotiations.",
-                    "Comprehensive referencing, compliance checks and contract drafting.",
-                    "Smooth handover once rent and deposit clear for your self-management.",
-                ]
-            ),
-        ),
-        (
-            230,
-            "Rent Collection",
-            tidy_items(
-                [
-                    "Everything in Let Only plus ongoing rent collection and reconciliation.",
-                    "Live monitoring with proactive arrears management and reminders.",
-                    "Monthly income statements within the Aktonz landlord portal.",
-                    "Cashflow oversight without day-to-day payment chasing.",
+    __slots__ = ("placements", "title", "subtitle", "number", "include_logo")
+
+    def __init__(
+        self,
+        placements: Iterable[Tuple[float, float, float, LayoutNode]] = (),
+        *,
+        title: Optional[str] = None,
+        subtitle: Optional[str] = None,
+        number: Optional[int] = None,
+        include_logo: bool = True,
+    ) -> None:
+        super().__init__()
+        self.title = title
+        self.subtitle = subtitle
+        self.number = number
+        self.include_logo = include_logo
+        self.placements: List[Tuple[float, float, float, LayoutNode]] = []
+        for x, top, width, node in placements:
+            self.place(node, x, top, width)
+
+    def place(self, node: LayoutNode, x: float, top: float, width: float) -> LayoutNode:
+        node.parent = self
+        self.placements.append((x, top, width, node))
+        self.mark_dirty()
+        return node
+
+    def _measure(self, width: float) -> float:
+        for _, _, node_width, node in self.placements:
+            node.measure(node_width)
+        return 842.0
+
+    def _render(self, x: float, top: float, width: float) -> List[str]:
+        commands = [page_background()]
+        if self.title is not None:
+            commands.append(header(self.title, self.subtitle, include_logo=self.include_logo))
+        for node_x, node_top, node_width, node in self.placements:
+            commands.extend(node.render(node_x, node_top, node_width))
+        if self.number is not None:
+            commands.append(footer(self.number))
+        return commands
+
+    def content(self) -> str:
+        """Measure and serialise the page into a content stream string."""
+
+        return "\n".join(self.render(0, 842, 595))
+
+
+# --- Flow engine ----------------------------------------------------------
+
+# Lowest baseline available to flowing content before it would meet the footer rule.
+CONTENT_BOTTOM = 96.0
+FLOW_MIN_LINES = 2
+
+Placement = Tuple[float, float, float, LayoutNode]
+
+
+class Frame:
+    """Rectangular region of a page that flowing content is poured into."""
+
+    __slots__ = ("x", "top", "bottom", "width")
+
+    def __init__(self, x: float, top: float, width: float, bottom: float = CONTENT_BOTTOM) -> None:
+        self.x = x
+        self.top = top
+        self.width = width
+        self.bottom = bottom
+
+
+def flow_pages(
+    nodes: Iterable[LayoutNode],
+    *,
+    first_frame: Frame,
+    next_frame: Optional[Frame] = None,
+    default_gap: float = 0.0,
+) -> List[List[Placement]]:
+    """Pour layout nodes into frames, starting new pages as each frame fills.
+
+    Every node is measured once. Paragraphs split between lines while keeping at
+    least ``FLOW_MIN_LINES`` on either side of the break; panels, cards and text
+    flagged ``keep_together`` move whole to the next frame; ``keep_with_next``
+    holds a heading on the same page as the start of the block that follows.
+    Returns the placements for each page, ready for :meth:`PageNode.place`.
+    """
+
+    continuation = next_frame or first_frame
+    pending = deque(nodes)
+    pages: List[List[Placement]] = [[]]
+    frame = first_frame
+    y = frame.top
+    at_top = True
+
+    while pending:
+        node = pending.popleft()
+        height = node.measure(frame.width)
+        if height <= 0:
+            continue
+        gap = 0.0 if at_top else (node.gap_before if node.gap_before is not None else default_gap)
+        needed = height
+        if node.keep_with_next and pending:
+            following = pending[0]
+            following_gap = following.gap_before if following.gap_before is not None else default_gap
+            needed += following_gap + following.min_height(frame.width)
+
+        fits = y - gap - needed >= frame.bottom
+        if not fits and at_top and y - height >= frame.bottom:
+            # A heading and its block are taller than a whole frame; keep the heading at least.
+            fits = True
+        if fits:
+            pages[-1].append((frame.x, y - gap, frame.width, node))
+            y -= gap + height
+            at_top = False
+            continue
+
+        parts = None if node.keep_with_next else node.split(y - gap - frame.bottom, frame.width)
+        if parts is not None:
+            head, tail = parts
+            pages[-1].append((frame.x, y - gap, frame.width, head))
+            pending.appendleft(tail)
+        elif at_top:
+            # Oversized block that cannot split: place it rather than loop forever.
+            pages[-1].append((frame.x, y, frame.width, node))
+            y -= height
+            at_top = False
+            continue
+        else:
+            pending.appendleft(node)
+
+        pages.append([])
+        frame = continuation
+        y = frame.top
+        at_top = True
+
+    return pages
+
+
+# --- Brochure content -----------------------------------------------------
+
+
+MEDIA_BOX = "[0 0 595 842]"
+CONTACT_CARDS: List[Tuple[str, List[Tuple[str, str]]]] = [
+    (
+        "Speak to the lettings team",
+        [
+            ("Phone", "0203 389 8009"),
+            ("Email", "info@aktonz.com"),
+            ("Website", "www.aktonz.com"),
+        ],
+    ),
+    (
+        "Stay connected",
+        [
+            ("Office hours", "Mon-Fri 9am-7pm | Sat 10am-4pm | Sun by appointment"),
+            ("Social", "LinkedIn & Instagram @Aktonz"),
+            ("Meetings", "In-person consultations available across London zones 1-3"),
+        ],
+    ),
+]
+_LOGO_OBJECTS: list = []
+
+
+def _logo_objects() -> Tuple[Optional[bytes], bytes]:
+    """Serialise the logo image (and soft mask) objects once per process.
+
+    Every document adds them straight after its font objects, so the soft mask
+    always lands on the same object number and the bytes can be shared. In
+    vector mode the logo is a single Form XObject with no soft mask.
+    """
+
+    if not _LOGO_OBJECTS and _LOGO_STATE["vector"]:
+        fragment = generate_aktonz_logo.pdf_fragment()
+        form_dict = (
+            f"/Type /XObject /Subtype /Form /BBox [0 0 {generate_aktonz_logo.WIDTH} {generate_aktonz_logo.HEIGHT}] "
+            f"/Resources << {fragment.resources} >> /Filter /FlateDecode"
+        )
+        _LOGO_OBJECTS.extend([None, make_binary_stream(form_dict, zlib.compress(fragment.content.encode("ascii"), 9))])
+    if not _LOGO_OBJECTS:
+        image = logo_image()
+        smask_object: Optional[bytes] = None
+        logo_dict = (
+            f"/Type /XObject /Subtype /Image /Width {image.width} /Height {image.height} "
+            "/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode "
+            f"/DecodeParms << /Predictor 15 /Colors 3 /BitsPerComponent 8 /Columns {image.width} >>"
+        )
+        if image.alpha_stream is not None:
+            smask_dict = (
+                f"/Type /XObject /Subtype /Image /Width {image.width} /Height {image.height} "
+                "/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode "
+                f"/DecodeParms << /Predictor 15 /Colors 1 /BitsPerComponent 8 /Columns {image.width} >>"
+            )
+            smask_object = make_binary_stream(smask_dict, image.alpha_stream)
+            logo_dict += f" /SMask {len(STANDARD_FONTS) + 1} 0 R"
+        _LOGO_OBJECTS.extend([smask_object, make_binary_stream(logo_dict, image.rgb_stream)])
+    return _LOGO_OBJECTS[0], _LOGO_OBJECTS[1]
+
+
+class Document(NamedTuple):
+    builder: PDFBuilder
+    font_objects: dict
+    resource_dict: str
+    pages_obj: int
+
+
+def start_document() -> Document:
+    """Open a PDF with the shared font and logo objects every page refers to."""
+
+    builder = PDFBuilder()
+    # Font objects are filled in last so embedded fonts can be subset to the glyphs the pages use.
+    font_objects = {resource: builder.reserve_object() for resource in STANDARD_FONTS}
+
+    smask_object, logo_object = _logo_objects()
+    if smask_object is not None:
+        builder.add_object(smask_object)
+    logo_image_obj = builder.add_object(logo_object)
+
+    resource_dict = (
+        f"<< /Font << /F1 {font_objects['F1']} 0 R /F2 {font_objects['F2']} 0 R /F3 {font_objects['F3']} 0 R >> "
+        f"/XObject << /{logo_resource()} {logo_image_obj} 0 R >> >>"
+    )
+    pages_obj = builder.reserve_object()
+    return Document(builder, font_objects, resource_dict, pages_obj)
+
+
+# Most pages a /Pages node lists directly; larger documents get a nested, balanced page tree.
+PAGE_TREE_FANOUT = 16
+
+
+def pdf_text_string(text: str) -> str:
+    """Encode ``text`` as a UTF-16BE hex string for outline titles and other text strings."""
+
+    return "<FEFF" + text.encode("utf-16-be").hex().upper() + ">"
+
+
+def write_page_tree(builder: PDFBuilder, root_obj: int, page_objects: Sequence[int]) -> dict:
+    """Write the /Pages nodes for ``page_objects`` and return each page's parent.
+
+    Up to ``PAGE_TREE_FANOUT`` pages hang directly off ``root_obj``. Beyond that
+    pages are split into evenly sized groups level by level, so a viewer jumping
+    to any page of a large bundle walks a shallow tree instead of one long array.
+    """
+
+    parents: dict = {}
+    counts = {obj: 1 for obj in page_objects}
+    level = list(page_objects)
+    while len(level) > PAGE_TREE_FANOUT:
+        groups = -(-len(level) // PAGE_TREE_FANOUT)
+        size, extra = divmod(len(level), groups)
+        next_level: List[int] = []
+        start = 0
+        for index in range(groups):
+            kids = level[start : start + size + (index < extra)]
+            start += len(kids)
+            node_obj = builder.reserve_object()
+            counts[node_obj] = sum(counts[kid] for kid in kids)
+            for kid in kids:
+                parents[kid] = node_obj
+            next_level.append(node_obj)
+        level = next_level
+
+    nodes: dict = {}
+    for kid, parent in parents.items():
+        nodes.setdefault(parent, []).append(kid)
+    for node_obj, kids in nodes.items():
+        builder.set_object(
+            node_obj,
+            f"<< /Type /Pages /Parent {parents.get(node_obj, root_obj)} 0 R /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] /Count {counts[node_obj]} >>\n".encode(
+                "ascii"
+            ),
+        )
+
+    for kid in level:
+        parents[kid] = root_obj
+    kids = "[" + " ".join(f"{obj} 0 R" for obj in level) + "]"
+    builder.set_object(
+        root_obj,
+        f"<< /Type /Pages /Kids {kids} /Count {len(page_objects)} /MediaBox {MEDIA_BOX} >>\n".encode("ascii"),
+    )
+    return parents
+
+
+def write_outline(builder: PDFBuilder, entries: Sequence[Tuple[str, int]]) -> int:
+    """Write a flat outline of ``(title, page object)`` entries and return its root."""
+
+    outline_obj = builder.reserve_object()
+    item_objects = [builder.reserve_object() for _ in entries]
+    for index, (item_obj, (title, page_obj)) in enumerate(zip(item_objects, entries)):
+        links = ""
+        if index > 0:
+            links += f" /Prev {item_objects[index - 1]} 0 R"
+        if index + 1 < len(item_objects):
+            links += f" /Next {item_objects[index + 1]} 0 R"
+        builder.set_object(
+            item_obj,
+            f"<< /Title {pdf_text_string(title)} /Parent {outline_obj} 0 R{links} /Dest [{page_obj} 0 R /Fit] >>\n".encode(
+                "ascii"
+            ),
+        )
+    builder.set_object(
+        outline_obj,
+        f"<< /Type /Outlines /First {item_objects[0]} 0 R /Last {item_objects[-1]} 0 R /Count {len(item_objects)} >>\n".encode(
+            "ascii"
+        ),
+    )
+    return outline_obj
+
+
+def _finish_document(
+    document: Document,
+    pages: Sequence[Tuple[int, int]],
+    *,
+    outline: Sequence[Tuple[str, int]] = (),
+) -> None:
+    """Write the page objects, page tree, fonts and catalog for ``(content, page)`` object pairs."""
+
+    builder = document.builder
+    page_objects = [page_obj for _, page_obj in pages]
+    parents = write_page_tree(builder, document.pages_obj, page_objects)
+    for content_obj, page_obj in pages:
+        builder.set_object(
+            page_obj,
+            f"<< /Type /Page /Parent {parents[page_obj]} 0 R /MediaBox {MEDIA_BOX} /Resources {document.resource_dict} /Contents {content_obj} 0 R >>\n".encode(
+                "ascii"
+            ),
+        )
+
+    write_font_objects(builder, document.font_objects)
+    catalog = f"<< /Type /Catalog /Pages {document.pages_obj} 0 R"
+    if outline:
+        outline_obj = write_outline(builder, [(title, page_objects[index]) for title, index in outline])
+        catalog += f" /Outlines {outline_obj} 0 R /PageMode /UseOutlines"
+    catalog_obj = builder.add_object(f"{catalog} >>\n".encode("ascii"))
+    builder.set_root(catalog_obj)
+
+
+def _add_page(builder: PDFBuilder, content: str) -> Tuple[int, int]:
+    return builder.add_object(make_stream(content)), builder.reserve_object()
+
+
+def complete_document(
+    document: Document,
+    page_contents: Iterable[str],
+    *,
+    outline: Sequence[Tuple[str, int]] = (),
+) -> PDFBuilder:
+    """Write the page objects, page tree, fonts and catalog, leaving the builder ready to serialise.
+
+    ``outline`` lists ``(title, page index)`` bookmarks; the catalog asks viewers
+    to open with the outline panel showing when there are any.
+    """
+
+    pages = [_add_page(document.builder, content) for content in page_contents]
+    _finish_document(document, pages, outline=outline)
+    return document.builder
+
+
+def stream_document(
+    document: Document,
+    page_contents: Iterable[str],
+    *,
+    outline: Sequence[Tuple[str, int]] = (),
+) -> Iterator[bytes]:
+    """Like :func:`complete_document`, but yield the file as it is written.
+
+    The header and logo leave before the first page is laid out, and each
+    page's content stream as soon as the page is ready. Page objects, fonts
+    (subset to the glyphs every page used) and the xref follow the last page,
+    so the first byte does not wait for the page count. ``outline`` is only read
+    once every page has been produced, so a page generator may fill it in.
+    """
+
+    builder = document.builder
+    yield from builder.drain()
+    pages: List[Tuple[int, int]] = []
+    for content in page_contents:
+        pages.append(_add_page(builder, content))
+        yield from builder.drain()
+    _finish_document(document, pages, outline=outline)
+    yield from builder.finish()
+
+
+def build_brochure(output_path: Optional[Path] = None) -> bytes:
+    """Render the marketing brochure, writing it to ``output_path`` when given."""
+
+    memory = MemorySink()
+    publish(brochure_chunks(), [memory] if output_path is None else [memory, FileSink(output_path)])
+    return memory.data
+
+
+class BrochureTree(NamedTuple):
+    """Layout nodes behind the marketing brochure's tree-built pages."""
+
+    cover: PageNode
+    introduction: List[LayoutNode]
+    services: List[LayoutNode]
+    comparison: List[LayoutNode]
+    pricing: List[LayoutNode]
+    addons: LayoutNode
+    testimonials: LayoutNode
+    faq_intro: LayoutNode
+    faq: List[LayoutNode]
+    areas: List[LayoutNode]
+
+
+_BROCHURE_TREES: dict = {}
+SERVICES_FRAME = Frame(70, 710, 455)
+
+
+def brochure_tree() -> BrochureTree:
+    """The brochure's layout nodes, built once per kerning setup and reused by every render.
+
+    Nodes keep their measurements between renders, so a worker or server that
+    renders the brochure repeatedly only re-wraps nodes changed through
+    :meth:`LayoutNode.update`. Kerning moves line breaks, hence one tree per setup.
+    """
+
+    key = tuple(sorted((font, id(metrics)) for font, metrics in KERNED_FONTS.items()))
+    tree = _BROCHURE_TREES.get(key)
+    if tree is None:
+        tree = _BROCHURE_TREES[key] = _build_brochure_tree()
+    return tree
+
+
+def _flowed_pages(
+    pages: Sequence[Sequence[Placement]],
+    *,
+    title: str,
+    subtitle: str,
+    first_number: int,
+    continued_subtitle: Optional[str] = None,
+    first_page_extras: Sequence[Placement] = (),
+) -> Generator[str, None, int]:
+    """Yield a content stream per page :func:`flow_pages` produced and return the last page number."""
+
+    number = first_number - 1
+    for index, placements in enumerate(pages):
+        number += 1
+        yield PageNode(
+            [*first_page_extras, *placements] if index == 0 else placements,
+            title=title,
+            subtitle=subtitle if index == 0 else continued_subtitle or f"{subtitle} (continued)",
+            number=number,
+        ).content()
+    return number
+
+
+def _build_brochure_tree() -> BrochureTree:
+    # Page 1 - Cover
+    logo = ImageNode(220)
+    hero_title = [
+        "Premium Lettings & Management",
+        "Modern service. Local expertise. Trusted results.",
+    ]
+    hero_subtitle = TextNode(
+        [
+            "Move smarter with Aktonz as your London lettings partner.",
+            "Data-led marketing, curated tenant journeys, and proactive asset care for confident landlords.",
+        ],
+        font="F1",
+        size=14,
+        color=WHITE,
+        leading=20,
+        wrap_width=360,
+        gap_before=6.0,
+    )
+    # The hero runs from y=520 down to 30pt above the gold band; the title shrinks rather than overrun it.
+    title_space = 520 - 300 - hero_subtitle.gap_before - hero_subtitle.measure(405)
+    title_size = fit_font_size(
+        lambda size: TextNode(hero_title, font="F2", size=size, leading=size * 30 / 26).measure(405),
+        title_space,
+        minimum=18,
+        maximum=26,
+    )
+    hero = ColumnNode(
+        [
+            TextNode(hero_title, font="F2", size=title_size, color=WHITE, leading=title_size * 30 / 26),
+            hero_subtitle,
+        ]
+    )
+    cover = PageNode(
+        [
+            (0, 842, 595, RectNode(842, DEEP_BLUE)),
+            (0, 260, 595, RectNode(260, SOFT_BLUE)),
+            (0, 270, 595, RectNode(10, GOLD)),
+            # The logo's bottom edge stays at y=590 whatever its aspect ratio.
+            (187.5, 590 + logo.measure(220), 220, logo),
+            (120, 520, 405, hero),
+            (70, 230, 455, RectNode(140, WHITE)),
+            (70, 224, 455, RectNode(4, GOLD)),
+            (
+                90,
+                210,
+                410,
+                TextNode(
+                    [
+                        "Aktonz delivers concierge-level lettings with a technology core so every landlord enjoys real-time clarity and strategic advice.",
+                        "From Canary Wharf penthouses to Hackney townhouses, our team brings local intelligence, rigorous compliance and polished marketing that commands premium tenancies in record time.",
+                        "",
+                        "99% landlord retention | 14-day average time-to-let | 8.7% rental uplift vs. local averages",
+                    ],
+                    font="F1",
+                    size=12,
+                    color=DEEP_BLUE,
+                    leading=16,
+                ),
+            ),
+        ]
+    )
+
+    # Page 2 - Company introduction
+    introduction: List[LayoutNode] = [
+        PanelNode(
+            [
+                TextNode(
+                    tidy_paragraphs(
+                        [
+                            """
+                            Aktonz is a London-based lettings and property management agency built to give landlords total confidence.
+                            Our neighbourhood experts combine hyper-local insight with a digital portal that keeps instructions
+                            transparent and responsive every step of the tenancy lifecycle.
+                            """,
+                            "",
+                            """
+                            We operate across the capital with teams dedicated to East London hubs including Hackney, Shoreditch and
+                            Canary Wharf while supporting landlords with single homes or multi-unit portfolios citywide.
+                            """,
+                        ]
+                    ),
+                    font="F1",
+                    size=12,
+                    color=BLACK,
+                    leading=18,
+                    mode="optimal",
+                )
+            ],
+            fill_color=SOFT_BLUE,
+            padding_side=22.0,
+            padding_top=20.0,
+            padding_bottom=16.0,
+        ),
+        TextNode(
+            ["Why landlords choose Aktonz"],
+            font="F2",
+            size=16,
+            color=DEEP_BLUE,
+            leading=20,
+            keep_with_next=True,
+            gap_before=18.0,
+        ),
+        TextNode(
+            tidy_items(
+                [
+                    "Local London experts advising on pricing, positioning and legislation per neighbourhood.",
+                    "Modern marketing with cinematic photography, video walk-throughs and relocation networks for reach.",
+                    "24/7 portal providing viewing feedback, offers, payments and compliance tracking in real time.",
+                    "Transparent fixed fees with no VAT, saving around 20% compared with traditional agency models.",
+                ]
+            ),
+            font="F1",
+            size=11,
+            color=BLACK,
+            leading=15,
+            bullet="•",
+            mode="optimal",
+            gap_before=8.0,
+        ),
+        PanelNode(
+            [
+                TextNode(
+                    [
+                        "Trust that converts",
+                        "72% of consumers trust businesses with clear value proof and testimonials. Aktonz leads with "
+                        "measurable results to secure instructions swiftly.",
+                    ],
+                    font="F2",
+                    size=12,
+                    color=WHITE,
+                    leading=16,
+                )
+            ],
+            fill_color=GOLD,
+            padding_top=18.0,
+            padding_bottom=4.0,
+        ),
+    ]
+    for heading, paragraphs in (
+        ("Mission", ["Maximise rental income while protecting your asset and time through proactive management."]),
+        (
+            "Scope",
+            tidy_paragraphs(
+                [
+                    """
+                    From single-apartment landlords to portfolio investors, Aktonz handles marketing, compliance and tenant care
+                    with measured communication at every milestone.
+                    """
+                ]
+            ),
+        ),
+    ):
+        introduction.append(
+            TextNode([heading], font="F2", size=14, color=DEEP_BLUE, leading=18, keep_with_next=True, gap_before=18.0)
+        )
+        introduction.append(
+            TextNode(paragraphs, font="F1", size=11, color=BLACK, leading=16, mode="optimal", gap_before=8.0)
+        )
+
+    # Page 3 - Landlord services overview
+    service_columns = [
+        (
+            "Let Only",
+            tidy_items(
+                [
+                    "Strategic multi-portal marketing and social promotion for launch reach.",
+                    "Expert-led accompanied viewings and tenant negotiations.",
+                    "Comprehensive referencing, compliance checks and contract drafting.",
+                    "Smooth handover once rent and deposit clear for your self-management.",
+                ]
+            ),
+        ),
+        (
+            "Rent Collection",
+            tidy_items(
+                [
+                    "Everything in Let Only plus ongoing rent collection and reconciliation.",
+                    "Live monitoring with proactive arrears management and reminders.",
+                    "Monthly income statements within the Aktonz landlord portal.",
+                    "Cashflow oversight without day-to-day payment chasing.",
                 ]
             ),
         ),
         (
-            382,
             "Full Management",
             tidy_items(
                 [
@@ -1105,229 +3142,105 @@ def build_brochure(output_path: Path) -> bytes:
             ),
         ),
     ]
-
-    bullet_lowest_y = 842.0
-    for x, title, bullets in service_columns:
-        services_commands.append(
-            text_block(x, 650, [title], font="F2", size=16, color=DEEP_BLUE, leading=18)
-        )
-        command, lowest = measured_bullet_block(
-            x,
-            632,
-            bullets,
-            width=132,
-            font="F1",
-            size=10,
-            color=BLACK,
-            leading=13,
-        )
-        if command:
-            services_commands.append(command)
-            bullet_lowest_y = min(bullet_lowest_y, lowest)
-
-    summary_y = max(bullet_lowest_y - 28, 440)
+    service_cards = RowNode(
+        [
+            ColumnNode(
+                [
+                    TextNode([title], font="F2", size=16, color=DEEP_BLUE, leading=18),
+                    TextNode(bullets, font="F1", size=10, color=BLACK, leading=13, bullet="•", gap_before=2.0),
+                ]
+            )
+            for title, bullets in service_columns
+        ],
+        fill_color=PALE_BLUE,
+        padding_side=8.0,
+        padding_top=60.0,
+        padding_bottom=20.0,
+        accent_color=GOLD,
+        accent_offset=40.0,
+        accent_height=6.0,
+    )
     summary_text = tidy_paragraphs(
         [
             """
-            Every service level includes access to our landlord success team, compliance tracking and marketing refreshes at
-            renewal to keep properties achieving optimal yields.
+            Every service level includes access to our landlord success team, compliance tracking and marketing
+            refreshes at renewal to keep properties achieving optimal yields.
             """
         ]
     )
-    summary_panel_width = 455.0
     summary_padding = 18.0
-    summary_leading = 16.0
-    summary_lines = wrapped_lines(
-        summary_text,
-        width=summary_panel_width - 2 * summary_padding,
-        font="F1",
-        size=11,
+    summary_width = SERVICES_FRAME.width - 2 * summary_padding
+    # Tighten the summary before letting it spill onto a continuation page.
+    summary_space = (
+        SERVICES_FRAME.top - SERVICES_FRAME.bottom - service_cards.measure(SERVICES_FRAME.width) - 24.0 - 16.0 - 20.0
     )
-    summary_background = text_panel_background(
-        70,
-        summary_y,
-        summary_panel_width,
-        summary_lines,
-        size=11,
-        leading=summary_leading,
-        padding_top=16,
-        padding_bottom=20,
+    summary_size = fit_font_size(
+        lambda size: TextNode(summary_text, size=size, leading=16).measure(summary_width),
+        summary_space,
+        minimum=10,
+        maximum=11,
     )
-    if summary_background:
-        services_commands.append(summary_background)
-    if summary_lines:
-        services_commands.append(
-            text_block(
-                70 + summary_padding,
-                summary_y,
-                summary_lines,
-                font="F1",
-                size=11,
-                color=BLACK,
-                leading=summary_leading,
-            )
-        )
-    services_commands.append(footer(3))
-    page_contents.append("\n".join(services_commands))
-
-    # Page 4 - Comparison table
-    comparison_commands: List[str] = [
-        page_background(),
-        header("Service comparison", "At-a-glance features across each pathway"),
-        f"{PALE_BLUE} rg",
-        "70 60 455 480 re",
-        "f",
-        f"{DEEP_BLUE} rg",
-        "70 520 455 40 re",
-        "f",
-        text_block(
-            90,
-            540,
-            ["Feature"],
-            font="F2",
-            size=12,
-            color=WHITE,
-            leading=16,
-        ),
-        text_block(
-            260,
-            540,
-            ["Let Only"],
-            font="F2",
-            size=12,
-            color=WHITE,
-            leading=16,
-        ),
-        text_block(
-            365,
-            540,
-            ["Rent Collection"],
-            font="F2",
-            size=12,
-            color=WHITE,
-            leading=16,
-        ),
-        text_block(
-            470,
-            540,
-            ["Full Mgmt"],
-            font="F2",
-            size=12,
-            color=WHITE,
-            leading=16,
+    summary_leading = fit_leading(
+        lambda leading: TextNode(summary_text, size=summary_size, leading=leading).measure(summary_width),
+        summary_space,
+        minimum=13,
+        preferred=16,
+    )
+    services: List[LayoutNode] = [
+        service_cards,
+        PanelNode(
+            [TextNode(summary_text, font="F1", size=summary_size, color=BLACK, leading=summary_leading)],
+            fill_color=SOFT_BLUE,
+            padding_side=summary_padding,
+            padding_top=16.0,
+            padding_bottom=20.0,
         ),
     ]
 
-    rows = [
-        ("Professional photography & marketing", "Included", "Included", "Included"),
-        ("Accompanied viewings & tenant vetting", "Included", "Included", "Included"),
-        ("Contract drafting & onboarding", "Included", "Included", "Included"),
-        ("Rent collection & arrears support", "-", "Included", "Included"),
-        ("Monthly landlord statements", "-", "Included", "Included"),
-        ("Maintenance coordination", "-", "-", "Included"),
-        ("24/7 tenant support line", "-", "-", "Included"),
-        ("Periodic inspections & reporting", "-", "-", "Included"),
-        ("Legal notices & renewals", "-", "-", "Included"),
-        ("Ideal for", "Hands-on landlords", "Owners wanting cashflow support", "Portfolio & time-poor landlords"),
-    ]
-
-    column_specs = [
-        (80.0, 160.0),
-        (260.0, 90.0),
-        (365.0, 90.0),
-        (470.0, 90.0),
-    ]
-    current_y = 500.0
-    for index, texts in enumerate(rows):
-        wrapped_by_column = [
-            wrapped_lines([value], width=col_width, font="F1", size=11)
-            for (_, col_width), value in zip(column_specs, texts)
-        ]
-        max_lines = max((len(lines) if lines else 1) for lines in wrapped_by_column)
-        row_height = max(max_lines * 14 + 12, 44)
-        row_top = current_y
-        row_bottom = row_top - row_height
-        if index % 2 == 0:
-            comparison_commands.append(f"{SOFT_BLUE} rg")
-            comparison_commands.append(f"70 {row_bottom + 2:.2f} 455 {row_height - 4:.2f} re")
-            comparison_commands.append("f")
-        for (col_x, _), lines in zip(column_specs, wrapped_by_column):
-            comparison_commands.append(
-                text_block(col_x, row_top - 8, lines, font="F1", size=11, color=BLACK, leading=14)
-            )
-        current_y = row_bottom
-
-    summary_y = max(current_y - 8, 24)
-    comparison_summary = tidy_paragraphs(
+    # Page 4 - Comparison table
+    comparison_table = TableNode(
+        ["Feature", "Let Only", "Rent Collection", "Full Mgmt"],
         [
-            """
-            Let Only is a one-off fee. Rent Collection and Full Management operate on monthly percentages with no VAT and no
-            renewal surprises.
-            """,
-            """
-            Upgrade pathways at any time as your needs evolve.
-            """,
-        ]
-    )
-    summary_panel_width = 455.0
-    summary_padding = 18.0
-    summary_leading = 16.0
-    comparison_lines = wrapped_lines(
-        comparison_summary,
-        width=summary_panel_width - 2 * summary_padding,
-        font="F1",
-        size=11,
-    )
-    comparison_background = text_panel_background(
-        70,
-        summary_y,
-        summary_panel_width,
-        comparison_lines,
-        size=11,
-        leading=summary_leading,
-        padding_top=16,
-        padding_bottom=20,
+            ("Professional photography & marketing", "Included", "Included", "Included"),
+            ("Accompanied viewings & tenant vetting", "Included", "Included", "Included"),
+            ("Contract drafting & onboarding", "Included", "Included", "Included"),
+            ("Rent collection & arrears support", "-", "Included", "Included"),
+            ("Monthly landlord statements", "-", "Included", "Included"),
+            ("Maintenance coordination", "-", "-", "Included"),
+            ("24/7 tenant support line", "-", "-", "Included"),
+            ("Periodic inspections & reporting", "-", "-", "Included"),
+            ("Legal notices & renewals", "-", "-", "Included"),
+            ("Ideal for", "Hands-on landlords", "Owners wanting cashflow support", "Portfolio & time-poor landlords"),
+        ],
     )
-    if comparison_background:
-        comparison_commands.append(comparison_background)
-    if comparison_lines:
-        comparison_commands.append(
-            text_block(
-                70 + summary_padding,
-                summary_y,
-                comparison_lines,
+    comparison_summary = PanelNode(
+        [
+            TextNode(
+                tidy_paragraphs(
+                    [
+                        """
+                        Let Only is a one-off fee. Rent Collection and Full Management operate on monthly percentages with no VAT and no
+                        renewal surprises.
+                        """,
+                        """
+                        Upgrade pathways at any time as your needs evolve.
+                        """,
+                    ]
+                ),
                 font="F1",
                 size=11,
                 color=BLACK,
-                leading=summary_leading,
+                leading=16,
             )
-        )
-    comparison_commands.append(footer(4))
-    page_contents.append("\n".join(comparison_commands))
+        ],
+        fill_color=SOFT_BLUE,
+        padding_side=18.0,
+        padding_top=16.0,
+        padding_bottom=20.0,
+        gap_before=20.0,
+    )
 
     # Page 5 - Pricing & fees
-    pricing_commands: List[str] = [
-        page_background(),
-        header("Transparent pricing", "Clear fees aligned with your objectives"),
-        wrapped_text_block(
-            70,
-            670,
-            tidy_paragraphs(
-                [
-                    """
-                    No VAT on Aktonz fees keeps more rental income in your pocket. Our pricing is simple, with inclusive
-                    onboarding and no renewal or hidden administration charges.
-                    """
-                ]
-            ),
-            width=430,
-            font="F1",
-            size=12,
-            color=BLACK,
-            leading=18,
-        ),
-    ]
-
     pricing_boxes = [
         ("Let Only", "7% of first year's rent", [
             "Tenant marketing blitz across portals and networks.",
@@ -1345,129 +3258,95 @@ def build_brochure(output_path: Path) -> bytes:
             "24/7 emergency line and legal compliance support.",
         ]),
     ]
+    pricing: List[LayoutNode] = [
+        TextNode(
+            tidy_paragraphs(
+                [
+                    """
+                    No VAT on Aktonz fees keeps more rental income in your pocket. Our pricing is simple, with inclusive
+                    onboarding and no renewal or hidden administration charges.
+                    """
+                ]
+            ),
+            font="F1",
+            size=12,
+            color=BLACK,
+            leading=18,
+            wrap_width=430,
+        ),
+        RowNode([pricing_card_node(title, price, bullets) for title, price, bullets in pricing_boxes]),
+        TextNode(["Fee advantages"], font="F2", size=14, color=DEEP_BLUE, leading=18, keep_with_next=True, gap_before=36.0),
+        TextNode(
+            tidy_paragraphs(
+                [
+                    """
+                    Traditional 6% + VAT structures equate to 7.2%. Aktonz charges a straight 6%, saving landlords around
+                    20%.
+                    """,
+                    """
+                    We never mark-up contractor invoices and provide renewal strategy reviews without additional charges.
+                    """,
+                ]
+            ),
+            font="F1",
+            size=11,
+            color=BLACK,
+            leading=16,
+            wrap_width=430,
+            gap_before=10.0,
+        ),
+    ]
 
-    box_x = [70.0, 218.0, 366.0]
-    box_top = 630.0
-    box_width = 148.0
-    for (title, price, bullets), x in zip(pricing_boxes, box_x):
-        card_commands, _ = pricing_card(x, box_top, box_width, title, price, bullets)
-        pricing_commands.extend(card_commands)
-
-    pricing_commands.extend(
+    # Page 6 - Add-on services
+    addons_padding = 22.0
+    addons = PanelNode(
         [
-            text_block(
-                70,
-                380,
-                [
-                    "Fee advantages",
-                ],
-                font="F2",
-                size=14,
-                color=DEEP_BLUE,
+            TextNode(
+                tidy_paragraphs(
+                    [
+                        """
+                        Aktonz provides a single point of instruction for statutory certificates and enhanced protection, so your
+                        property is always ready for move-in and future-proofed against regulation changes.
+                        """
+                    ]
+                ),
+                font="F1",
+                size=12,
+                color=BLACK,
                 leading=18,
             ),
-            wrapped_text_block(
-                70,
-                352,
+            TextNode(
+                tidy_items(
+                    [
+                        "Energy Performance Certificates arranged within 72 hours via accredited assessors.",
+                        "Gas safety inspections, electrical reports (EICR) and smoke/CO compliance scheduling.",
+                        "Professional inventory, check-in and check-out reports with photographic evidence.",
+                        "Rent guarantee insurance covering arrears for up to 12 months plus legal eviction support.",
+                        "Pre-tenancy and post-tenancy professional cleaning, staging and furnishing coordination.",
+                    ]
+                ),
+                font="F1",
+                size=11,
+                color=BLACK,
+                leading=16,
+                bullet="•",
+                gap_before=22.0,
+            ),
+            TextNode(
                 tidy_paragraphs(
                     [
                         """
-                        Traditional 6% + VAT structures equate to 7.2%. Aktonz charges a straight 6%, saving landlords around
-                        20%.
-                        """,
+                        Bundle add-ons with Full Management for preferential rates and consolidated reporting across certificates and
+                        renewals. Our compliance dashboard tracks renewal dates and proactively books services on your behalf.
                         """
-                        We never mark-up contractor invoices and provide renewal strategy reviews without additional charges.
-                        """,
                     ]
                 ),
-                width=430,
                 font="F1",
                 size=11,
                 color=BLACK,
                 leading=16,
+                gap_before=22.0,
             ),
-            footer(5),
-        ]
-    )
-    page_contents.append("\n".join(pricing_commands))
-
-    # Page 6 - Add-on services
-    addons_commands: List[str] = [
-        page_background(),
-        header("Add-on services", "Optional extras that keep tenancies compliant"),
-    ]
-
-    addons_padding = 22.0
-    addons_intro_lines = wrapped_lines(
-        tidy_paragraphs(
-            [
-                """
-                Aktonz provides a single point of instruction for statutory certificates and enhanced protection, so your
-                property is always ready for move-in and future-proofed against regulation changes.
-                """
-            ]
-        ),
-        width=455 - 2 * addons_padding,
-        font="F1",
-        size=12,
-    )
-    addons_bullet_lines = wrapped_bullets(
-        tidy_items(
-            [
-                "Energy Performance Certificates arranged within 72 hours via accredited assessors.",
-                "Gas safety inspections, electrical reports (EICR) and smoke/CO compliance scheduling.",
-                "Professional inventory, check-in and check-out reports with photographic evidence.",
-                "Rent guarantee insurance covering arrears for up to 12 months plus legal eviction support.",
-                "Pre-tenancy and post-tenancy professional cleaning, staging and furnishing coordination.",
-            ]
-        ),
-        width=455 - 2 * addons_padding,
-        font="F1",
-        size=11,
-        bullet="•",
-    )
-    addons_summary_lines = wrapped_lines(
-        tidy_paragraphs(
-            [
-                """
-                Bundle add-ons with Full Management for preferential rates and consolidated reporting across certificates and
-                renewals. Our compliance dashboard tracks renewal dates and proactively books services on your behalf.
-                """
-            ]
-        ),
-        width=455 - 2 * addons_padding,
-        font="F1",
-        size=11,
-    )
-
-    addons_panel, _ = stacked_panel(
-        70,
-        700,
-        455,
-        [
-            {
-                "lines": addons_intro_lines,
-                "font": "F1",
-                "size": 12,
-                "color": BLACK,
-                "leading": 18,
-            },
-            {
-                "lines": addons_bullet_lines,
-                "font": "F1",
-                "size": 11,
-                "color": BLACK,
-                "leading": 16,
-                "gap_before": 22.0,
-            },
-            {
-                "lines": addons_summary_lines,
-                "font": "F1",
-                "size": 11,
-                "color": BLACK,
-                "leading": 16,
-                "gap_before": 22.0,
-            },
         ],
         fill_color=PALE_BLUE,
         padding_side=addons_padding,
@@ -1475,18 +3354,8 @@ def build_brochure(output_path: Path) -> bytes:
         padding_bottom=32.0,
         default_gap=20.0,
     )
-    addons_commands.extend(addons_panel)
-    addons_commands.append(footer(6))
-    page_contents.append("\n".join(addons_commands))
 
     # Page 7 - Testimonials
-    testimonials_commands: List[str] = [
-        page_background(),
-        header("Landlords rate Aktonz 4.9/5", "Social proof from across London"),
-    ]
-
-    testimonial_padding = 22.0
-    testimonial_width = 455 - 2 * testimonial_padding
     testimonial_quotes = [
         tidy_text(
             '"Aktonz found corporate tenants within a week and handled every detail while I was overseas. Communication was immediate and outcomes were excellent." – Sarah K., Canary Wharf landlord'
@@ -1502,78 +3371,62 @@ def build_brochure(output_path: Path) -> bytes:
         ),
     ]
 
-    testimonial_sections: List[dict] = []
-    for index, quote in enumerate(testimonial_quotes):
-        lines = wrapped_lines([quote], width=testimonial_width, font="F3", size=12)
-        section: dict = {
-            "lines": lines,
-            "font": "F3",
-            "size": 12,
-            "color": BLACK,
-            "leading": 18,
-        }
-        if index > 0:
-            section["gap_before"] = 22.0
-        testimonial_sections.append(section)
-
-    testimonial_panel, testimonial_bottom = stacked_panel(
-        70,
-        700,
-        455,
-        testimonial_sections,
+    testimonial_panel = PanelNode(
         fill_color=PALE_BLUE,
-        padding_side=testimonial_padding,
+        padding_side=22.0,
         padding_top=28.0,
         padding_bottom=32.0,
         default_gap=20.0,
     )
-    testimonials_commands.extend(testimonial_panel)
+    for index, quote in enumerate(testimonial_quotes):
+        testimonial_panel.append(
+            TextNode(
+                [quote],
+                font="F3",
+                size=12,
+                color=BLACK,
+                leading=18,
+                gap_before=22.0 if index > 0 else None,
+            )
+        )
 
-    closing_y = testimonial_bottom - 36
-    testimonials_commands.append(
-        wrapped_text_block(
-            70,
-            closing_y,
-            tidy_paragraphs(
-                [
-                    """
-                    72% of consumers trust businesses with strong testimonials. Ask for references and case studies aligned to
-                    your property profile to see how Aktonz elevates performance in comparable homes.
-                    """
-                ]
+    testimonials = ColumnNode(
+        [
+            testimonial_panel,
+            TextNode(
+                tidy_paragraphs(
+                    [
+                        """
+                        72% of consumers trust businesses with strong testimonials. Ask for references and case studies aligned to
+                        your property profile to see how Aktonz elevates performance in comparable homes.
+                        """
+                    ]
+                ),
+                font="F1",
+                size=11,
+                color=BLACK,
+                leading=16,
+                wrap_width=430,
+                gap_before=36.0,
             ),
-            width=430,
-            font="F1",
-            size=11,
-            color=BLACK,
-            leading=16,
-        )
+        ]
     )
-    testimonials_commands.append(footer(7))
-    page_contents.append("\n".join(testimonials_commands))
 
     # Page 8 - FAQ
-    faq_commands: List[str] = [
-        page_background(),
-        header("FAQs & guidance", "Answering common landlord questions"),
-        wrapped_text_block(
-            70,
-            680,
-            tidy_paragraphs(
-                [
-                    """
-                    We anticipate the questions landlords regularly ask so you can move forward with confidence. For anything
-                    bespoke, our specialists are on hand to provide clarity and next steps.
-                    """
-                ]
-            ),
-            width=430,
-            font="F1",
-            size=12,
-            color=BLACK,
-            leading=18,
+    faq_intro = TextNode(
+        tidy_paragraphs(
+            [
+                """
+                We anticipate the questions landlords regularly ask so you can move forward with confidence. For anything
+                bespoke, our specialists are on hand to provide clarity and next steps.
+                """
+            ]
         ),
-    ]
+        font="F1",
+        size=12,
+        color=BLACK,
+        leading=18,
+    )
 
     faqs = [
         (
@@ -1631,94 +3484,41 @@ def build_brochure(output_path: Path) -> bytes:
         ),
     ]
 
-    question_leading = 16.0
-    answer_leading = 16.0
-    current_y = 620.0
+    faq_nodes: List[LayoutNode] = []
     for question, answer in faqs:
-        question_lines = wrapped_lines([question], width=430, font="F2", size=13)
-        if question_lines:
-            faq_commands.append(
-                text_block(
-                    70,
-                    current_y,
-                    question_lines,
-                    font="F2",
-                    size=13,
-                    color=DEEP_BLUE,
-                    leading=question_leading,
-                )
-            )
-            current_y -= _estimate_text_height(len(question_lines), 13, question_leading) + 6
-
-        answer_lines = wrapped_lines([answer], width=430, font="F1", size=11)
-        if answer_lines:
-            faq_commands.append(
-                text_block(
-                    70,
-                    current_y,
-                    answer_lines,
+        faq_nodes.append(
+            TextNode([question], font="F2", size=13, color=DEEP_BLUE, leading=16, wrap_width=430, keep_with_next=True)
+        )
+        faq_nodes.append(TextNode([answer], font="F1", size=11, color=BLACK, leading=16, wrap_width=430, gap_before=6.0))
+    faq_nodes.append(
+        PanelNode(
+            [
+                TextNode(
+                    tidy_paragraphs(
+                        [
+                            """
+                            Need more detail? Email info@aktonz.com for tailored guidance or to access the Aktonz landlord knowledge base.
+                            """
+                        ]
+                    ),
                     font="F1",
                     size=11,
                     color=BLACK,
-                    leading=answer_leading,
+                    leading=16,
                 )
-            )
-            current_y -= _estimate_text_height(len(answer_lines), 11, answer_leading) + 18
-
-    cta_panel_width = 455.0
-    cta_padding = 18.0
-    cta_leading = 16.0
-    faq_cta_text = tidy_paragraphs(
-        [
-            """
-            Need more detail? Email info@aktonz.com for tailored guidance or to access the Aktonz landlord knowledge base.
-            """
-        ]
-    )
-    faq_cta_lines = wrapped_lines(
-        faq_cta_text,
-        width=cta_panel_width - 2 * cta_padding,
-        font="F1",
-        size=11,
-    )
-    cta_start = max(current_y, 240.0)
-    faq_cta_background = text_panel_background(
-        70,
-        cta_start,
-        cta_panel_width,
-        faq_cta_lines,
-        size=11,
-        leading=cta_leading,
-        padding_top=16,
-        padding_bottom=20,
-        fill_color=PALE_BLUE,
-    )
-    if faq_cta_background:
-        faq_commands.append(faq_cta_background)
-    if faq_cta_lines:
-        faq_commands.append(
-            text_block(
-                70 + cta_padding,
-                cta_start,
-                faq_cta_lines,
-                font="F1",
-                size=11,
-                color=BLACK,
-                leading=cta_leading,
-            )
+            ],
+            fill_color=PALE_BLUE,
+            padding_side=18.0,
+            padding_top=16.0,
+            padding_bottom=20.0,
+            # The panel background rises above the text baseline, leaving 18pt after the last answer's baseline gap.
+            gap_before=2.0,
         )
-    faq_commands.append(footer(8))
-    page_contents.append("\n".join(faq_commands))
+    )
 
     # Page 9 - London area showcase
-    area_commands: List[str] = [
-        page_background(),
-        header("London area showcase", "On-the-ground expertise across prime districts"),
-    ]
-
     area_specs = [
         (
-            70.0,
             "Canary Wharf",
             [
                 """
@@ -1728,7 +3528,6 @@ def build_brochure(output_path: Path) -> bytes:
             ],
         ),
         (
-            232.0,
             "Shoreditch",
             [
                 """
@@ -1738,7 +3537,6 @@ def build_brochure(output_path: Path) -> bytes:
             ],
         ),
         (
-            394.0,
             "Hackney",
             [
                 """
@@ -1748,34 +3546,125 @@ def build_brochure(output_path: Path) -> bytes:
             ],
         ),
     ]
+    areas: List[LayoutNode] = [
+        RowNode(
+            [area_card_node(title, description, fill_color=PALE_BLUE) for title, description in area_specs],
+            gap=17.5,
+        ),
+        TextNode(
+            tidy_paragraphs(
+                [
+                    """
+                    Beyond the East, Aktonz covers the City fringe, Greenwich Riverside and North London villages. Marketing
+                    narratives are tailored to each micro-market to attract the ideal tenant profile quickly.
+                    """
+                ]
+            ),
+            font="F1",
+            size=11,
+            color=BLACK,
+            leading=16,
+            wrap_width=430,
+        ),
+    ]
+
+    return BrochureTree(
+        cover=cover,
+        introduction=introduction,
+        services=services,
+        comparison=[comparison_table, comparison_summary],
+        pricing=pricing,
+        addons=addons,
+        testimonials=testimonials,
+        faq_intro=faq_intro,
+        faq=faq_nodes,
+        areas=areas,
+    )
+
+
+def brochure_pages() -> Iterator[str]:
+    """Lay out the marketing brochure one page at a time, yielding each content stream when it is ready."""
+
+    tree = brochure_tree()
+
+    # Page 1 - Cover
+    yield tree.cover.content()
+    number = 1
+
+    # Page 2 - Company introduction (flows onto a continuation page if the copy grows)
+    number = yield from _flowed_pages(
+        flow_pages(tree.introduction, first_frame=Frame(70, 700, 455), default_gap=14.0),
+        title="Aktonz Lettings",
+        subtitle="Modern letting agents with London roots",
+        first_number=number + 1,
+    )
+
+    # Page 3 - Landlord services overview
+    number = yield from _flowed_pages(
+        flow_pages(tree.services, first_frame=SERVICES_FRAME, next_frame=Frame(70, 700, 455), default_gap=24.0),
+        title="Service pathways",
+        subtitle="Flexible coverage that matches your involvement",
+        first_number=number + 1,
+    )
+
+    # Page 4 - Comparison table (continues onto further pages if the schedule grows)
+    number = yield from _flowed_pages(
+        flow_pages(tree.comparison, first_frame=Frame(70, 690, 455)),
+        title="Service comparison",
+        subtitle="At-a-glance features across each pathway",
+        continued_subtitle="At-a-glance features (continued)",
+        first_number=number + 1,
+    )
 
-    card_top = 700.0
-    card_width = 140.0
-    for x, title, description in area_specs:
-        card_commands, _ = area_card(x, card_top, card_width, title, description, fill_color=PALE_BLUE)
-        area_commands.extend(card_commands)
+    # Page 5 - Pricing & fees (the fee notes follow the tallest card)
+    number = yield from _flowed_pages(
+        flow_pages(tree.pricing, first_frame=Frame(70, 670, 455), next_frame=Frame(70, 690, 455), default_gap=24.0),
+        title="Transparent pricing",
+        subtitle="Clear fees aligned with your objectives",
+        first_number=number + 1,
+    )
 
-    area_commands.append(
-        wrapped_text_block(
-            70,
-            520,
-            tidy_paragraphs(
-                [
-                    """
-                    Beyond the East, Aktonz covers the City fringe, Greenwich Riverside and North London villages. Marketing
-                    narratives are tailored to each micro-market to attract the ideal tenant profile quickly.
-                    """
-                ]
-            ),
-            width=430,
-            font="F1",
-            size=11,
-            color=BLACK,
-            leading=16,
-        )
+    # Page 6 - Add-on services
+    addons_page = PageNode(
+        [(70, 700, 455, tree.addons)],
+        title="Add-on services",
+        subtitle="Optional extras that keep tenancies compliant",
+        number=number + 1,
+    )
+    number += 1
+    yield addons_page.content()
+
+    # Page 7 - Testimonials
+    testimonials_page = PageNode(
+        [(70, 700, 455, tree.testimonials)],
+        title="Landlords rate Aktonz 4.9/5",
+        subtitle="Social proof from across London",
+        number=number + 1,
+    )
+    number += 1
+    yield testimonials_page.content()
+
+    # Page 8 - FAQ (flows onto continuation pages if the answers outgrow one page)
+    number = yield from _flowed_pages(
+        flow_pages(
+            tree.faq,
+            first_frame=Frame(70, 620, 455),
+            next_frame=Frame(70, 690, 455),
+            default_gap=18.0,
+        ),
+        title="FAQs & guidance",
+        subtitle="Answering common landlord questions",
+        first_number=number + 1,
+        first_page_extras=[(70, 680, 430, tree.faq_intro)],
+    )
+
+    # Page 9 - London area showcase (the coverage note follows the tallest card)
+    number = yield from _flowed_pages(
+        flow_pages(tree.areas, first_frame=Frame(70, 700, 455), next_frame=Frame(70, 690, 455), default_gap=28.0),
+        title="London area showcase",
+        subtitle="On-the-ground expertise across prime districts",
+        first_number=number + 1,
     )
-    area_commands.append(footer(9))
-    page_contents.append("\n".join(area_commands))
 
     # Page 10 - Contact
     contact_commands: List[str] = [
@@ -1800,30 +3689,7 @@ def build_brochure(output_path: Path) -> bytes:
             leading=18,
         ),
     ]
-    card_specs = [
-        (
-            70.0,
-            600.0,
-            212.0,
-            "Speak to the lettings team",
-            [
-                ("Phone", "0203 389 8009"),
-                ("Email", "info@aktonz.com"),
-                ("Website", "www.aktonz.com"),
-            ],
-        ),
-        (
-            313.0,
-            600.0,
-            212.0,
-            "Stay connected",
-            [
-                ("Office hours", "Mon-Fri 9am-7pm | Sat 10am-4pm | Sun by appointment"),
-                ("Social", "LinkedIn & Instagram @Aktonz"),
-                ("Meetings", "In-person consultations available across London zones 1-3"),
-            ],
-        ),
-    ]
+    card_specs = [(x, 600.0, 212.0, title, sections) for x, (title, sections) in zip((70.0, 313.0), CONTACT_CARDS)]
     card_bottoms: List[float] = []
     for x, top, width, title, sections in card_specs:
         card_cmds, bottom = contact_card(x, top, width, title, sections)
@@ -1872,48 +3738,1059 @@ def build_brochure(output_path: Path) -> bytes:
                 leading=cta_leading,
             )
         )
-    contact_commands.append(footer(10))
-    page_contents.append("\n".join(contact_commands))
+    contact_commands.append(footer(number + 1))
+    number += 1
+    yield "\n".join(contact_commands)
 
-    page_streams: List[int] = []
-    page_objects: List[int] = []
 
-    for content in page_contents:
-        stream_obj = builder.add_object(make_stream(content))
-        page_streams.append(stream_obj)
-        page_objects.append(builder.reserve_object())
+def brochure_chunks() -> Iterator[bytes]:
+    """Stream the marketing brochure, each page's objects leaving as soon as the page is laid out."""
 
-    for page_obj, content_obj in zip(page_objects, page_streams):
-        builder.set_object(
-            page_obj,
-            f"<< /Type /Page /Parent {pages_obj} 0 R /MediaBox {media_box} /Resources {resource_dict} /Contents {content_obj} 0 R >>\n".encode(
-                "ascii"
+    reset_font_usage()
+    yield from stream_document(start_document(), brochure_pages())
+    report_unmappable_characters()
+
+
+def brochure_document() -> PDFBuilder:
+    """Lay out every page of the marketing brochure into a ready-to-serialise builder."""
+
+    reset_font_usage()
+    builder = complete_document(start_document(), brochure_pages())
+    report_unmappable_characters()
+    return builder
+
+
+# --- Output sinks ---------------------------------------------------------
+
+# A multiple of 3, so every piece but the last encodes without padding.
+BASE64_CHUNK_SIZE = 3 * 16 * 1024
+INLINE_MODULE_PREFIX = b"export const brochurePdfBase64 = `"
+INLINE_MODULE_SUFFIX = b"`;\n"
+LINK_MODES = ("hardlink", "reflink")
+# Linux ioctl that shares the source file's extents (btrfs, XFS) instead of copying them.
+FICLONE = 0x40049409
+
+
+def _temporary_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _file_matches(path: Path, size: int, digest: str) -> bool:
+    """Whether ``path`` already holds ``size`` bytes hashing to ``digest``; the size check avoids most reads."""
+
+    try:
+        if path.stat().st_size != size:
+            return False
+        existing = hashlib.sha256()
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 16), b""):
+                existing.update(block)
+    except FileNotFoundError:
+        return False
+    return existing.hexdigest() == digest
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    temporary = _temporary_path(path)
+    temporary.write_bytes(data)
+    temporary.replace(path)
+    return True
+
+
+def _write_checksum(path: Path, digest: str) -> None:
+    _write_if_changed(path.with_name(f"{path.name}.sha256"), f"{digest}  {path.name}\n".encode("ascii"))
+
+
+def _reflink(source: Path, target: Path) -> None:
+    try:
+        import fcntl
+    except ImportError as error:
+        raise OSError("reflinks are not supported on this platform") from error
+    with source.open("rb") as source_handle, target.open("wb") as target_handle:
+        fcntl.ioctl(target_handle.fileno(), FICLONE, source_handle.fileno())
+
+
+class OutputSink:
+    """A destination :func:`publish` streams the PDF into.
+
+    ``close`` receives the total size and SHA-256 of the stream and returns
+    whether the destination changed. Sinks with a ``label`` are reported on.
+    """
+
+    label: Optional[str] = None
+
+    def open(self) -> None:
+        pass
+
+    def write(self, chunk: bytes) -> None:
+        pass
+
+    def close(self, size: int, digest: str) -> bool:
+        raise NotImplementedError
+
+    def abort(self) -> None:
+        pass
+
+
+class FileSink(OutputSink):
+    """Write ``path`` through a temporary file, leaving it untouched when the contents match.
+
+    With ``checksum`` a ``<name>.sha256`` sidecar in ``sha256sum`` format is kept
+    next to the file; the digest doubles as a strong ETag for CDN revalidation.
+    """
+
+    def __init__(self, path: Path, *, checksum: bool = False) -> None:
+        self.path = path
+        self.label = str(path)
+        self.checksum = checksum
+        self._temporary = _temporary_path(path)
+        self._handle = None
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self._temporary.open("wb")
+
+    def write(self, chunk: bytes) -> None:
+        self._handle.write(chunk)
+
+    def close(self, size: int, digest: str) -> bool:
+        self._handle.close()
+        self._handle = None
+        changed = not _file_matches(self.path, size, digest)
+        if changed:
+            self._temporary.replace(self.path)
+        else:
+            self._temporary.unlink()
+        if self.checksum:
+            _write_checksum(self.path, digest)
+        return changed
+
+    def abort(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._temporary.unlink(missing_ok=True)
+
+
+class LinkSink(OutputSink):
+    """Give ``source``'s finished file a second name instead of writing the bytes again.
+
+    ``mode`` is ``"hardlink"`` or ``"reflink"``; either falls back to a plain
+    copy when the filesystem cannot link. ``source`` must be published before
+    this sink. Replacing the source atomically never alters a hard-linked copy.
+    """
+
+    def __init__(self, path: Path, source: FileSink, *, mode: str = "hardlink", checksum: bool = False) -> None:
+        if mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode {mode!r}; expected one of {', '.join(LINK_MODES)}")
+        self.path = path
+        self.label = str(path)
+        self.source = source
+        self.mode = mode
+        self.checksum = checksum
+
+    def close(self, size: int, digest: str) -> bool:
+        if self.checksum:
+            _write_checksum(self.path, digest)
+        if self.path.exists() and os.path.samefile(self.path, self.source.path):
+            return False
+        if _file_matches(self.path, size, digest):
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = _temporary_path(self.path)
+        try:
+            if self.mode == "hardlink":
+                os.link(self.source.path, temporary)
+            else:
+                _reflink(self.source.path, temporary)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+            shutil.copyfile(self.source.path, temporary)
+        temporary.replace(self.path)
+        return True
+
+
+class Base64ModuleSink(OutputSink):
+    """Write the base64 module ``ensure_lettings_brochure.mjs`` falls back to.
+
+    The PDF is encoded in ``BASE64_CHUNK_SIZE`` pieces straight into a temporary
+    file while being compared with the existing module, which is left untouched
+    when nothing changed so watchers and bundlers are not retriggered. The
+    module's entry in ``data/embedded-assets.json`` is kept in step with it.
+    """
+
+    def __init__(self, path: Path = INLINE_MODULE_OUTPUT) -> None:
+        self.path = path
+        self.label = str(path)
+        self._temporary = _temporary_path(path)
+        self._handle = None
+        self._existing = None
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self._temporary.open("wb")
+        self._existing = self.path.open("rb") if self.path.exists() else None
+        self._identical = self._existing is not None
+        self._pending = b""
+        self._emit(INLINE_MODULE_PREFIX)
+
+    def _emit(self, piece: bytes) -> None:
+        self._handle.write(piece)
+        if self._identical and self._existing.read(len(piece)) != piece:
+            self._identical = False
+
+    def write(self, chunk: bytes) -> None:
+        data = memoryview(self._pending + chunk if self._pending else chunk)
+        whole = len(data) - len(data) % BASE64_CHUNK_SIZE
+        for start in range(0, whole, BASE64_CHUNK_SIZE):
+            self._emit(base64.b64encode(data[start : start + BASE64_CHUNK_SIZE]))
+        self._pending = bytes(data[whole:])
+
+    def close(self, size: int, digest: str) -> bool:
+        if self._pending:
+            self._emit(base64.b64encode(self._pending))
+        self._emit(INLINE_MODULE_SUFFIX)
+        identical = self._identical and not self._existing.read(1)
+        self._release()
+        embedded_assets.record_asset(self.path, size=size, sha256=digest)
+        if identical:
+            self._temporary.unlink()
+            return False
+        self._temporary.replace(self.path)
+        return True
+
+    def abort(self) -> None:
+        self._release()
+        self._temporary.unlink(missing_ok=True)
+
+    def _release(self) -> None:
+        for handle in (self._handle, self._existing):
+            if handle is not None:
+                handle.close()
+        self._handle = self._existing = None
+
+
+class StdoutSink(OutputSink):
+    """Stream the PDF to standard output (or ``stream``), e.g. for piping into another tool."""
+
+    def __init__(self, stream=None) -> None:
+        self.stream = stream
+
+    def open(self) -> None:
+        self._stream = self.stream if self.stream is not None else sys.stdout.buffer
+
+    def write(self, chunk: bytes) -> None:
+        self._stream.write(chunk)
+
+    def close(self, size: int, digest: str) -> bool:
+        self._stream.flush()
+        return True
+
+
+class MemorySink(OutputSink):
+    """Collect the PDF; the bytes are available as ``data`` once published."""
+
+    data = b""
+
+    def open(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def write(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+
+    def close(self, size: int, digest: str) -> bool:
+        self.data = b"".join(self._chunks)
+        self._chunks = []
+        return True
+
+
+def publish(chunks: Iterable[bytes], sinks: Sequence[OutputSink]) -> Tuple[str, List[bool]]:
+    """Stream ``chunks`` once into every sink, hashing as they pass.
+
+    Returns the SHA-256 of the stream and, per sink, whether it changed. If
+    producing the chunks fails, every sink discards its partial output; if a
+    sink fails to close, it and every sink after it discard theirs.
+    """
+
+    digest = hashlib.sha256()
+    size = 0
+    opened: List[OutputSink] = []
+    try:
+        for sink in sinks:
+            sink.open()
+            opened.append(sink)
+        for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+            for sink in sinks:
+                sink.write(chunk)
+    except BaseException:
+        for sink in opened:
+            sink.abort()
+        raise
+    hexdigest = digest.hexdigest()
+    changed: List[bool] = []
+    try:
+        for sink in sinks:
+            changed.append(sink.close(size, hexdigest))
+    finally:
+        for sink in sinks[len(changed) :]:
+            sink.abort()
+    return hexdigest, changed
+
+
+def brochure_sinks(
+    output: Optional[Path],
+    *,
+    public_output: Optional[Path] = None,
+    public_link: Optional[str] = None,
+    inline_module: Optional[Path] = None,
+    checksum: bool = False,
+    stdout: bool = False,
+) -> List[OutputSink]:
+    """The sinks for one marketing brochure run; ``public_link`` links the public copy to ``output``."""
+
+    sinks: List[OutputSink] = []
+    primary: Optional[FileSink] = None
+    if output is not None:
+        primary = FileSink(output, checksum=checksum)
+        sinks.append(primary)
+    if public_output is not None:
+        if public_link is not None and primary is not None:
+            sinks.append(LinkSink(public_output, primary, mode=public_link, checksum=checksum))
+        else:
+            sinks.append(FileSink(public_output, checksum=checksum))
+    if inline_module is not None:
+        sinks.append(Base64ModuleSink(inline_module))
+    if stdout:
+        sinks.append(StdoutSink())
+    return sinks
+
+
+def publish_brochure(sinks: Sequence[OutputSink], *, log=None) -> str:
+    """Render the marketing brochure once into ``sinks``, reporting each labelled one."""
+
+    digest, changed = publish(brochure_chunks(), sinks)
+    for sink, updated in zip(sinks, changed):
+        if sink.label is not None:
+            print(f"Wrote {sink.label}" if updated else f"{sink.label} is up to date", file=log or sys.stdout)
+    return digest
+
+
+# --- Listing brochures ---------------------------------------------------
+
+LISTINGS_OUTPUT_DIR = Path("public/brochures/listings")
+LISTINGS_BUNDLE_OUTPUT = Path("public/brochures/aktonz-listings-bundle.pdf")
+LISTING_STATUS_LABELS = {
+    "available": "Available",
+    "pending": "Coming soon",
+    "under_offer": "Under offer",
+    "let_agreed": "Let agreed",
+    "sold_stc": "Sold subject to contract",
+}
+RENT_FREQUENCY_SUFFIXES = {"W": "pw", "M": "pcm", "Q": "pq", "Y": "pa"}
+EPC_BANDS = ((92, "A"), (81, "B"), (69, "C"), (55, "D"), (39, "E"), (21, "F"), (1, "G"))
+
+
+class SharedResources(NamedTuple):
+    """Pages and glyph usage shared by every listing brochure in a run."""
+
+    static_pages: Tuple[str, ...]
+    font_usage: dict
+
+
+def prepare_shared_resources() -> SharedResources:
+    """Render the pages every listing brochure ends with, once per run.
+
+    Static pages are stored without their footer so they can follow listings of
+    any length. Call this after fonts and kerning are configured.
+    """
+
+    reset_font_usage()
+    _logo_objects()
+    viewing_commands: List[str] = [
+        page_background(),
+        header("Arrange a viewing", "Speak to the Aktonz lettings team", include_logo=False),
+        draw_logo(390, 730, 130),
+        wrapped_text_block(
+            70,
+            660,
+            tidy_paragraphs(
+                [
+                    """
+                    Our local team can show you around, answer questions about the area and guide you through
+                    referencing, deposits and move-in day. Get in touch to book a time that suits you.
+                    """
+                ]
             ),
-        )
+            width=430,
+            font="F1",
+            size=12,
+            color=BLACK,
+            leading=18,
+        ),
+    ]
+    for x, (title, sections) in zip((70.0, 313.0), CONTACT_CARDS):
+        card_commands, _ = contact_card(x, 600.0, 212.0, title, sections)
+        viewing_commands.extend(card_commands)
+    return SharedResources(("\n".join(viewing_commands),), font_usage())
+
+
+def load_listings(path: Path = LISTINGS_PATH) -> List[dict]:
+    """Return the listings that should have a brochure (archived ones are skipped)."""
+
+    listings = json.loads(path.read_text(encoding="utf-8"))
+    return [listing for listing in listings if not listing.get("archived")]
+
+
+def listing_filename(listing: dict) -> str:
+    return f"aktonz-listing-{listing['id']}.pdf"
+
+
+def _format_date(value: Optional[str]) -> Optional[str]:
+    """Format an ISO date (or timestamp) as ``5 Jan 2024``; anything unparseable counts as missing."""
+
+    if not value:
+        return None
+    try:
+        date = datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+    months = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+    return f"{date.day} {months[date.month - 1]} {date.year}"
 
-    kids = "[" + " ".join(f"{obj} 0 R" for obj in page_objects) + "]"
-    builder.set_object(
-        pages_obj,
-        f"<< /Type /Pages /Kids {kids} /Count {len(page_objects)} /MediaBox {media_box} >>\n".encode("ascii"),
+
+def _humanise(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    return value.replace("_", " ").capitalize()
+
+
+def _listing_price(listing: dict) -> Tuple[str, str]:
+    """Return the pricing card title and the formatted price."""
+
+    is_sale = listing.get("transactionType") == "sale"
+    title = "Guide price" if is_sale else "Rent"
+    try:
+        amount = float(listing.get("price") or 0)
+    except ValueError:
+        amount = 0.0
+    if amount <= 0 or listing.get("showPrice") is False:
+        return title, "Price on application"
+    price = f"£{amount:,.0f}"
+    suffix = RENT_FREQUENCY_SUFFIXES.get(listing.get("rentFrequency") or "")
+    if suffix and not is_sale:
+        price = f"{price} {suffix}"
+    return title, price
+
+
+def _listing_availability(listing: dict) -> Optional[str]:
+    status = listing.get("status") or ""
+    if status == "available":
+        available_from = _format_date(listing.get("dateAvailableFrom"))
+        return f"Available from {available_from}" if available_from else "Available now"
+    return LISTING_STATUS_LABELS.get(status) or _humanise(status)
+
+
+def _epc_score(value: object) -> Optional[int]:
+    """The export's EPC score as an int (it may arrive as a string); ``None`` when it is not a number."""
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _epc_band(score: Optional[int]) -> Optional[str]:
+    for threshold, band in EPC_BANDS:
+        if score and score >= threshold:
+            return band
+    return None
+
+
+def _listing_epc(listing: dict) -> str:
+    if listing.get("epcExempt"):
+        return "This property is exempt from EPC requirements."
+    current_score = _epc_score(listing.get("epcEeCurrent"))
+    current = _epc_band(current_score)
+    if current is None:
+        return "EPC rating available on request."
+    potential_score = _epc_score(listing.get("epcEePotential"))
+    potential = _epc_band(potential_score)
+    rating = f"Current rating {current} ({current_score})"
+    if potential is not None:
+        rating += f", potential {potential} ({potential_score})"
+    return rating + "."
+
+
+def _listing_facts(listing: dict) -> List[str]:
+    facts: List[str] = []
+    bedrooms = listing.get("bedrooms")
+    if bedrooms:
+        facts.append(f"{bedrooms} bedroom" + ("s" if bedrooms != 1 else ""))
+    bathrooms = listing.get("bathrooms")
+    if bathrooms:
+        facts.append(f"{bathrooms} bathroom" + ("s" if bathrooms != 1 else ""))
+    for label in (_humanise(listing.get("propertyType")), _humanise(listing.get("furnished"))):
+        if label:
+            facts.append(label)
+    photos = len(listing.get("images") or [])
+    if photos:
+        facts.append(f"{photos} photo" + ("s" if photos != 1 else "") + " online at aktonz.com")
+    return facts
+
+
+def _listing_paragraphs(listing: dict) -> List[str]:
+    text = listing.get("description") or listing.get("summary") or ""
+    return [tidy_text(chunk) for chunk in text.replace("\r\n", "\n").split("\n") if chunk.strip()]
+
+
+def listing_title(listing: dict) -> Tuple[str, Optional[str]]:
+    """The header title and subtitle for a listing, split from its display address."""
+
+    address = [part.strip() for part in (listing.get("displayAddress") or "").split(",") if part.strip()]
+    return (address[0] if address else f"Listing {listing['id']}"), (", ".join(address[1:]) or None)
+
+
+def listing_pages(
+    listing: dict,
+    resources: SharedResources,
+    *,
+    first_page: int = 1,
+    include_static: bool = True,
+) -> List[str]:
+    """Content streams for one listing brochure, ending with the shared static pages.
+
+    ``first_page`` numbers the footers when the pages are part of a bundle.
+    """
+
+    title, subtitle = listing_title(listing)
+
+    panel_commands, panel_bottom = stacked_panel(
+        70,
+        690,
+        265,
+        [
+            {"lines": ["Key facts"], "font": "F2", "size": 16, "color": DEEP_BLUE, "leading": 18},
+            {
+                "lines": wrapped_bullets(_listing_facts(listing), width=229, font="F1", size=11),
+                "size": 11,
+                "leading": 15,
+                "gap_before": 12,
+            },
+            {"lines": ["Energy performance"], "font": "F2", "size": 13, "color": DEEP_BLUE, "leading": 16},
+            {
+                "lines": wrapped_lines([_listing_epc(listing)], width=229, font="F1", size=11),
+                "size": 11,
+                "leading": 15,
+                "gap_before": 8,
+            },
+        ],
+    )
+    price_title, price = _listing_price(listing)
+    card_commands, card_bottom = pricing_card(
+        355,
+        690,
+        170,
+        price_title,
+        price,
+        tidy_items(listing.get("bullets") or []),
+        price_note=_listing_availability(listing),
     )
 
-    catalog_obj = builder.add_object(
-        f"<< /Type /Catalog /Pages {pages_obj} 0 R >>\n".encode("ascii")
+    description_nodes: List[LayoutNode] = []
+    paragraphs = _listing_paragraphs(listing)
+    if paragraphs:
+        description_nodes.append(
+            TextNode(["About this home"], font="F2", size=16, color=DEEP_BLUE, leading=20, keep_with_next=True)
+        )
+        description_nodes.extend(
+            # Lead-in lines ("Please note:") stay with the paragraph they introduce.
+            TextNode(
+                [paragraph],
+                font="F1",
+                size=11,
+                color=BLACK,
+                leading=16,
+                gap_before=8.0,
+                keep_with_next=paragraph.endswith(":"),
+            )
+            for paragraph in paragraphs
+        )
+    flowed = flow_pages(
+        description_nodes,
+        first_frame=Frame(70, min(panel_bottom, card_bottom) - 40, 455),
+        next_frame=Frame(70, 690, 455),
+        default_gap=18.0,
     )
-    builder.set_root(catalog_obj)
 
-    pdf_bytes = builder.build()
+    pages: List[str] = []
+    for index, placements in enumerate(flowed):
+        if index == 0:
+            commands = [page_background(), header(title, subtitle), *panel_commands, *card_commands]
+        else:
+            commands = [page_background(), header(title, f"{subtitle or title} (continued)")]
+        for x, top, width, node in placements:
+            commands.extend(node.render(x, top, width))
+        commands.append(footer(first_page + len(pages)))
+        pages.append("\n".join(commands))
+    if include_static:
+        for static_page in resources.static_pages:
+            pages.append(f"{static_page}\n{footer(first_page + len(pages))}")
+    return pages
+
+
+def listing_document(listing: dict, resources: SharedResources) -> PDFBuilder:
+    reset_font_usage(resources.font_usage)
+    document = start_document()
+    return complete_document(document, listing_pages(listing, resources))
+
+
+def listing_chunks(listing: dict, resources: SharedResources) -> Iterator[bytes]:
+    """Stream one listing brochure; see :func:`stream_document`."""
+
+    reset_font_usage(resources.font_usage)
+    yield from stream_document(start_document(), listing_pages(listing, resources))
+
+
+def build_listing_brochure(listing: dict, resources: SharedResources) -> bytes:
+    return listing_document(listing, resources).build()
+
+
+def build_listing_brochures(
+    listings: Iterable[dict],
+    output_dir: Path,
+    *,
+    resources: Optional[SharedResources] = None,
+) -> List[Path]:
+    """Write one brochure per listing into ``output_dir``, sharing per-run resources."""
+
+    if resources is None:
+        resources = prepare_shared_resources()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written: List[Path] = []
+    for listing in listings:
+        path = output_dir / listing_filename(listing)
+        path.write_bytes(build_listing_brochure(listing, resources))
+        written.append(path)
+    report_unmappable_characters()
+    return written
+
+
+def bundle_document(listings: Iterable[dict], resources: SharedResources) -> PDFBuilder:
+    """Every listing in one document, with a bookmark per listing.
+
+    Fonts, the logo and the resource dictionary are written once and shared by
+    every page, and the static pages appear once at the end rather than after
+    each listing, so the bundle only grows with each listing's own pages.
+    """
+
+    reset_font_usage(resources.font_usage)
+    document = start_document()
+    pages: List[str] = []
+    outline: List[Tuple[str, int]] = []
+    for listing in listings:
+        title, subtitle = listing_title(listing)
+        outline.append((f"{title}, {subtitle}" if subtitle else title, len(pages)))
+        pages.extend(listing_pages(listing, resources, first_page=len(pages) + 1, include_static=False))
+    if not outline:
+        raise ValueError("No listings to bundle")
+    for static_page in resources.static_pages:
+        pages.append(f"{static_page}\n{footer(len(pages) + 1)}")
+    return complete_document(document, pages, outline=outline)
+
+
+def build_listing_bundle(
+    listings: Iterable[dict],
+    output_path: Path,
+    *,
+    resources: Optional[SharedResources] = None,
+) -> bytes:
+    """Write every listing into one PDF at ``output_path``."""
+
+    if resources is None:
+        resources = prepare_shared_resources()
+    pdf_bytes = bundle_document(listings, resources).build()
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_bytes(pdf_bytes)
+    report_unmappable_characters()
     return pdf_bytes
 
 
+# --- Worker mode ----------------------------------------------------------
+
+# JSON-RPC 2.0 error codes.
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_RENDER_ERROR = -32000
+
+_WORKER_STATE: dict = {}
+
+
+def _worker_resources() -> SharedResources:
+    resources = _WORKER_STATE.get("resources")
+    if resources is None:
+        resources = _WORKER_STATE["resources"] = prepare_shared_resources()
+    return resources
+
+
+def _worker_listings(path: Path) -> dict:
+    """Listings by id, re-read only when the export changes on disk."""
+
+    stamp = (path, path.stat().st_mtime_ns)
+    if _WORKER_STATE.get("listings_stamp") != stamp:
+        _WORKER_STATE["listings"] = {str(listing["id"]): listing for listing in load_listings(path)}
+        _WORKER_STATE["listings_stamp"] = stamp
+    return _WORKER_STATE["listings"]
+
+
+def _rpc_build_brochure(params: dict) -> dict:
+    output = Path(params.get("output") or DEFAULT_OUTPUT)
+    public_output = params.get("public_output")
+    started = time.perf_counter()
+    sinks = brochure_sinks(output, public_output=Path(public_output) if public_output else None)
+    digest, changed = publish(brochure_chunks(), sinks)
+    return {
+        "paths": [sink.label for sink in sinks],
+        "changed": [sink.label for sink, updated in zip(sinks, changed) if updated],
+        "bytes": output.stat().st_size,
+        "sha256": digest,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def _rpc_build_listing(params: dict) -> dict:
+    listing = params.get("listing")
+    if listing is None:
+        listing_id = params.get("id")
+        if listing_id is None:
+            raise ValueError("build_listing needs an 'id' or a 'listing'")
+        listings = _worker_listings(Path(params.get("listings") or LISTINGS_PATH))
+        listing = listings.get(str(listing_id))
+        if listing is None:
+            raise LookupError(f"Unknown listing: {listing_id}")
+    output_dir = Path(params.get("output_dir") or LISTINGS_OUTPUT_DIR)
+    started = time.perf_counter()
+    pdf_bytes = build_listing_brochure(listing, _worker_resources())
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / listing_filename(listing)
+    path.write_bytes(pdf_bytes)
+    report_unmappable_characters()
+    return {"path": str(path), "bytes": len(pdf_bytes), "seconds": time.perf_counter() - started}
+
+
+RPC_METHODS: dict = {
+    "ping": lambda params: {"pid": os.getpid()},
+    "build_brochure": _rpc_build_brochure,
+    "build_listing": _rpc_build_listing,
+}
+
+
+def _rpc_response(request_id: object, *, result: object = None, error: Optional[Tuple[int, str]] = None) -> str:
+    response: dict = {"jsonrpc": "2.0", "id": request_id}
+    if error is not None:
+        response["error"] = {"code": error[0], "message": error[1]}
+    else:
+        response["result"] = result
+    return json.dumps(response)
+
+
+def serve_worker(stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """Answer line-delimited JSON-RPC 2.0 requests until ``shutdown`` or EOF.
+
+    The process keeps the decoded logo, font metrics, subsets and rendered
+    static pages between requests, so each render only pays for its own pages.
+    Diagnostics go to stderr; stdout carries nothing but responses.
+    Notifications (requests without an ``id``) are run but never answered.
+    """
+
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            stdout.write(_rpc_response(None, error=(RPC_PARSE_ERROR, str(error))) + "\n")
+            stdout.flush()
+            continue
+        notification = isinstance(request, dict) and "id" not in request
+        request_id = request.get("id") if isinstance(request, dict) else None
+        method = request.get("method") if isinstance(request, dict) else None
+        params = (request.get("params") or {}) if isinstance(request, dict) else {}
+        if not isinstance(method, str) or not isinstance(params, dict):
+            response = _rpc_response(request_id, error=(RPC_INVALID_REQUEST, "Expected a method name and object params"))
+        elif method == "shutdown":
+            if not notification:
+                stdout.write(_rpc_response(request_id, result=True) + "\n")
+                stdout.flush()
+            return
+        elif method not in RPC_METHODS:
+            response = _rpc_response(request_id, error=(RPC_METHOD_NOT_FOUND, f"Unknown method: {method}"))
+        else:
+            try:
+                response = _rpc_response(request_id, result=RPC_METHODS[method](params))
+            except (ValueError, LookupError) as error:
+                response = _rpc_response(request_id, error=(RPC_INVALID_PARAMS, str(error)))
+            except Exception as error:  # keep serving after a failed render
+                response = _rpc_response(request_id, error=(RPC_RENDER_ERROR, f"{type(error).__name__}: {error}"))
+        if notification:
+            continue
+        stdout.write(response + "\n")
+        stdout.flush()
+
+
+# --- Watch mode -----------------------------------------------------------
+
+WATCH_INTERVAL = 1.0
+WATCH_DEBOUNCE = 0.5
+
+FileStamp = Optional[Tuple[int, int]]
+
+
+def _file_stamp(path: Path) -> FileStamp:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _wait_for_changes(stamps: dict, *, interval: float, debounce: float) -> List[Path]:
+    """Poll until a watched file changes, then wait for the burst of writes to settle."""
+
+    while True:
+        time.sleep(interval)
+        if any(_file_stamp(path) != stamp for path, stamp in stamps.items()):
+            break
+    settled = {path: _file_stamp(path) for path in stamps}
+    while True:
+        time.sleep(debounce)
+        latest = {path: _file_stamp(path) for path in stamps}
+        if latest == settled:
+            break
+        settled = latest
+    changed = [path for path, stamp in stamps.items() if settled[path] != stamp]
+    stamps.update(settled)
+    return changed
+
+
+def render_inputs() -> List[Path]:
+    """Every file besides the listings that the renderer reads: its code, metrics, logo and fonts."""
+
+    return [
+        Path(__file__).resolve(),
+        Path(generate_aktonz_logo.__file__).resolve(),
+        Path(embedded_assets.__file__).resolve(),
+        Path(logo_asset.__file__).resolve(),
+        logo_asset.PNG_PATH,
+        HELVETICA_METRICS_PATH,
+        *(font.path for font in EMBEDDED_FONTS.values()),
+    ]
+
+
+def _listing_versions(listings: Iterable[dict]) -> dict:
+    versions = {}
+    for listing in listings:
+        version = listing.get("updateMd5Hash") or hashlib.md5(
+            json.dumps(listing, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        versions[str(listing["id"])] = (version, listing)
+    return versions
+
+
+def watch(
+    *,
+    sinks: Sequence[OutputSink],
+    listings_input: Optional[Path],
+    listings_dir: Path,
+    interval: float = WATCH_INTERVAL,
+    debounce: float = WATCH_DEBOUNCE,
+) -> None:
+    """Rebuild outputs whenever their inputs change, until interrupted.
+
+    With ``listings_input`` only listings whose ``updateMd5Hash`` changed are
+    re-rendered (reusing the fonts and static pages held by this process) and
+    brochures of removed or archived listings are deleted. Otherwise the
+    marketing brochure is published to ``sinks``. Changes to any other
+    :func:`render_inputs` restart the process so the new copy and assets load.
+    """
+
+    restart_paths = render_inputs()
+    stamps = {path: _file_stamp(path) for path in restart_paths}
+
+    if listings_input is None:
+        publish_brochure(sinks)
+        versions: dict = {}
+    else:
+        stamps[listings_input] = _file_stamp(listings_input)
+        resources = prepare_shared_resources()
+        versions = _listing_versions(load_listings(listings_input))
+        written = build_listing_brochures((listing for _, listing in versions.values()), listings_dir, resources=resources)
+        print(f"Created {len(written)} listing brochures in {listings_dir}")
+
+    print("Watching for changes (Ctrl+C to stop)")
+    while True:
+        changed = _wait_for_changes(stamps, interval=interval, debounce=debounce)
+        if any(path in restart_paths for path in changed):
+            print("Generator or assets changed; restarting")
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+
+        try:
+            current = _listing_versions(load_listings(listings_input))
+        except ValueError as error:
+            print(f"Skipping unreadable {listings_input}: {error}", file=sys.stderr)
+            continue
+        updated = [listing for key, (version, listing) in current.items() if versions.get(key, (None,))[0] != version]
+        removed = [listing for key, (_, listing) in versions.items() if key not in current]
+        for listing in removed:
+            (listings_dir / listing_filename(listing)).unlink(missing_ok=True)
+        started = time.perf_counter()
+        build_listing_brochures(updated, listings_dir, resources=resources)
+        versions = current
+        print(
+            f"Re-rendered {len(updated)} and removed {len(removed)} listing brochures "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+
+
+# --- Benchmarks -----------------------------------------------------------
+
+
+def _raggedness(lines: Sequence[str], *, width: float, font: str, size: float) -> float:
+    """Sum of squared trailing slack in points across every line except the last.
+
+    Widths come from ``text_width``, so this is the quantity the total-fit search
+    minimises; overlong single-word lines carry no slack and are skipped.
+    """
+
+    total = 0.0
+    for line in lines[:-1]:
+        slack = width - text_width(line, font=font, size=size)
+        if slack >= 0:
+            total += slack * slack
+    return total
+
+
+def benchmark_wrapping(
+    pages: Sequence[Sequence[str]],
+    *,
+    width: float = 430,
+    font: str = "F1",
+    size: float = 11,
+    repeat: int = 20,
+) -> dict:
+    """Compare greedy and total-fit wrapping for speed and evenness of the right edge.
+
+    Both modes break on the Helvetica AFM advances for the run, so the reported
+    raggedness (squared slack in points) is measured the way the lines were set.
+    Total-fit never uses more lines than greedy; only the raggedness differs.
+    """
+
+    paragraph_count = sum(len(page) for page in pages)
+    report: dict = {"pages": len(pages), "paragraphs": paragraph_count}
+    previous = dict(KERNED_FONTS)
+    try:
+        enable_kerning(True)
+        for mode in WRAP_MODES:
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for page in pages:
+                    _wrap_text(page, width=width, font=font, size=size, mode=mode)
+            elapsed = time.perf_counter() - started
+
+            line_count = 0
+            raggedness = 0.0
+            for page in pages:
+                for paragraph in page:
+                    lines = _wrap_text([paragraph], width=width, font=font, size=size, mode=mode)
+                    line_count += len(lines)
+                    raggedness += _raggedness(lines, width=width, font=font, size=size)
+            report[mode] = {
+                "lines": line_count,
+                "raggedness": raggedness,
+                "ms_per_1000_paragraphs": elapsed * 1000 / max(repeat * paragraph_count, 1) * 1000,
+            }
+    finally:
+        KERNED_FONTS.clear()
+        KERNED_FONTS.update(previous)
+    return report
+
+
+def benchmark_kerning(
+    pages: Sequence[Sequence[str]],
+    *,
+    width: float = 430,
+    font: str = "F1",
+    size: float = 11,
+    repeat: int = 20,
+) -> dict:
+    """Measure the cost of kerned wrapping and ``TJ`` emission per thousand lines."""
+
+    paragraphs = [paragraph for page in pages for paragraph in page]
+    previous = dict(KERNED_FONTS)
+    report: dict = {"paragraphs": len(paragraphs)}
+    try:
+        for label, enabled in (("plain", False), ("kerned", True)):
+            enable_kerning(enabled)
+            line_count = 0
+            started = time.perf_counter()
+            for _ in range(repeat):
+                lines = _wrap_text(paragraphs, width=width, font=font, size=size)
+                text_block(0, 0, lines, font=font, size=size)
+                line_count += len(lines)
+            elapsed = time.perf_counter() - started
+            report[label] = {
+                "lines": line_count // repeat,
+                "ms_per_1000_lines": elapsed * 1000 / max(line_count, 1) * 1000,
+            }
+    finally:
+        KERNED_FONTS.clear()
+        KERNED_FONTS.update(previous)
+    return report
+
+
+def _listing_description_pages(path: Path = LISTINGS_PATH) -> List[List[str]]:
+    listings = json.loads(path.read_text(encoding="utf-8"))
+    pages: List[List[str]] = []
+    for listing in listings:
+        description = listing.get("description") or listing.get("summary") or ""
+        paragraphs = [tidy_text(chunk) for chunk in description.replace("\r\n", "\n").split("\n") if chunk.strip()]
+        if paragraphs:
+            pages.append(paragraphs)
+    return pages
+
+
+def print_wrapping_benchmark() -> None:
+    report = benchmark_wrapping(_listing_description_pages())
+    print(f"Wrapped {report['paragraphs']} paragraphs across {report['pages']} listing pages")
+    for mode in WRAP_MODES:
+        stats = report[mode]
+        print(
+            f"  {mode:<8} {stats['lines']:>5} lines  raggedness {stats['raggedness']:>10,.0f} pt²  "
+            f"{stats['ms_per_1000_paragraphs']:.2f} ms / 1000 paragraphs"
+        )
+
+
+def print_kerning_benchmark() -> None:
+    report = benchmark_kerning(_listing_description_pages())
+    print(f"Wrapped and set {report['paragraphs']} listing paragraphs")
+    for label in ("plain", "kerned"):
+        stats = report[label]
+        print(f"  {label:<7} {stats['lines']:>5} lines  {stats['ms_per_1000_lines']:.2f} ms / 1000 lines")
+    overhead = report["kerned"]["ms_per_1000_lines"] - report["plain"]["ms_per_1000_lines"]
+    print(f"  kerning cost: {overhead:.2f} ms / 1000 lines")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate the Aktonz lettings brochure PDF.")
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("docs/aktonz-lettings-brochure.pdf"),
+        default=DEFAULT_OUTPUT,
         help="Primary output path for the generated brochure (default: docs/aktonz-lettings-brochure.pdf).",
     )
     public_group = parser.add_mutually_exclusive_group()
@@ -1932,18 +4809,168 @@ if __name__ == "__main__":
     parser.add_argument(
         "--public-output",
         type=Path,
-        default=Path("public/brochures/aktonz-lettings-brochure.pdf"),
+        default=DEFAULT_PUBLIC_OUTPUT,
         help="Override the public brochure path when --public is supplied.",
     )
+    parser.add_argument(
+        "--public-link",
+        choices=LINK_MODES,
+        default=None,
+        help="Hard-link or reflink the public copy to --output instead of writing it again (falls back to a copy).",
+    )
+    parser.add_argument(
+        "--checksum",
+        action="store_true",
+        help="Keep a <name>.sha256 sidecar (sha256sum format, usable as a strong ETag) next to each PDF.",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Also stream the marketing brochure to standard output; progress messages go to stderr.",
+    )
+    for resource, option, style in (("F1", "--font-regular", "regular"), ("F2", "--font-bold", "bold"), ("F3", "--font-italic", "italic")):
+        parser.add_argument(
+            option,
+            dest=f"font_{resource}",
+            type=Path,
+            help=f"Embed this TrueType file (subset to the glyphs used) for {style} text instead of built-in Helvetica.",
+        )
+    parser.add_argument(
+        "--font-cache",
+        type=Path,
+        default=FONT_CACHE_DIR,
+        help=f"Directory for cached font metrics and subsets (default: {FONT_CACHE_DIR.relative_to(ROOT)}).",
+    )
+    parser.add_argument(
+        "--benchmark-wrapping",
+        action="store_true",
+        help="Compare greedy and optimal line breaking on listing descriptions instead of building the brochure.",
+    )
+    parser.add_argument(
+        "--listings",
+        action="store_true",
+        help="Build one brochure per listing in data/listings.json instead of the marketing brochure.",
+    )
+    parser.add_argument(
+        "--listings-input",
+        type=Path,
+        default=LISTINGS_PATH,
+        help="Listings export to read in --listings mode (default: data/listings.json).",
+    )
+    parser.add_argument(
+        "--listings-dir",
+        type=Path,
+        default=LISTINGS_OUTPUT_DIR,
+        help=f"Directory for per-listing brochures (default: {LISTINGS_OUTPUT_DIR}).",
+    )
+    inline_group = parser.add_mutually_exclusive_group()
+    inline_group.add_argument(
+        "--inline-module",
+        type=Path,
+        default=INLINE_MODULE_OUTPUT,
+        metavar="PATH",
+        help=f"Base64 module used as the ensure_lettings_brochure.mjs fallback (default: {INLINE_MODULE_OUTPUT}).",
+    )
+    inline_group.add_argument(
+        "--no-inline-module",
+        dest="inline_module",
+        action="store_const",
+        const=None,
+        help="Leave the base64 module untouched.",
+    )
+    parser.add_argument(
+        "--bundle",
+        nargs="?",
+        type=Path,
+        const=LISTINGS_BUNDLE_OUTPUT,
+        default=None,
+        metavar="PATH",
+        help=f"With --listings, write every listing into one bookmarked PDF (default: {LISTINGS_BUNDLE_OUTPUT}).",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Stay running and answer line-delimited JSON-RPC render requests on stdin/stdout.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild when inputs change (with --listings, only the listings that changed).",
+    )
+    parser.add_argument(
+        "--vector-logo",
+        action="store_true",
+        help="Draw the generated vector wordmark (scripts/generate_aktonz_logo.py) instead of the PNG logo.",
+    )
+    parser.add_argument(
+        "--kerning",
+        action="store_true",
+        help="Apply Helvetica kern pairs (TJ arrays) and wrap lines on the real AFM advances.",
+    )
+    parser.add_argument(
+        "--benchmark-kerning",
+        action="store_true",
+        help="Report the per-line cost of kerned wrapping and text emission instead of building the brochure.",
+    )
     parser.set_defaults(public=True)
     args = parser.parse_args()
 
-    primary_output = args.output
-    pdf_bytes = build_brochure(primary_output)
-    print(f"Created {primary_output}")
+    if args.benchmark_wrapping:
+        print_wrapping_benchmark()
+        sys.exit(0)
+    if args.benchmark_kerning:
+        print_kerning_benchmark()
+        sys.exit(0)
+
+    for resource in STANDARD_FONTS:
+        font_path = getattr(args, f"font_{resource}")
+        if font_path is not None:
+            register_truetype_font(resource, font_path, cache_dir=args.font_cache)
+    if args.kerning:
+        enable_kerning()
+    if args.vector_logo:
+        use_vector_logo()
+
+    if args.stdout and (args.worker or args.watch or args.listings):
+        parser.error("--stdout only applies to a single marketing brochure build")
+
+    if args.worker:
+        serve_worker()
+        sys.exit(0)
+
+    sinks = brochure_sinks(
+        args.output,
+        public_output=args.public_output if args.public else None,
+        public_link=args.public_link,
+        inline_module=args.inline_module,
+        checksum=args.checksum,
+        stdout=args.stdout,
+    )
 
-    if args.public:
-        public_path = args.public_output
-        public_path.parent.mkdir(parents=True, exist_ok=True)
-        public_path.write_bytes(pdf_bytes)
-        print(f"Copied brochure to {public_path}")
+    if args.watch:
+        try:
+            watch(
+                sinks=sinks,
+                listings_input=args.listings_input if args.listings else None,
+                listings_dir=args.listings_dir,
+            )
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if args.listings and args.bundle is not None:
+        started = time.perf_counter()
+        listings = load_listings(args.listings_input)
+        pdf_bytes = build_listing_bundle(listings, args.bundle)
+        elapsed = time.perf_counter() - started
+        print(f"Created {args.bundle} with {len(listings)} listings, {len(pdf_bytes):,} bytes ({elapsed:.2f}s)")
+        sys.exit(0)
+
+    if args.listings:
+        started = time.perf_counter()
+        written = build_listing_brochures(load_listings(args.listings_input), args.listings_dir)
+        elapsed = time.perf_counter() - started
+        print(f"Created {len(written)} listing brochures in {args.listings_dir} ({elapsed:.2f}s)")
+        sys.exit(0)
+
+    publish_brochure(sinks, log=sys.stderr if args.stdout else None)
@@ -0,0 +1,278 @@
+"""Registry of the assets embedded in the repository, with a verified restore.
+
+``data/embedded-assets.json`` lists each embedded asset by name: the file it
+is stored in (``source``, relative to the repository root), how it is stored
+there (``encoding``: ``raw`` bytes, or a ``base64-module`` holding one
+backtick-quoted base64 string), the files it restores (``targets``) and the
+size and SHA-256 of the decoded bytes. Targets are build outputs: none of
+them is tracked by git, so restoring never rewrites a committed file.
+
+Restoring checks every target in parallel and only decodes and writes those
+that are missing or do not match the manifest. Decoding streams ``CHUNK_SIZE``
+pieces into a temporary file, which is renamed into place once its digest
+matches, so a stale source never replaces a good file.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = ROOT / "data" / "embedded-assets.json"
+MANIFEST_VERSION = 1
+ENCODINGS = ("raw", "base64-module")
+# Decoded bytes per write; a multiple of 3 so base64 pieces never need padding.
+CHUNK_SIZE = 3 * 256 * 1024
+DEFAULT_WORKERS = 8
+
+
+class EmbeddedAsset(NamedTuple):
+    name: str
+    source: Path
+    encoding: str
+    targets: Tuple[Path, ...]
+    size: int
+    sha256: str
+
+
+class RestoreResult(NamedTuple):
+    """``status`` is ``ok``, ``missing`` or ``corrupt`` when checking, and ``restored`` or ``failed`` after writing."""
+
+    asset: str
+    target: Path
+    status: str
+    detail: str = ""
+
+
+def load_registry(manifest_path: Path = MANIFEST_PATH) -> List[EmbeddedAsset]:
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{manifest_path} is not a version {MANIFEST_VERSION} asset manifest")
+    assets: List[EmbeddedAsset] = []
+    for name, entry in manifest["assets"].items():
+        if entry["encoding"] not in ENCODINGS:
+            raise ValueError(f"Asset {name!r} has unknown encoding {entry['encoding']!r}")
+        assets.append(
+            EmbeddedAsset(
+                name,
+                Path(entry["source"]),
+                entry["encoding"],
+                tuple(Path(target) for target in entry["targets"]),
+                int(entry["size"]),
+                entry["sha256"],
+            )
+        )
+    return assets
+
+
+def _write_manifest(manifest_path: Path, manifest: dict) -> None:
+    temporary = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    temporary.replace(manifest_path)
+
+
+# --- Decoding -------------------------------------------------------------
+
+
+def decode_chunks(asset: EmbeddedAsset, root: Path = ROOT) -> Iterator[bytes]:
+    """Yield the asset's decoded bytes in pieces of at most ``CHUNK_SIZE``.
+
+    The source is memory-mapped for the duration, so only the pages being
+    decoded are read in.
+    """
+
+    with (root / asset.source).open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if asset.encoding == "raw":
+            for start in range(0, len(data), CHUNK_SIZE):
+                yield data[start : start + CHUNK_SIZE]
+            return
+        start, end = data.find(b"`") + 1, data.rfind(b"`")
+        if start == 0 or end < start:
+            raise ValueError(f"{asset.source} does not hold a backtick-quoted base64 string")
+        step = CHUNK_SIZE // 3 * 4
+        for offset in range(start, end, step):
+            try:
+                yield base64.b64decode(data[offset : min(offset + step, end)], validate=True)
+            except binascii.Error as error:
+                raise ValueError(f"{asset.source} holds invalid base64: {error}") from error
+
+
+def source_fingerprint(asset: EmbeddedAsset, root: Path = ROOT) -> Tuple[int, str]:
+    """Size and SHA-256 of what the asset's source currently decodes to."""
+
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in decode_chunks(asset, root):
+        digest.update(chunk)
+        size += len(chunk)
+    return size, digest.hexdigest()
+
+
+# --- Restore --------------------------------------------------------------
+
+
+def target_status(asset: EmbeddedAsset, target: Path) -> str:
+    """``ok``, ``missing`` or ``corrupt``; the size is checked before any hashing."""
+
+    try:
+        if target.stat().st_size != asset.size:
+            return "corrupt"
+    except FileNotFoundError:
+        return "missing"
+    digest = hashlib.sha256()
+    with target.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return "ok" if digest.hexdigest() == asset.sha256 else "corrupt"
+
+
+def write_target(asset: EmbeddedAsset, target: Path, root: Path = ROOT) -> None:
+    """Stream the decoded asset to ``target``, replacing it only if the result matches the manifest."""
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with temporary.open("wb") as handle:
+            for chunk in decode_chunks(asset, root):
+                handle.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        if size != asset.size or digest.hexdigest() != asset.sha256:
+            raise ValueError(
+                f"{asset.source} decodes to {size} bytes with SHA-256 {digest.hexdigest()}, "
+                f"not the {asset.size} bytes with SHA-256 {asset.sha256} in the manifest (see --refresh)"
+            )
+        temporary.replace(target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def restore_assets(
+    assets: Iterable[EmbeddedAsset],
+    *,
+    root: Path = ROOT,
+    check_only: bool = False,
+    workers: Optional[int] = None,
+) -> List[RestoreResult]:
+    """Check every target in parallel and rewrite the missing or corrupt ones.
+
+    Results come back in manifest order. With ``check_only`` nothing is
+    written.
+    """
+
+    jobs = [(asset, root / target) for asset in assets for target in asset.targets]
+
+    def run(job: Tuple[EmbeddedAsset, Path]) -> RestoreResult:
+        asset, target = job
+        try:
+            status = target_status(asset, target)
+            if status == "ok" or check_only:
+                return RestoreResult(asset.name, target, status)
+            write_target(asset, target, root)
+        except (OSError, ValueError) as error:
+            return RestoreResult(asset.name, target, "failed", str(error))
+        return RestoreResult(asset.name, target, "restored", f"was {status}")
+
+    if not jobs:
+        return []
+    # Hashing and file I/O release the GIL, so threads are enough to overlap the checks.
+    with ThreadPoolExecutor(max_workers=min(workers or DEFAULT_WORKERS, len(jobs))) as executor:
+        return list(executor.map(run, jobs))
+
+
+# --- Manifest updates -----------------------------------------------------
+
+
+def record_asset(source: Path, *, size: int, sha256: str, manifest_path: Path = MANIFEST_PATH) -> bool:
+    """Record new decoded ``size`` and ``sha256`` for the asset stored in ``source``.
+
+    Called by whatever rewrites an embedded source, such as the brochure's
+    inline module. Returns whether the manifest changed; sources the manifest
+    does not list are ignored.
+    """
+
+    if not manifest_path.exists():
+        return False
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    source = Path(source).resolve()
+    for entry in manifest["assets"].values():
+        if (ROOT / entry["source"]).resolve() != source:
+            continue
+        if entry["size"] == size and entry["sha256"] == sha256:
+            return False
+        entry["size"], entry["sha256"] = size, sha256
+        _write_manifest(manifest_path, manifest)
+        return True
+    return False
+
+
+def refresh_registry(names: Sequence[str] = (), manifest_path: Path = MANIFEST_PATH) -> List[str]:
+    """Re-derive size and SHA-256 from the sources, returning the names of the assets that changed."""
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    changed: List[str] = []
+    for asset in load_registry(manifest_path):
+        if names and asset.name not in names:
+            continue
+        size, digest = source_fingerprint(asset)
+        entry = manifest["assets"][asset.name]
+        if (entry["size"], entry["sha256"]) != (size, digest):
+            entry["size"], entry["sha256"] = size, digest
+            changed.append(asset.name)
+    if changed:
+        _write_manifest(manifest_path, manifest)
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Restore (or check) the files generated from embedded assets.")
+    parser.add_argument("names", nargs="*", metavar="NAME", help="Assets to handle (default: every asset in the manifest).")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report missing or corrupt targets; exit 1 if any target is corrupt.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute sizes and hashes from the embedded sources after changing them on purpose.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Targets checked at once (default: {DEFAULT_WORKERS}).",
+    )
+    args = parser.parse_args()
+
+    registry = load_registry()
+    unknown = sorted(set(args.names) - {asset.name for asset in registry})
+    if unknown:
+        parser.error(f"unknown asset(s): {', '.join(unknown)}")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.refresh:
+        updated = refresh_registry(args.names)
+        print(f"Updated {', '.join(updated)} in {MANIFEST_PATH}" if updated else f"{MANIFEST_PATH} is up to date")
+    else:
+        selected = [asset for asset in registry if not args.names or asset.name in args.names]
+        results = restore_assets(selected, check_only=args.check, workers=args.workers)
+        for result in results:
+            line = f"{result.status:>8}  {result.target.relative_to(ROOT)}"
+            print(f"{line} ({result.detail})" if result.detail else line)
+        # Missing targets are expected on a clean checkout; only a mismatch means something is wrong.
+        problems = [result for result in results if result.status in ("failed", "corrupt")]
+        if problems:
+            sys.exit(1)
@@ -1,16 +1,21 @@
 #!/usr/bin/env node
-import { access, constants } from 'node:fs/promises';
-import { spawn } from 'node:child_process';
-import { dirname, resolve } from 'node:path';
+import { createHash } from 'node:crypto';
+import { access, constants, mkdir, readFile, rename, unlink, writeFile } from 'node:fs/promises';
+import { basename, dirname, resolve } from 'node:path';
 import { fileURLToPath } from 'node:url';
-import { brochurePdfBase64 } from '../data/aktonz-lettings-brochure-inline.mjs';
-import { mkdir, writeFile } from 'node:fs/promises';
+import { startBrochureWorker } from './brochure_worker_client.mjs';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const projectRoot = resolve(__dirname, '..');
 const publicBrochurePath = resolve(projectRoot, 'public', 'brochures', 'aktonz-lettings-brochure.pdf');
 const docsBrochurePath = resolve(projectRoot, 'docs', 'aktonz-lettings-brochure.pdf');
+// Shared with scripts/embedded_assets.py: the size and SHA-256 the inline copy decodes to.
+const manifestPath = resolve(projectRoot, 'data', 'embedded-assets.json');
+const brochureAsset = 'lettings-brochure';
 
+// Only missing copies are produced here. Rebuilding an existing brochure is left
+// to `python scripts/create_aktonz_lettings_brochure.py`, so dev, build and start
+// never pay for a render (or a hash of its output) just to find nothing changed.
 async function fileExists(path) {
   try {
     await access(path, constants.F_OK);
@@ -20,44 +25,59 @@ async function fileExists(path) {
   }
 }
 
-async function writeBrochureFromBase64(targetPath) {
-  const buffer = Buffer.from(brochurePdfBase64, 'base64');
+async function missingTargets() {
+  const targets = [publicBrochurePath, docsBrochurePath];
+  const present = await Promise.all(targets.map(fileExists));
+  return targets.filter((_, index) => !present[index]);
+}
+
+async function writeAtomically(targetPath, buffer) {
   await mkdir(dirname(targetPath), { recursive: true });
-  await writeFile(targetPath, buffer);
+  const temporaryPath = resolve(dirname(targetPath), `.${basename(targetPath)}.${process.pid}.tmp`);
+  try {
+    await writeFile(temporaryPath, buffer);
+    await rename(temporaryPath, targetPath);
+  } catch (error) {
+    await unlink(temporaryPath).catch(() => {});
+    throw error;
+  }
+}
+
+async function writeBrochureFromBase64(targets) {
+  // Only load the inline copy when it is actually needed.
+  const { brochurePdfBase64 } = await import('../data/aktonz-lettings-brochure-inline.mjs');
+  const buffer = Buffer.from(brochurePdfBase64, 'base64');
+  const { size, sha256 } = JSON.parse(await readFile(manifestPath, 'utf8')).assets[brochureAsset];
+  const digest = createHash('sha256').update(buffer).digest('hex');
+  if (buffer.length !== size || digest !== sha256) {
+    throw new Error(`The inline brochure does not match ${manifestPath}; regenerate it with the brochure script.`);
+  }
+  await Promise.all(targets.map((target) => writeAtomically(target, buffer)));
   return buffer;
 }
 
 async function ensureBrochure() {
-  if (await fileExists(publicBrochurePath)) {
+  if ((await missingTargets()).length === 0) {
     return;
   }
 
-  const hasPython = await new Promise((resolve) => {
-    const probe = spawn('python', ['--version'], { stdio: 'ignore' });
-    probe.once('error', () => resolve(false));
-    probe.once('exit', (code) => resolve(code === 0));
-  });
-
-  if (hasPython) {
-    const generated = await new Promise((resolve) => {
-      const child = spawn('python', ['scripts/create_aktonz_lettings_brochure.py'], {
-        cwd: projectRoot,
-        stdio: 'ignore',
-      });
-      child.once('error', () => resolve(false));
-      child.once('exit', (code) => resolve(code === 0));
+  const worker = startBrochureWorker({ cwd: projectRoot });
+  try {
+    await worker.request('build_brochure', {
+      output: docsBrochurePath,
+      public_output: publicBrochurePath,
     });
-
-    if (generated && (await fileExists(publicBrochurePath))) {
-      return;
-    }
+  } catch {
+    // Python is unavailable or the render failed; fall back to the inline copy below.
+  } finally {
+    await worker.close();
   }
 
-  const buffer = await writeBrochureFromBase64(publicBrochurePath);
-  if (!(await fileExists(docsBrochurePath))) {
-    await writeBrochureFromBase64(docsBrochurePath);
+  const targets = await missingTargets();
+  if (targets.length === 0) {
+    return;
   }
-  return buffer;
+  return writeBrochureFromBase64(targets);
 }
 
 ensureBrochure().catch((error) => {
@@ -1,13 +1,44 @@
-"""Utility to regenerate the Aktonz logo asset used in the header.
+"""Utility to regenerate the Aktonz logo assets.
 
-The generator writes a 400x160 SVG featuring the AKTONZ wordmark in
-brand yellow on a blue gradient background with a soft radial highlight.
+The logo is a 400x160 drawing of the AKTONZ wordmark in brand yellow on a blue
+gradient background with a soft radial highlight. :func:`build_geometry` turns
+the bitmap ``FONT`` into one model of filled shapes, and every output is
+rendered from it in a single pass (:func:`render_logo`): the header SVG, PNGs
+at the sizes in ``PNG_TARGETS`` and a PDF content-stream fragment.
+
+Each glyph's lit cells are merged into a single outline: convex corners keep
+the rounded cell radius, inner corners are left square so strokes read as
+solid, and cells that only touch diagonally stay separate. ``--cells`` writes
+the older one-``<rect>``-per-cell SVG instead.
+
+``--variants SPEC`` renders a batch of variants (other words, scales, spacings
+and colours, see :class:`LogoStyle`) from a JSON spec. Glyph outlines are
+traced once per character and shared by every variant, and a manifest in the
+output directory lets unchanged outputs skip rendering altogether.
 """
 from __future__ import annotations
 
+import argparse
+import functools
+import gzip
+import hashlib
+import html
+import json
+import math
+import re
+import struct
+import sys
+import zlib
 from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: without it only the .gz siblings are written
+    brotli = None
 
 OUTPUT_PATH = Path(__file__).resolve().parent.parent / "public" / "aktonz-logo-modern.svg"
+PNG_OUTPUT_DIR = OUTPUT_PATH.parent
 
 BG_TOP = "#0082ff"
 BG_BOTTOM = "#005ad2"
@@ -20,6 +51,39 @@ FONT = {
     "O": ["01110", "10001", "10001", "10001", "10001", "10001", "01110"],
     "N": ["10001", "11001", "10101", "10011", "10001", "10001", "10001"],
     "Z": ["11111", "00001", "00010", "00100", "01000", "10000", "11111"],
+    # The rest of the alphabet, digits, space and hyphen, for branch codes and other variants.
+    "B": ["11110", "10001", "10001", "11110", "10001", "10001", "11110"],
+    "C": ["01110", "10001", "10000", "10000", "10000", "10001", "01110"],
+    "D": ["11100", "10010", "10001", "10001", "10001", "10010", "11100"],
+    "E": ["11111", "10000", "10000", "11110", "10000", "10000", "11111"],
+    "F": ["11111", "10000", "10000", "11110", "10000", "10000", "10000"],
+    "G": ["01110", "10001", "10000", "10111", "10001", "10001", "01111"],
+    "H": ["10001", "10001", "10001", "11111", "10001", "10001", "10001"],
+    "I": ["01110", "00100", "00100", "00100", "00100", "00100", "01110"],
+    "J": ["00111", "00010", "00010", "00010", "00010", "10010", "01100"],
+    "L": ["10000", "10000", "10000", "10000", "10000", "10000", "11111"],
+    "M": ["10001", "11011", "10101", "10101", "10001", "10001", "10001"],
+    "P": ["11110", "10001", "10001", "11110", "10000", "10000", "10000"],
+    "Q": ["01110", "10001", "10001", "10001", "10101", "10010", "01101"],
+    "R": ["11110", "10001", "10001", "11110", "10100", "10010", "10001"],
+    "S": ["01111", "10000", "10000", "01110", "00001", "00001", "11110"],
+    "U": ["10001", "10001", "10001", "10001", "10001", "10001", "01110"],
+    "V": ["10001", "10001", "10001", "10001", "10001", "01010", "00100"],
+    "W": ["10001", "10001", "10001", "10101", "10101", "10101", "01010"],
+    "X": ["10001", "10001", "01010", "00100", "01010", "10001", "10001"],
+    "Y": ["10001", "10001", "01010", "00100", "00100", "00100", "00100"],
+    "0": ["01110", "10001", "10011", "10101", "11001", "10001", "01110"],
+    "1": ["00100", "01100", "00100", "00100", "00100", "00100", "01110"],
+    "2": ["01110", "10001", "00001", "00010", "00100", "01000", "11111"],
+    "3": ["11111", "00010", "00100", "00010", "00001", "10001", "01110"],
+    "4": ["00010", "00110", "01010", "10010", "11111", "00010", "00010"],
+    "5": ["11111", "10000", "11110", "00001", "00001", "10001", "01110"],
+    "6": ["00110", "01000", "10000", "11110", "10001", "10001", "01110"],
+    "7": ["11111", "00001", "00010", "00100", "01000", "01000", "01000"],
+    "8": ["01110", "10001", "10001", "01110", "10001", "10001", "01110"],
+    "9": ["01110", "10001", "10001", "01111", "00001", "00010", "01100"],
+    " ": ["00000", "00000", "00000", "00000", "00000", "00000", "00000"],
+    "-": ["00000", "00000", "00000", "11111", "00000", "00000", "00000"],
 }
 
 WIDTH, HEIGHT = 400, 160
@@ -27,62 +91,1027 @@ SCALE = 12
 SPACING = 6
 WORD = "AKTONZ"
 
+BACKGROUND_RADIUS = 24
+HIGHLIGHT_RADIUS = 36
+HIGHLIGHT_OPACITY = 0.45
+HIGHLIGHT_CENTRE_OPACITY = 0.7
+
+# Name, width and height of each PNG; the logo is scaled to fit and centred on a transparent canvas.
+PNG_TARGETS: Tuple[Tuple[str, int, int], ...] = (
+    ("favicon", 32, 32),
+    ("header", 200, 80),
+    ("header@2x", 400, 160),
+    ("social", 1200, 630),
+)
+
+VARIANTS_OUTPUT_DIR = PNG_OUTPUT_DIR / "logo-variants"
+VARIANTS_MANIFEST_NAME = "manifest.json"
+VARIANTS_MANIFEST_VERSION = 1
+
+Point = Tuple[int, int]
+# A contour vertex: x, y and the radius its corner is rounded with (0 for square).
+Corner = Tuple[float, float, float]
+Contour = Tuple[Corner, ...]
+
+
+class LogoStyle(NamedTuple):
+    """Everything a logo variant can change; the defaults draw the header logo."""
+
+    word: str = WORD
+    scale: float = SCALE
+    spacing: float = SPACING
+    width: int = WIDTH
+    height: int = HEIGHT
+    bg_top: str = BG_TOP
+    bg_bottom: str = BG_BOTTOM
+    text_color: str = TEXT_COLOR
+    title: str = "Aktonz"
+    description: str = "Aktonz wordmark in yellow on a blue gradient background"
+
+
+DEFAULT_STYLE = LogoStyle()
+
+
+class Shape(NamedTuple):
+    """A filled region of the logo in SVG user units (y down).
+
+    ``kind`` is ``"background"`` (vertical gradient), ``"highlight"`` (radial
+    white glow), ``"glyph"`` or ``"cell"`` (both solid ``color``). Contours are
+    closed axis-aligned polygons, clockwise around filled areas.
+    """
+
+    kind: str
+    contours: Tuple[Contour, ...]
+    color: str = TEXT_COLOR
+
+
+class LogoGeometry(NamedTuple):
+    width: int
+    height: int
+    shapes: Tuple[Shape, ...]
+    style: LogoStyle = DEFAULT_STYLE
+
+
+# --- Geometry -------------------------------------------------------------
+
+
+def _glyph_loops(glyph: Sequence[str]) -> List[List[Point]]:
+    """Trace the outline of a glyph's lit cells as closed loops of corner points.
+
+    Points are in cell units with y pointing down. Loops run clockwise around
+    filled areas and anticlockwise around holes; at a vertex shared by two
+    diagonal cells the trace turns into the cell it is following, so those
+    cells stay separate loops.
+    """
+
+    def lit(x: int, y: int) -> bool:
+        return 0 <= y < len(glyph) and 0 <= x < len(glyph[y]) and glyph[y][x] == "1"
+
+    edges: Dict[Point, List[Point]] = {}
+    for y, row in enumerate(glyph):
+        for x, bit in enumerate(row):
+            if bit != "1":
+                continue
+            for neighbour, start, end in (
+                ((x, y - 1), (x, y), (x + 1, y)),
+                ((x + 1, y), (x + 1, y), (x + 1, y + 1)),
+                ((x, y + 1), (x + 1, y + 1), (x, y + 1)),
+                ((x - 1, y), (x, y + 1), (x, y)),
+            ):
+                if not lit(*neighbour):
+                    edges.setdefault(start, []).append(end)
+
+    loops: List[List[Point]] = []
+    while edges:
+        start = next(iter(edges))
+        point, direction = start, None
+        corners: List[Point] = []
+        while True:
+            candidates = edges[point]
+            if direction is None:
+                end = candidates[0]
+            else:
+                dx, dy = direction
+                # Prefer a right turn, then straight on, then a left turn.
+                preferences = [(-dy, dx), (dx, dy), (dy, -dx)]
+                end = min(candidates, key=lambda end: preferences.index((end[0] - point[0], end[1] - point[1])))
+            candidates.remove(end)
+            if not candidates:
+                del edges[point]
+            new_direction = (end[0] - point[0], end[1] - point[1])
+            if new_direction != direction:
+                corners.append(point)
+            point, direction = end, new_direction
+            if point == start:
+                break
+        if len(corners) > 1 and corners[0] == start and _is_straight(corners[-1], start, corners[1]):
+            corners.pop(0)
+        loops.append(corners)
+    return loops
+
+
+@functools.lru_cache(maxsize=None)
+def glyph_outline(char: str) -> Tuple[Tuple[Point, ...], ...]:
+    """The traced loops of ``char`` in cell units, computed once per process and shared by every variant."""
+
+    glyph = FONT.get(char)
+    if glyph is None:
+        raise ValueError(f"No glyph for {char!r} in the logo font")
+    return tuple(tuple(loop) for loop in _glyph_loops(glyph))
+
+
+def _is_straight(before: Point, point: Point, after: Point) -> bool:
+    return (point[0] - before[0]) * (after[1] - point[1]) == (point[1] - before[1]) * (after[0] - point[0])
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _direction(start: Sequence[float], end: Sequence[float]) -> Point:
+    return _sign(end[0] - start[0]), _sign(end[1] - start[1])
+
+
+def _glyph_contour(loop: Sequence[Point], origin_x: float, origin_y: float, scale: float, radius: float) -> Contour:
+    """Place a traced loop on the canvas, rounding its convex corners."""
+
+    corners: List[Corner] = []
+    for index, point in enumerate(loop):
+        in_x, in_y = _direction(loop[index - 1], point)
+        out_x, out_y = _direction(point, loop[(index + 1) % len(loop)])
+        # A right turn (clockwise, y down) is a convex corner of the filled area.
+        convex = in_x * out_y - in_y * out_x > 0
+        corners.append((origin_x + point[0] * scale, origin_y + point[1] * scale, radius if convex else 0.0))
+    return tuple(corners)
+
+
+def _rounded_rect(x: float, y: float, width: float, height: float, radius: float) -> Contour:
+    return ((x, y, radius), (x + width, y, radius), (x + width, y + height, radius), (x, y + height, radius))
+
+
+def _word_size(style: LogoStyle) -> Tuple[float, float]:
+    """Width and height the style's word covers on the canvas."""
 
-def _build_svg() -> str:
     char_w = len(next(iter(FONT.values()))[0])
     char_h = len(next(iter(FONT.values())))
-    text_width = len(WORD) * char_w * SCALE + (len(WORD) - 1) * SPACING
-    start_x = (WIDTH - text_width) // 2
-    start_y = (HEIGHT - char_h * SCALE) // 2
+    word = style.word
+    return len(word) * char_w * style.scale + (len(word) - 1) * style.spacing, char_h * style.scale
 
-    radius = 36
-    highlight_cx = WIDTH // 2
-    highlight_cy = start_y - 10
 
-    pieces: list[str] = [
-        "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
-        "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"400\" height=\"160\" viewBox=\"0 0 400 160\" role=\"img\" aria-labelledby=\"logo-title logo-desc\">",
-        "  <title id=\"logo-title\">Aktonz</title>",
-        "  <desc id=\"logo-desc\">Aktonz wordmark in yellow on a blue gradient background</desc>",
-        "  <defs>",
-        "    <linearGradient id=\"bg\" x1=\"0%\" y1=\"0%\" x2=\"0%\" y2=\"100%\">",
-        f"      <stop offset=\"0%\" stop-color=\"{BG_TOP}\" />",
-        f"      <stop offset=\"100%\" stop-color=\"{BG_BOTTOM}\" />",
-        "    </linearGradient>",
-        "    <radialGradient id=\"highlight\" cx=\"50%\" cy=\"50%\" r=\"50%\">",
-        "      <stop offset=\"0%\" stop-color=\"#ffffff\" stop-opacity=\"0.7\" />",
-        "      <stop offset=\"100%\" stop-color=\"#ffffff\" stop-opacity=\"0\" />",
-        "    </radialGradient>",
-        "  </defs>",
-        "  <rect width=\"100%\" height=\"100%\" fill=\"url(#bg)\" rx=\"24\" />",
-        f"  <circle cx=\"{highlight_cx}\" cy=\"{highlight_cy}\" r=\"{radius}\" fill=\"url(#highlight)\" opacity=\"0.45\" />",
+def build_geometry(*, cells: bool = False, style: LogoStyle = DEFAULT_STYLE) -> LogoGeometry:
+    """The logo as filled shapes, painted in order; ``cells`` keeps one shape per lit cell."""
+
+    word, scale, spacing, width, height = style.word, style.scale, style.spacing, style.width, style.height
+    if not word:
+        raise ValueError("The logo word must not be empty")
+    char_w = len(next(iter(FONT.values()))[0])
+    char_h = len(next(iter(FONT.values())))
+    text_width, text_height = _word_size(style)
+    if text_width > width or text_height > height:
+        raise ValueError(f"{word!r} at scale {scale} needs {text_width}x{text_height}, more than the {width}x{height} canvas")
+    start_x = (width - text_width) // 2
+    start_y = (height - text_height) // 2
+
+    highlight_cx = width // 2
+    highlight_cy = start_y - 10
+    shapes: List[Shape] = [
+        Shape("background", (_rounded_rect(0, 0, width, height, BACKGROUND_RADIUS),)),
+        Shape(
+            "highlight",
+            (
+                _rounded_rect(
+                    highlight_cx - HIGHLIGHT_RADIUS,
+                    highlight_cy - HIGHLIGHT_RADIUS,
+                    2 * HIGHLIGHT_RADIUS,
+                    2 * HIGHLIGHT_RADIUS,
+                    HIGHLIGHT_RADIUS,
+                ),
+            ),
+        ),
     ]
 
-    corner_radius = SCALE * 0.18
+    corner_radius = scale * 0.18
 
-    for index, char in enumerate(WORD):
-        glyph = FONT[char]
-        origin_x = start_x + index * (char_w * SCALE + SPACING)
-        for gy, glyph_row in enumerate(glyph):
+    for index, char in enumerate(word):
+        loops = glyph_outline(char)
+        origin_x = start_x + index * (char_w * scale + spacing)
+        if not loops:
+            continue
+        if not cells:
+            contours = tuple(_glyph_contour(loop, origin_x, start_y, scale, corner_radius) for loop in loops)
+            shapes.append(Shape("glyph", contours, style.text_color))
+            continue
+        for gy, glyph_row in enumerate(FONT[char]):
             for gx, bit in enumerate(glyph_row):
-                if bit != "1":
+                if bit == "1":
+                    cell = _rounded_rect(origin_x + gx * scale, start_y + gy * scale, scale, scale, corner_radius)
+                    shapes.append(Shape("cell", (cell,), style.text_color))
+
+    return LogoGeometry(width, height, tuple(shapes), style)
+
+
+def _bounds(contour: Contour) -> Tuple[float, float, float, float]:
+    xs = [corner[0] for corner in contour]
+    ys = [corner[1] for corner in contour]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _rgb(color: str) -> Tuple[float, float, float]:
+    return tuple(int(color[index : index + 2], 16) / 255 for index in (1, 3, 5))
+
+
+def _number(value: float, precision: int = 2) -> str:
+    text = f"{value:.{precision}f}"
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+def _short_number(value: float, precision: int = 2) -> str:
+    """:func:`_number` without a leading zero or negative zero, for minified output."""
+
+    text = _number(value, precision)
+    if text in ("-0", ""):
+        return "0"
+    if text.startswith("0."):
+        return text[1:]
+    if text.startswith("-0."):
+        return "-" + text[2:]
+    return text
+
+
+def _join_numbers(numbers: Sequence[str]) -> str:
+    # A minus sign already separates a number from the one before it.
+    return "".join(number if index == 0 or number.startswith("-") else f" {number}" for index, number in enumerate(numbers))
+
+
+# --- SVG ------------------------------------------------------------------
+
+
+def _contour_path(contour: Contour, precision: int = 2, number=_number, join=" ".join) -> str:
+    """Relative SVG path data for one contour, drawing rounded corners as arcs.
+
+    Each step is the difference between positions already rounded to
+    ``precision`` decimals, so rounding never accumulates along the contour.
+    ``number`` formats each value and ``join`` separates a command's
+    arguments, so the minified renderer can pass tighter versions of both.
+    """
+
+    def snap(value: float) -> float:
+        return round(value, precision)
+
+    count = len(contour)
+    # directions[i] is the direction of the edge arriving at corner i.
+    directions = [_direction(contour[index - 1], contour[index]) for index in range(count)]
+
+    x, y, radius = contour[0]
+    out_x, out_y = directions[1 % count]
+    pen_x, pen_y = snap(x + out_x * radius), snap(y + out_y * radius)
+    commands = ["M" + join([number(pen_x, precision), number(pen_y, precision)])]
+    for index in range(count):
+        next_x, next_y, next_radius = contour[(index + 1) % count]
+        out_x, out_y = directions[(index + 1) % count]
+        # A straight edge to where the next corner's arc begins...
+        if out_y == 0:
+            end = snap(next_x - out_x * next_radius)
+            commands.append(f"h{number(end - pen_x, precision)}")
+            pen_x = end
+        else:
+            end = snap(next_y - out_y * next_radius)
+            commands.append(f"v{number(end - pen_y, precision)}")
+            pen_y = end
+        # ...then the arc round it.
+        if next_radius:
+            after_x, after_y = directions[(index + 2) % count]
+            sweep = 1 if out_x * after_y - out_y * after_x > 0 else 0
+            end_x, end_y = snap(next_x + after_x * next_radius), snap(next_y + after_y * next_radius)
+            r = number(next_radius, precision)
+            commands.append(
+                "a" + join([r, r, "0", "0", str(sweep), number(end_x - pen_x, precision), number(end_y - pen_y, precision)])
+            )
+            pen_x, pen_y = end_x, end_y
+    if commands[-1].startswith(("h", "v")):
+        commands.pop()  # "z" draws the closing line
+    return "".join(commands) + "z"
+
+
+class SvgRenderer:
+    """Render the header SVG; ``finish`` returns the document text.
+
+    ``minify`` drops the XML declaration, indentation and default attribute
+    values, shortens numbers and wraps runs of same-coloured shapes in one
+    ``<g fill>``. ``precision`` is the number of decimals kept in coordinates.
+    """
+
+    def __init__(self, *, minify: bool = False, precision: int = 2) -> None:
+        self.minify = minify
+        self.precision = precision
+
+    def _number(self, value: float) -> str:
+        return _short_number(value, self.precision) if self.minify else _number(value, self.precision)
+
+    def begin(self, geometry: LogoGeometry) -> None:
+        width, height, style = geometry.width, geometry.height, geometry.style
+        svg = (
+            f"<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"{width}\" height=\"{height}\" viewBox=\"0 0 {width} {height}\" "
+            "role=\"img\" aria-labelledby=\"logo-title logo-desc\">"
+        )
+        title = f"<title id=\"logo-title\">{html.escape(style.title)}</title>"
+        desc = f"<desc id=\"logo-desc\">{html.escape(style.description)}</desc>"
+        self.group: str | None = None
+        if self.minify:
+            centre = _short_number(HIGHLIGHT_CENTRE_OPACITY)
+            self.pieces: List[str] = [
+                svg,
+                title,
+                desc,
+                "<defs>",
+                f"<linearGradient id=\"bg\" x2=\"0\" y2=\"1\"><stop stop-color=\"{style.bg_top}\"/>"
+                f"<stop offset=\"1\" stop-color=\"{style.bg_bottom}\"/></linearGradient>",
+                f"<radialGradient id=\"highlight\"><stop stop-color=\"#fff\" stop-opacity=\"{centre}\"/>"
+                "<stop offset=\"1\" stop-color=\"#fff\" stop-opacity=\"0\"/></radialGradient>",
+                "</defs>",
+            ]
+            return
+        self.pieces = [
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
+            svg,
+            f"  {title}",
+            f"  {desc}",
+            "  <defs>",
+            "    <linearGradient id=\"bg\" x1=\"0%\" y1=\"0%\" x2=\"0%\" y2=\"100%\">",
+            f"      <stop offset=\"0%\" stop-color=\"{style.bg_top}\" />",
+            f"      <stop offset=\"100%\" stop-color=\"{style.bg_bottom}\" />",
+            "    </linearGradient>",
+            "    <radialGradient id=\"highlight\" cx=\"50%\" cy=\"50%\" r=\"50%\">",
+            f"      <stop offset=\"0%\" stop-color=\"#ffffff\" stop-opacity=\"{HIGHLIGHT_CENTRE_OPACITY}\" />",
+            "      <stop offset=\"100%\" stop-color=\"#ffffff\" stop-opacity=\"0\" />",
+            "    </radialGradient>",
+            "  </defs>",
+        ]
+
+    def _element(self, tag: str, attributes: str, fill: str | None = None) -> None:
+        if not self.minify:
+            self.pieces.append(f"  <{tag} {attributes} fill=\"{fill}\" />" if fill else f"  <{tag} {attributes} />")
+            return
+        if fill != self.group and self.group is not None:
+            self.pieces.append("</g>")
+            self.group = None
+        if fill is not None and self.group is None:
+            self.pieces.append(f"<g fill=\"{fill}\">")
+            self.group = fill
+        self.pieces.append(f"<{tag} {attributes}/>")
+
+    def add(self, shape: Shape) -> None:
+        number = self._number
+        contour = shape.contours[0]
+        x0, y0, x1, y1 = _bounds(contour)
+        radius = contour[0][2]
+        if shape.kind == "background":
+            self._element("rect", f"width=\"100%\" height=\"100%\" fill=\"url(#bg)\" rx=\"{number(radius)}\"")
+        elif shape.kind == "highlight":
+            opacity = _short_number(HIGHLIGHT_OPACITY) if self.minify else HIGHLIGHT_OPACITY
+            self._element(
+                "circle",
+                f"cx=\"{number((x0 + x1) / 2)}\" cy=\"{number((y0 + y1) / 2)}\" r=\"{number(radius)}\" "
+                f"fill=\"url(#highlight)\" opacity=\"{opacity}\"",
+            )
+        elif shape.kind == "cell":
+            box = f"x=\"{number(x0)}\" y=\"{number(y0)}\" width=\"{number(x1 - x0)}\" height=\"{number(y1 - y0)}\""
+            # ry defaults to rx, so the minified form leaves it out.
+            corners = f"rx=\"{number(radius)}\"" if self.minify else f"rx=\"{radius:.{self.precision}f}\" ry=\"{radius:.{self.precision}f}\""
+            self._element("rect", f"{box} {corners}", shape.color)
+        else:
+            if self.minify:
+                path = "".join(_contour_path(contour, self.precision, _short_number, _join_numbers) for contour in shape.contours)
+            else:
+                path = "".join(_contour_path(contour, self.precision) for contour in shape.contours)
+            self._element("path", f"d=\"{path}\"", shape.color)
+
+    def finish(self) -> str:
+        if not self.minify:
+            return "\n".join(self.pieces) + "\n</svg>\n"
+        if self.group is not None:
+            self.pieces.append("</g>")
+        return "".join(self.pieces) + "</svg>"
+
+
+# --- PNG ------------------------------------------------------------------
+
+
+def _flatten(contour: Contour, scale: float, offset_x: float, offset_y: float, tolerance: float = 0.1) -> List[Tuple[float, float]]:
+    """Polygon points for ``contour`` in pixels, with arcs split finely enough to stay within ``tolerance``."""
+
+    points: List[Tuple[float, float]] = []
+    count = len(contour)
+    for index, (x, y, radius) in enumerate(contour):
+        px, py = offset_x + x * scale, offset_y + y * scale
+        r = radius * scale
+        if r <= tolerance:
+            points.append((px, py))
+            continue
+        in_x, in_y = _direction(contour[index - 1], contour[index])
+        out_x, out_y = _direction(contour[index], contour[(index + 1) % count])
+        cx, cy = px + (out_x - in_x) * r, py + (out_y - in_y) * r
+        start = math.atan2(-out_y, -out_x)
+        sweep = (math.atan2(in_y, in_x) - start + math.pi) % (2 * math.pi) - math.pi
+        steps = max(2, math.ceil(abs(sweep) / (2 * math.acos(1 - tolerance / r))))
+        for step in range(steps + 1):
+            angle = start + sweep * step / steps
+            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return points
+
+
+def _coverage_rows(polygons: Sequence[Sequence[Tuple[float, float]]], width: int, height: int, samples: int):
+    """Yield ``(row, first_column, coverages)`` for each pixel row a shape touches.
+
+    Each row is sampled on ``samples`` scanlines with exact horizontal coverage,
+    filling by the non-zero winding rule.
+    """
+
+    buckets: Dict[int, List[Tuple[float, float, float, float, int]]] = {}
+    for points in polygons:
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            if y0 == y1:
+                continue
+            winding = 1 if y1 > y0 else -1
+            top, bottom = min(y0, y1), max(y0, y1)
+            for row in range(max(int(top), 0), min(math.ceil(bottom), height)):
+                buckets.setdefault(row, []).append((x0, y0, x1, y1, winding))
+
+    weight = 1 / samples
+    for row in sorted(buckets):
+        edges = buckets[row]
+        area = [0.0] * (width + 1)
+        steps = [0.0] * (width + 2)
+        low, high = width, 0
+        for sample in range(samples):
+            scan_y = row + (sample + 0.5) / samples
+            crossings = sorted(
+                (x0 + (scan_y - y0) * (x1 - x0) / (y1 - y0), winding)
+                for x0, y0, x1, y1, winding in edges
+                if min(y0, y1) <= scan_y < max(y0, y1)
+            )
+            winding_number = 0
+            for (x, winding), (next_x, _) in zip(crossings, crossings[1:] + crossings[-1:]):
+                winding_number += winding
+                if not winding_number:
+                    continue
+                left, right = min(max(x, 0.0), width), min(max(next_x, 0.0), width)
+                if right <= left:
                     continue
-                x = origin_x + gx * SCALE
-                y = start_y + gy * SCALE
-                pieces.append(
-                    f"  <rect x=\"{x}\" y=\"{y}\" width=\"{SCALE}\" height=\"{SCALE}\" rx=\"{corner_radius:.2f}\" ry=\"{corner_radius:.2f}\" fill=\"{TEXT_COLOR}\" />"
-                )
+                first, last = int(left), int(right)
+                low, high = min(low, first), max(high, last)
+                if first == last:
+                    area[first] += (right - left) * weight
+                    continue
+                area[first] += (first + 1 - left) * weight
+                steps[first + 1] += weight
+                steps[last] -= weight
+                area[last] += (right - last) * weight
+        if high < low:
+            continue
+        coverages: List[float] = []
+        running = sum(steps[: low + 1])
+        for column in range(low, min(high, width - 1) + 1):
+            if column > low:
+                running += steps[column]
+            coverages.append(min(area[column] + running, 1.0))
+        yield row, low, coverages
+
 
-    pieces.append("</svg>")
-    return "\n".join(pieces) + "\n"
+def encode_png(width: int, height: int, rgba: bytes) -> bytes:
+    """Encode 8-bit RGBA pixels as a PNG."""
 
+    stride = width * 4
+    raw = b"".join(b"\x00" + rgba[row * stride : (row + 1) * stride] for row in range(height))
 
-def generate_logo() -> None:
-    """Write the logo SVG to ``OUTPUT_PATH``."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
 
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 9)) + chunk(b"IEND", b"")
+
+
+class PngRenderer:
+    """Rasterize the logo with anti-aliasing; ``finish`` returns PNG bytes."""
+
+    def __init__(self, width: int, height: int, *, samples: int = 8) -> None:
+        self.width = width
+        self.height = height
+        self.samples = samples
+
+    def begin(self, geometry: LogoGeometry) -> None:
+        self.geometry = geometry
+        self.scale = min(self.width / geometry.width, self.height / geometry.height)
+        self.offset_x = (self.width - geometry.width * self.scale) / 2
+        self.offset_y = (self.height - geometry.height * self.scale) / 2
+        # Premultiplied RGBA in 0..1.
+        self.pixels = [0.0] * (self.width * self.height * 4)
+
+    def _paint(self, shape: Shape):
+        """A function from logo coordinates to straight RGBA."""
+
+        if shape.kind == "background":
+            top, bottom = _rgb(self.geometry.style.bg_top), _rgb(self.geometry.style.bg_bottom)
+            height = self.geometry.height
+
+            def gradient(x: float, y: float) -> Tuple[float, float, float, float]:
+                t = min(max(y / height, 0.0), 1.0)
+                return top[0] + (bottom[0] - top[0]) * t, top[1] + (bottom[1] - top[1]) * t, top[2] + (bottom[2] - top[2]) * t, 1.0
+
+            return gradient
+        if shape.kind == "highlight":
+            x0, y0, x1, y1 = _bounds(shape.contours[0])
+            cx, cy, radius = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2
+            peak = HIGHLIGHT_OPACITY * HIGHLIGHT_CENTRE_OPACITY
+
+            def glow(x: float, y: float) -> Tuple[float, float, float, float]:
+                distance = math.hypot(x - cx, y - cy) / radius
+                return 1.0, 1.0, 1.0, peak * max(1.0 - distance, 0.0)
+
+            return glow
+        red, green, blue = _rgb(shape.color)
+        return lambda x, y: (red, green, blue, 1.0)
+
+    def add(self, shape: Shape) -> None:
+        paint = self._paint(shape)
+        polygons = [_flatten(contour, self.scale, self.offset_x, self.offset_y) for contour in shape.contours]
+        pixels = self.pixels
+        for row, first, coverages in _coverage_rows(polygons, self.width, self.height, self.samples):
+            y = (row + 0.5 - self.offset_y) / self.scale
+            index = (row * self.width + first) * 4
+            for column, coverage in enumerate(coverages, start=first):
+                if coverage > 0.0:
+                    red, green, blue, alpha = paint((column + 0.5 - self.offset_x) / self.scale, y)
+                    alpha *= coverage
+                    keep = 1.0 - alpha
+                    pixels[index] = red * alpha + pixels[index] * keep
+                    pixels[index + 1] = green * alpha + pixels[index + 1] * keep
+                    pixels[index + 2] = blue * alpha + pixels[index + 2] * keep
+                    pixels[index + 3] = alpha + pixels[index + 3] * keep
+                index += 4
+
+    def finish(self) -> bytes:
+        rgba = bytearray(len(self.pixels))
+        pixels = self.pixels
+        for index in range(0, len(pixels), 4):
+            alpha = pixels[index + 3]
+            if alpha <= 0.0:
+                continue
+            rgba[index] = round(min(pixels[index] / alpha, 1.0) * 255)
+            rgba[index + 1] = round(min(pixels[index + 1] / alpha, 1.0) * 255)
+            rgba[index + 2] = round(min(pixels[index + 2] / alpha, 1.0) * 255)
+            rgba[index + 3] = round(min(alpha, 1.0) * 255)
+        return encode_png(self.width, self.height, bytes(rgba))
+
+
+# --- PDF ------------------------------------------------------------------
+
+# Control-point distance for a quarter circle drawn as one cubic Bezier.
+KAPPA = 0.5523
+# The highlight is drawn as this many concentric discs sharing one constant alpha,
+# approximating the SVG's linear opacity falloff without a soft mask.
+HIGHLIGHT_RINGS = 16
+
+
+class PdfFragment(NamedTuple):
+    """Content-stream operators drawing the logo in a ``0 0 width height`` box (y up).
+
+    ``resources`` holds the ``/Shading`` and ``/ExtGState`` entries the
+    operators refer to, ready to go inside a ``/Resources`` dictionary.
+    """
+
+    content: str
+    resources: str
+
+
+def _rounded_path(contour: Contour, height: float) -> str:
+    """PDF path operators for one contour, flipping y and drawing rounded corners as Beziers."""
+
+    def point(x: float, y: float) -> str:
+        return f"{_number(x)} {_number(height - y)}"
+
+    count = len(contour)
+    entries: List[Tuple[float, float]] = []
+    exits: List[Tuple[float, float]] = []
+    for index, (x, y, radius) in enumerate(contour):
+        in_x, in_y = _direction(contour[index - 1], contour[index])
+        out_x, out_y = _direction(contour[index], contour[(index + 1) % count])
+        entries.append((x - in_x * radius, y - in_y * radius))
+        exits.append((x + out_x * radius, y + out_y * radius))
+
+    operators = [f"{point(*exits[0])} m"]
+    for step in range(1, count + 1):
+        index = step % count
+        x, y, radius = contour[index]
+        entry, exit_ = entries[index], exits[index]
+        if entry != exits[index - 1]:
+            operators.append(f"{point(*entry)} l")
+        if radius:
+            first = (entry[0] + (x - entry[0]) * KAPPA, entry[1] + (y - entry[1]) * KAPPA)
+            second = (exit_[0] + (x - exit_[0]) * KAPPA, exit_[1] + (y - exit_[1]) * KAPPA)
+            operators.append(f"{point(*first)} {point(*second)} {point(*exit_)} c")
+    operators.append("h")
+    return " ".join(operators)
+
+
+class PdfRenderer:
+    """Render the logo as a :class:`PdfFragment`."""
+
+    def begin(self, geometry: LogoGeometry) -> None:
+        self.width = geometry.width
+        self.height = geometry.height
+        self.style = geometry.style
+        self.operators: List[str] = []
+        self.resources: Dict[str, Dict[str, str]] = {}
+        self.color = None
+
+    def add(self, shape: Shape) -> None:
+        path = " ".join(_rounded_path(contour, self.height) for contour in shape.contours)
+        if shape.kind == "background":
+            top, bottom = (" ".join(f"{value:.3f}" for value in _rgb(color)) for color in (self.style.bg_top, self.style.bg_bottom))
+            self.resources.setdefault("Shading", {})["LogoBg"] = (
+                f"<< /ShadingType 2 /ColorSpace /DeviceRGB /Coords [0 {self.height} 0 0] "
+                f"/Function << /FunctionType 2 /Domain [0 1] /C0 [{top}] /C1 [{bottom}] /N 1 >> >>"
+            )
+            self.operators.append(f"q {path} W n /LogoBg sh Q")
+        elif shape.kind == "highlight":
+            x0, y0, x1, y1 = _bounds(shape.contours[0])
+            cx, cy, radius = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2
+            # A point d from the centre sits inside n * (1 - d / radius) rings, so the alpha falls off roughly linearly.
+            alpha = 1 - (1 - HIGHLIGHT_OPACITY * HIGHLIGHT_CENTRE_OPACITY) ** (1 / HIGHLIGHT_RINGS)
+            self.resources.setdefault("ExtGState", {})["LogoGlow"] = f"<< /ca {alpha:.4f} >>"
+            rings = []
+            for ring in range(1, HIGHLIGHT_RINGS + 1):
+                r = radius * ring / HIGHLIGHT_RINGS
+                rings.append(f"{_rounded_path(_rounded_rect(cx - r, cy - r, 2 * r, 2 * r, r), self.height)} f")
+            # Like the SVG viewport, clip the glow to the canvas.
+            canvas = f"0 0 {_number(self.width)} {_number(self.height)} re W n"
+            self.operators.append(f"q {canvas} /LogoGlow gs 1 1 1 rg " + " ".join(rings) + " Q")
+            self.color = None
+        else:
+            if shape.color != self.color:
+                self.operators.append(" ".join(f"{value:.3f}" for value in _rgb(shape.color)) + " rg")
+                self.color = shape.color
+            self.operators.append(f"{path} f")
+
+    def finish(self) -> PdfFragment:
+        resources = " ".join(
+            f"/{category} << " + " ".join(f"/{name} {value}" for name, value in entries.items()) + " >>"
+            for category, entries in self.resources.items()
+        )
+        return PdfFragment("\n".join(self.operators) + "\n", resources)
+
+
+# --- Pipeline -------------------------------------------------------------
+
+
+def render_logo(geometry: LogoGeometry, renderers: Sequence) -> list:
+    """Feed every shape to every renderer in one pass and return their outputs in order."""
+
+    for renderer in renderers:
+        renderer.begin(geometry)
+    for shape in geometry.shapes:
+        for renderer in renderers:
+            renderer.add(shape)
+    return [renderer.finish() for renderer in renderers]
+
+
+def _build_svg(*, cells: bool = False, minify: bool = False, precision: int = 2) -> str:
+    return render_logo(build_geometry(cells=cells), [SvgRenderer(minify=minify, precision=precision)])[0]
+
+
+def pdf_fragment() -> PdfFragment:
+    """The logo as PDF operators, for drawing it as vector art inside another document."""
+
+    return render_logo(build_geometry(), [PdfRenderer()])[0]
+
+
+def png_path(name: str) -> Path:
+    return PNG_OUTPUT_DIR / f"aktonz-logo-modern-{name}.png"
+
+
+def count_elements(svg: str) -> int:
+    return len(re.findall(r"<(?![?/])", svg))
+
+
+def precompress(path: Path) -> List[Path]:
+    """Write ``.gz`` and, when brotli is installed, ``.br`` siblings of ``path`` for static hosting.
+
+    Siblings are rewritten only when their bytes change; the gzip header
+    carries no timestamp, so unchanged input gives identical output.
+    """
+
+    data = path.read_bytes()
+    encoded = [(path.with_name(f"{path.name}.gz"), gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoded.append((path.with_name(f"{path.name}.br"), brotli.compress(data, quality=11)))
+    written: List[Path] = []
+    for target, payload in encoded:
+        if not target.exists() or target.read_bytes() != payload:
+            target.write_bytes(payload)
+            written.append(target)
+    return written
+
+
+def generate_logo(
+    *,
+    cells: bool = False,
+    png: bool = True,
+    pdf_path: Path | None = None,
+    minify: bool = False,
+    precision: int = 2,
+    compress: bool = False,
+    compare: bool = False,
+) -> None:
+    """Write the SVG (and PNGs, and optionally the PDF fragment) from one pass over the geometry.
+
+    ``compare`` also reports what the other SVG mode (per-cell rects or merged
+    paths) would weigh, which costs a second geometry pass.
+    """
+
+    renderers: list = [SvgRenderer(minify=minify, precision=precision)]
+    targets = PNG_TARGETS if png else ()
+    renderers.extend(PngRenderer(width, height) for _, width, height in targets)
+    if pdf_path is not None:
+        renderers.append(PdfRenderer())
+    outputs = render_logo(build_geometry(cells=cells), renderers)
+
+    svg = outputs[0]
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(_build_svg(), encoding="utf-8")
+    OUTPUT_PATH.write_text(svg, encoding="utf-8")
+    summary = f"Wrote {OUTPUT_PATH}: {count_elements(svg)} elements, {len(svg.encode('utf-8')):,} bytes"
+    if compare:
+        other = _build_svg(cells=not cells, minify=minify, precision=precision)
+        label = "per-cell rects" if not cells else "merged paths"
+        summary += f" ({label}: {count_elements(other)} elements, {len(other.encode('utf-8')):,} bytes)"
+    print(summary)
+    if compress:
+        for path in precompress(OUTPUT_PATH):
+            print(f"Wrote {path}: {path.stat().st_size:,} bytes")
+
+    for (name, width, height), data in zip(targets, outputs[1:]):
+        path = png_path(name)
+        path.write_bytes(data)
+        print(f"Wrote {path}: {width}x{height}, {len(data):,} bytes")
+
+    if pdf_path is not None:
+        fragment = outputs[-1]
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf_path.write_text(f"% Resources: {fragment.resources}\n{fragment.content}", encoding="ascii")
+        print(f"Wrote {pdf_path}: {len(fragment.content):,} bytes of content stream")
+
+
+# --- Variants -------------------------------------------------------------
+
+
+class LogoVariant(NamedTuple):
+    """One entry of a variants spec: ``<name>.svg`` plus ``<name>-<w>x<h>.png`` per size."""
+
+    name: str
+    style: LogoStyle = DEFAULT_STYLE
+    svg: bool = True
+    png_sizes: Tuple[Tuple[int, int], ...] = ()
+
+
+class VariantReport(NamedTuple):
+    written: List[Path]
+    unchanged: List[Path]
+
+
+_COLOR_PATTERN = re.compile(r"#[0-9a-fA-F]{6}")
+_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.@-]*")
+
+
+def _is_number(value: object, *, integer: bool = False) -> bool:
+    # bool is an int subclass, but ``"scale": true`` is a spec mistake, not 1.
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) if integer else isinstance(value, (int, float))
+
+
+def _png_size(name: str, size: object) -> Tuple[int, int]:
+    if (
+        not isinstance(size, (list, tuple))
+        or len(size) != 2
+        or not all(_is_number(value, integer=True) and value > 0 for value in size)
+    ):
+        raise ValueError(f"Variant {name!r}: PNG size {size!r} must be [width, height] in positive whole pixels")
+    return size[0], size[1]
+
+
+def parse_variant(entry: dict) -> LogoVariant:
+    """Build a :class:`LogoVariant` from one spec entry, rejecting unknown keys and bad values.
+
+    Everything :func:`render_variants` would trip over is checked here, so a bad
+    spec fails before any output is written.
+    """
+
+    entry = dict(entry)
+    name = entry.pop("name", None)
+    if not isinstance(name, str) or not _NAME_PATTERN.fullmatch(name):
+        raise ValueError(f"Variant name {name!r} is not a plain file name")
+    svg = entry.pop("svg", True)
+    if not isinstance(svg, bool):
+        raise ValueError(f"Variant {name!r}: svg must be true or false")
+    png = entry.pop("png", ())
+    if not isinstance(png, (list, tuple)):
+        raise ValueError(f"Variant {name!r}: png must be a list of [width, height] sizes")
+    png_sizes = tuple(_png_size(name, size) for size in png)
+    unknown = set(entry) - set(LogoStyle._fields)
+    if unknown:
+        raise ValueError(f"Variant {name!r} has unknown keys: {', '.join(sorted(unknown))}")
+    style = DEFAULT_STYLE._replace(**entry)
+
+    for field in ("word", "title", "description", "bg_top", "bg_bottom", "text_color"):
+        if not isinstance(getattr(style, field), str):
+            raise ValueError(f"Variant {name!r}: {field} must be a string")
+    for field in ("bg_top", "bg_bottom", "text_color"):
+        if not _COLOR_PATTERN.fullmatch(getattr(style, field)):
+            raise ValueError(f"Variant {name!r}: {field} must be a #rrggbb colour")
+    for field, integer in (("scale", False), ("spacing", False), ("width", True), ("height", True)):
+        value = getattr(style, field)
+        if not _is_number(value, integer=integer):
+            raise ValueError(f"Variant {name!r}: {field} must be {'a whole number' if integer else 'a number'}")
+        if value < 0 or (value == 0 and field != "spacing"):
+            raise ValueError(f"Variant {name!r}: {field} must be positive")
+
+    if not style.word:
+        raise ValueError(f"Variant {name!r}: word must not be empty")
+    missing = sorted(set(style.word) - set(FONT))
+    if missing:
+        raise ValueError(f"Variant {name!r}: the logo font has no glyph for {', '.join(map(repr, missing))}")
+    text_width, text_height = _word_size(style)
+    if text_width > style.width or text_height > style.height:
+        raise ValueError(
+            f"Variant {name!r}: {style.word!r} at scale {style.scale} needs {text_width}x{text_height}, "
+            f"more than the {style.width}x{style.height} canvas"
+        )
+    if not svg and not png_sizes:
+        raise ValueError(f"Variant {name!r} produces no outputs")
+    return LogoVariant(name, style, svg, png_sizes)
+
+
+def load_variants(path: Path) -> List[LogoVariant]:
+    """Read a JSON list of variant entries (see ``data/aktonz-logo-variants.json``)."""
+
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} must contain a JSON list of variants")
+    variants = [parse_variant(entry) for entry in entries]
+    names = [variant.name for variant in variants]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate variant names in {path}: {', '.join(duplicates)}")
+    return variants
+
+
+def _variant_outputs(variant: LogoVariant) -> List[Tuple[str, Optional[Tuple[int, int]]]]:
+    outputs: List[Tuple[str, Optional[Tuple[int, int]]]] = []
+    if variant.svg:
+        outputs.append((f"{variant.name}.svg", None))
+    outputs.extend((f"{variant.name}-{width}x{height}.png", (width, height)) for width, height in variant.png_sizes)
+    return outputs
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_variant_manifest(output_dir: Path) -> dict:
+    path = output_dir / VARIANTS_MANIFEST_NAME
+    if not path.exists():
+        return {}
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if manifest.get("version") != VARIANTS_MANIFEST_VERSION:
+        return {}
+    return manifest.get("outputs", {})
+
+
+def write_variant_manifest(output_dir: Path, entries: dict) -> None:
+    path = output_dir / VARIANTS_MANIFEST_NAME
+    temporary = path.with_suffix(".tmp")
+    payload = {"version": VARIANTS_MANIFEST_VERSION, "outputs": dict(sorted(entries.items()))}
+    temporary.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    temporary.replace(path)
+
+
+def render_variants(
+    variants: Iterable[LogoVariant],
+    output_dir: Path = VARIANTS_OUTPUT_DIR,
+    *,
+    force: bool = False,
+    minify: bool = False,
+    precision: int = 2,
+    compress: bool = False,
+) -> VariantReport:
+    """Render every variant into ``output_dir``, skipping outputs that are already up to date.
+
+    The manifest records, per output file, a fingerprint of its style, size
+    and this generator, plus the SHA-256 of the bytes written. An output whose
+    fingerprint is unchanged and whose file on disk still hashes to the
+    recorded digest is not rendered at all; a re-rendered output is only
+    rewritten when its bytes differ. ``minify`` and ``precision`` apply to
+    the SVGs, and ``compress`` keeps :func:`precompress` siblings next to them.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = {} if force else load_variant_manifest(output_dir)
+    generator_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    entries: dict = {}
+    report = VariantReport([], [])
+    try:
+        for variant in variants:
+            stale: List[Tuple[str, Optional[Tuple[int, int]], str]] = []
+            for filename, size in _variant_outputs(variant):
+                options = f"{minify}:{precision}" if size is None else ""
+                fingerprint = hashlib.sha256(
+                    f"{generator_hash}:{json.dumps(variant.style._asdict(), sort_keys=True)}:{size}:{options}".encode("utf-8")
+                ).hexdigest()
+                recorded = previous.get(filename)
+                path = output_dir / filename
+                if recorded and recorded["fingerprint"] == fingerprint and _file_digest(path) == recorded["sha256"]:
+                    entries[filename] = recorded
+                    report.unchanged.append(path)
+                else:
+                    stale.append((filename, size, fingerprint))
+            if stale:
+                renderers = [
+                    SvgRenderer(minify=minify, precision=precision) if size is None else PngRenderer(*size)
+                    for _, size, _ in stale
+                ]
+                outputs = render_logo(build_geometry(style=variant.style), renderers)
+                for (filename, _, fingerprint), output in zip(stale, outputs):
+                    data = output.encode("utf-8") if isinstance(output, str) else output
+                    digest = hashlib.sha256(data).hexdigest()
+                    path = output_dir / filename
+                    if _file_digest(path) == digest:
+                        report.unchanged.append(path)
+                    else:
+                        path.write_bytes(data)
+                        report.written.append(path)
+                    entries[filename] = {"fingerprint": fingerprint, "sha256": digest}
+            if compress and variant.svg:
+                report.written.extend(precompress(output_dir / f"{variant.name}.svg"))
+    finally:
+        # Outputs dropped from the spec are forgotten but left on disk.
+        write_variant_manifest(output_dir, entries)
+    return report
 
 
 if __name__ == "__main__":
-    generate_logo()
+    parser = argparse.ArgumentParser(description="Regenerate the Aktonz logo SVG and PNGs, or a batch of variants.")
+    parser.add_argument("--cells", action="store_true", help="Emit one <rect> per lit cell instead of one path per glyph.")
+    parser.add_argument("--no-png", dest="png", action="store_false", help="Only write the SVG.")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Also report the size of the other SVG mode (--cells or not); renders the geometry twice.",
+    )
+    parser.add_argument(
+        "--pdf-fragment",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Also write the logo as PDF content-stream operators (resources listed in a leading comment).",
+    )
+    parser.add_argument(
+        "--variants",
+        type=Path,
+        default=None,
+        metavar="SPEC",
+        help="Render the variants listed in a JSON spec instead of the header logo.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=VARIANTS_OUTPUT_DIR,
+        help=f"Directory for --variants outputs and their manifest (default: {VARIANTS_OUTPUT_DIR}).",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-render every variant, ignoring the manifest.")
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Write minified SVGs: no whitespace, shortened numbers, shared fills hoisted into <g>.",
+    )
+    parser.add_argument("--precision", type=int, default=2, help="Decimals kept in SVG coordinates (default: 2).")
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write .svg.gz and, if the brotli package is installed, .svg.br siblings.",
+    )
+    args = parser.parse_args()
+    if args.precision < 0:
+        parser.error("--precision must not be negative")
+    if args.precompress and brotli is None:
+        print("brotli is not installed; writing .gz siblings only", file=sys.stderr)
+    svg_options = {"minify": args.minify, "precision": args.precision, "compress": args.precompress}
+    if args.variants is None:
+        generate_logo(cells=args.cells, png=args.png, pdf_path=args.pdf_fragment, compare=args.compare, **svg_options)
+    else:
+        report = render_variants(load_variants(args.variants), args.output_dir, force=args.force, **svg_options)
+        for path in report.written:
+            print(f"Wrote {path}")
+        print(f"{len(report.written)} variant files written, {len(report.unchanged)} up to date in {args.output_dir}")
@@ -0,0 +1,321 @@
+"""Render listing brochures across a pool of worker processes.
+
+Each worker imports the brochure generator (decoding the logo once, on first use), registers
+the requested fonts and renders the shared static pages in its initializer, so
+listings only pay for their own pages. Listings are dispatched in chunks to
+keep inter-process overhead small at tens of thousands of listings.
+
+With ``--incremental`` a manifest in the output directory records a
+fingerprint per brochure (the listing's ``updateMd5Hash`` plus hashes of the
+generator, fonts and assets) so only changed listings are re-rendered, and
+brochures for removed or archived listings are deleted.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+for path in (ROOT, SCRIPTS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import create_aktonz_lettings_brochure as brochure
+from data.aktonz_logo_modern_transparent import logo_png
+
+DEFAULT_CHUNK_SIZE = 16
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+class RenderConfig(NamedTuple):
+    """Font, kerning and logo settings every worker applies before rendering."""
+
+    fonts: Tuple[Tuple[str, str], ...] = ()
+    font_cache: Optional[str] = str(brochure.FONT_CACHE_DIR)
+    kerning: bool = False
+    vector_logo: bool = False
+
+
+class RenderResult(NamedTuple):
+    listing_id: int
+    path: Optional[Path]
+    pdf: Optional[bytes]
+    seconds: float
+
+
+_WORKER_RESOURCES: List[brochure.SharedResources] = []
+
+
+def configure_worker(config: RenderConfig) -> None:
+    """Apply ``config`` and prepare the shared resources for this process."""
+
+    cache_dir = Path(config.font_cache) if config.font_cache else None
+    for resource, font_path in config.fonts:
+        brochure.register_truetype_font(resource, Path(font_path), cache_dir=cache_dir)
+    brochure.enable_kerning(config.kerning)
+    brochure.use_vector_logo(config.vector_logo)
+    _WORKER_RESOURCES[:] = [brochure.prepare_shared_resources()]
+
+
+def worker_resources() -> brochure.SharedResources:
+    return _WORKER_RESOURCES[0]
+
+
+def render_chunk(listings: Sequence[dict], output_dir: Optional[str]) -> List[RenderResult]:
+    """Render ``listings`` in this worker, writing files when ``output_dir`` is set."""
+
+    resources = worker_resources()
+    results: List[RenderResult] = []
+    for listing in listings:
+        started = time.perf_counter()
+        pdf_bytes = brochure.build_listing_brochure(listing, resources)
+        path: Optional[Path] = None
+        if output_dir is not None:
+            path = Path(output_dir) / brochure.listing_filename(listing)
+            path.write_bytes(pdf_bytes)
+            pdf_bytes = None
+        results.append(RenderResult(listing["id"], path, pdf_bytes, time.perf_counter() - started))
+    brochure.report_unmappable_characters()
+    return results
+
+
+def _chunks(listings: Sequence[dict], size: int) -> Iterator[Sequence[dict]]:
+    for start in range(0, len(listings), size):
+        yield listings[start : start + size]
+
+
+def render_listings(
+    listings: Iterable[dict],
+    *,
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    config: RenderConfig = RenderConfig(),
+) -> Iterator[RenderResult]:
+    """Yield a :class:`RenderResult` per listing as chunks complete.
+
+    Results carry the written path when ``output_dir`` is given, otherwise the
+    PDF bytes. ``workers=1`` renders in-process, which is handy for profiling.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    listings = list(listings)
+    target = str(output_dir) if output_dir is not None else None
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Never start more workers than there are chunks; a handful of listings renders in-process.
+    workers = min(workers or os.cpu_count() or 1, max(-(-len(listings) // chunk_size), 1))
+    if workers == 1:
+        configure_worker(config)
+        for chunk in _chunks(listings, chunk_size):
+            yield from render_chunk(chunk, target)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=configure_worker, initargs=(config,)) as executor:
+        futures = [executor.submit(render_chunk, chunk, target) for chunk in _chunks(listings, chunk_size)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+# --- Incremental regeneration ---------------------------------------------
+
+
+class IncrementalReport(NamedTuple):
+    rendered: List[RenderResult]
+    unchanged: int
+    removed: List[Path]
+
+
+def run_fingerprint(config: RenderConfig) -> str:
+    """Hash everything besides the listing itself that shapes a brochure."""
+
+    digest = hashlib.sha256(f"v{MANIFEST_VERSION}".encode("ascii"))
+    for path in (Path(brochure.__file__), Path(__file__), brochure.HELVETICA_METRICS_PATH):
+        digest.update(path.read_bytes())
+    if config.vector_logo:
+        digest.update(b"vector")
+        digest.update(Path(brochure.generate_aktonz_logo.__file__).read_bytes())
+    else:
+        # The raw PNG identifies the logo; there is no need to decode it.
+        digest.update(logo_png())
+    for resource, font_path in config.fonts:
+        digest.update(resource.encode("ascii"))
+        digest.update(Path(font_path).read_bytes())
+    digest.update(b"kerning" if config.kerning else b"plain")
+    return digest.hexdigest()
+
+
+def listing_fingerprint(listing: dict, run_hash: str) -> str:
+    listing_hash = listing.get("updateMd5Hash")
+    if not listing_hash:
+        listing_hash = hashlib.md5(json.dumps(listing, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{listing_hash}:{run_hash}"
+
+
+def load_manifest(output_dir: Path) -> dict:
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("listings", {})
+
+
+def write_manifest(output_dir: Path, entries: dict) -> None:
+    path = output_dir / MANIFEST_NAME
+    temporary = path.with_suffix(".tmp")
+    payload = {"version": MANIFEST_VERSION, "listings": dict(sorted(entries.items()))}
+    temporary.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    temporary.replace(path)
+
+
+def render_incremental(
+    listings: Iterable[dict],
+    output_dir: Path,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    config: RenderConfig = RenderConfig(),
+) -> IncrementalReport:
+    """Re-render only listings whose fingerprint changed since the last run.
+
+    ``listings`` is the full export: archived listings, and listings missing
+    from it, have their previously generated brochures deleted. Only files the
+    manifest recorded are ever removed.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(output_dir)
+    run_hash = run_fingerprint(config)
+
+    entries: dict = {}
+    written: dict = {}
+    stale: List[dict] = []
+    for listing in listings:
+        if listing.get("archived"):
+            continue
+        key = str(listing["id"])
+        entry = {"file": brochure.listing_filename(listing), "fingerprint": listing_fingerprint(listing, run_hash)}
+        entries[key] = entry
+        if previous.get(key) == entry and (output_dir / entry["file"]).exists():
+            written[key] = entry
+        else:
+            stale.append(listing)
+    unchanged = len(written)
+
+    removed: List[Path] = []
+    for key, entry in previous.items():
+        if key not in entries:
+            path = output_dir / entry["file"]
+            if path.exists():
+                path.unlink()
+                removed.append(path)
+
+    # Record only what has actually been rendered, so an interrupted run resumes cleanly.
+    rendered: List[RenderResult] = []
+    try:
+        for result in render_listings(
+            stale, output_dir=output_dir, workers=workers, chunk_size=chunk_size, config=config
+        ):
+            key = str(result.listing_id)
+            written[key] = entries[key]
+            rendered.append(result)
+    finally:
+        write_manifest(output_dir, written)
+    return IncrementalReport(rendered, unchanged, removed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render listing brochures in parallel.")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=brochure.LISTINGS_PATH,
+        help="Listings export to read (default: data/listings.json).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=brochure.LISTINGS_OUTPUT_DIR,
+        help=f"Directory for the brochures (default: {brochure.LISTINGS_OUTPUT_DIR}).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes to start (default: one per CPU; 1 renders in-process).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Listings handed to a worker per task (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    for resource, option in (("F1", "--font-regular"), ("F2", "--font-bold"), ("F3", "--font-italic")):
+        parser.add_argument(option, dest=f"font_{resource}", type=Path, help=f"TrueType file to embed for {resource}.")
+    parser.add_argument(
+        "--font-cache",
+        type=Path,
+        default=brochure.FONT_CACHE_DIR,
+        help="Directory for cached font metrics and subsets.",
+    )
+    parser.add_argument("--kerning", action="store_true", help="Apply Helvetica kern pairs.")
+    parser.add_argument("--vector-logo", action="store_true", help="Draw the vector wordmark instead of the PNG logo.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Only re-render listings whose fingerprint changed (tracked in {MANIFEST_NAME}) and delete stale brochures.",
+    )
+    args = parser.parse_args()
+
+    fonts = tuple(
+        (resource, str(getattr(args, f"font_{resource}").resolve()))
+        for resource in brochure.STANDARD_FONTS
+        if getattr(args, f"font_{resource}") is not None
+    )
+    render_config = RenderConfig(
+        fonts=fonts, font_cache=str(args.font_cache), kerning=args.kerning, vector_logo=args.vector_logo
+    )
+
+    started = time.perf_counter()
+    if args.incremental:
+        report = render_incremental(
+            json.loads(args.input.read_text(encoding="utf-8")),
+            args.output_dir,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            config=render_config,
+        )
+        results = report.rendered
+        print(f"{report.unchanged} brochures unchanged, {len(report.removed)} removed")
+    else:
+        results = list(
+            render_listings(
+                brochure.load_listings(args.input),
+                output_dir=args.output_dir,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                config=render_config,
+            )
+        )
+    elapsed = time.perf_counter() - started
+    timings = [result.seconds for result in results]
+    if timings:
+        print(
+            f"Rendered {len(timings)} brochures into {args.output_dir} in {elapsed:.2f}s "
+            f"(mean {sum(timings) / len(timings) * 1000:.1f} ms, slowest {max(timings) * 1000:.1f} ms per listing)"
+        )
+    else:
+        print(f"No listings to render ({elapsed:.2f}s)")
@@ -0,0 +1,323 @@
+"""Serve brochures over HTTP, rendering them on demand in a process pool.
+
+Routes:
+
+* ``GET /listings/<id>.pdf`` renders the brochure for one listing.
+* ``GET /aktonz-lettings-brochure.pdf`` renders the marketing brochure.
+* ``GET /healthz`` reports the number of renders in flight.
+
+Concurrent requests for the same listing version share one in-flight render.
+Once ``--max-pending`` renders are queued or running, new renders are refused
+with ``503`` and ``Retry-After`` instead of piling up behind the pool.
+
+PDFs are sent with chunked transfer encoding while they render: workers pass
+each finished object back through a queue, so the first bytes leave as soon as
+the header and logo are written, whatever the page count. A render that fails
+before its first chunk is reported as ``500``; one that fails later closes the
+connection without the final chunk, so the client sees a truncated transfer.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+for path in (ROOT, SCRIPTS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import create_aktonz_lettings_brochure as brochure
+from render_listing_brochures import RenderConfig, configure_worker, listing_fingerprint, run_fingerprint, worker_resources
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_PENDING = 32
+RETRY_AFTER_SECONDS = 2
+
+
+class ServiceBusy(Exception):
+    """Raised when the render queue is full."""
+
+
+def _send_chunks(chunks, pieces: Iterable[bytes]) -> None:
+    for piece in pieces:
+        chunks.put(piece)
+
+
+def _render_listing(chunks, listing: dict) -> None:
+    _send_chunks(chunks, brochure.listing_chunks(listing, worker_resources()))
+    brochure.report_unmappable_characters()
+
+
+def _render_marketing_brochure(chunks) -> None:
+    _send_chunks(chunks, brochure.brochure_chunks())
+
+
+class RenderStream:
+    """The chunks of one render, replayed to every client that shares it."""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def append(self, chunk: bytes) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        index = 0
+        while True:
+            if index < len(self.chunks):
+                index += 1
+                yield self.chunks[index - 1]
+            elif self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            else:
+                await self._changed.wait()
+
+
+Body = Union[bytes, RenderStream]
+
+
+class BrochureService:
+    def __init__(
+        self,
+        *,
+        listings_path: Path = brochure.LISTINGS_PATH,
+        workers: Optional[int] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        config: RenderConfig = RenderConfig(),
+    ) -> None:
+        self.listings_path = listings_path
+        self.max_pending = max_pending
+        self.run_hash = run_fingerprint(config)
+        # Spawned (not forked) workers: a forked child would inherit open client sockets and hold them open.
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=configure_worker,
+            initargs=(config,),
+        )
+        # Workers hand chunks back through managed queues; a thread per render waits on each.
+        self.manager = multiprocessing.get_context("spawn").Manager()
+        self.readers = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="brochure-chunks")
+        self.inflight: Dict[Tuple[str, str], RenderStream] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._listings: dict = {}
+        self._listings_stamp: Optional[int] = None
+
+    def listing(self, listing_id: str) -> Optional[dict]:
+        """Look up a listing, re-reading the export only when it changes on disk."""
+
+        stamp = self.listings_path.stat().st_mtime_ns
+        if stamp != self._listings_stamp:
+            self._listings = {str(listing["id"]): listing for listing in brochure.load_listings(self.listings_path)}
+            self._listings_stamp = stamp
+        return self._listings.get(listing_id)
+
+    def render(self, key: Tuple[str, str], function, *args) -> RenderStream:
+        """Run ``function`` in the pool, sharing its stream of chunks with identical requests.
+
+        Raises :class:`ServiceBusy` straight away when the queue is full, before
+        any response has been started. The render runs to completion even if
+        every client disconnects.
+        """
+
+        stream = self.inflight.get(key)
+        if stream is None:
+            if len(self.inflight) >= self.max_pending:
+                raise ServiceBusy()
+            stream = self.inflight[key] = RenderStream()
+            task = asyncio.ensure_future(self._run(key, stream, function, args))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return stream
+
+    async def _run(self, key: Tuple[str, str], stream: RenderStream, function, args: tuple) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = self.manager.Queue()
+            future = loop.run_in_executor(self.executor, function, chunks, *args)
+            # Queued from this process once the worker returns or dies, so the reader always wakes up.
+            future.add_done_callback(lambda _: chunks.put(None))
+            while True:
+                chunk = await loop.run_in_executor(self.readers, chunks.get)
+                if chunk is None:
+                    break
+                stream.append(chunk)
+            await future
+        except Exception as error:
+            stream.finish(error)
+        else:
+            stream.finish()
+        finally:
+            self.inflight.pop(key, None)
+
+    def respond(self, method: str, target: str, headers: dict) -> Tuple[HTTPStatus, dict, Body]:
+        if method not in ("GET", "HEAD"):
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"Allow": "GET, HEAD"}, b""
+        path = target.split("?", 1)[0]
+
+        if path == "/healthz":
+            body = json.dumps({"status": "ok", "inflight": len(self.inflight)}).encode("utf-8")
+            return HTTPStatus.OK, {"Content-Type": "application/json"}, body
+
+        if path == "/aktonz-lettings-brochure.pdf":
+            key = ("brochure", self.run_hash)
+            function, args = _render_marketing_brochure, ()
+        elif path.startswith("/listings/") and path.endswith(".pdf"):
+            listing = self.listing(path[len("/listings/") : -len(".pdf")])
+            if listing is None:
+                return HTTPStatus.NOT_FOUND, {"Content-Type": "text/plain"}, b"Unknown listing\n"
+            key = (str(listing["id"]), listing_fingerprint(listing, self.run_hash))
+            function, args = _render_listing, (listing,)
+        else:
+            return HTTPStatus.NOT_FOUND, {"Content-Type": "text/plain"}, b"Not found\n"
+
+        etag = f'"{key[1]}"'
+        if headers.get("if-none-match") == etag:
+            return HTTPStatus.NOT_MODIFIED, {"ETag": etag}, b""
+        if method == "HEAD":
+            return HTTPStatus.OK, {"Content-Type": "application/pdf", "ETag": etag}, b""
+        try:
+            render = self.render(key, function, *args)
+        except ServiceBusy:
+            headers_out = {"Content-Type": "text/plain", "Retry-After": str(RETRY_AFTER_SECONDS)}
+            return HTTPStatus.SERVICE_UNAVAILABLE, headers_out, b"Render queue is full\n"
+        return HTTPStatus.OK, {"Content-Type": "application/pdf", "ETag": etag}, render
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        chunks: Optional[AsyncIterator[bytes]] = None
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers: dict = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if len(request_line) != 3:
+                status, headers_out, body = HTTPStatus.BAD_REQUEST, {"Content-Type": "text/plain"}, b"Bad request\n"
+                method, target = "GET", ""
+            else:
+                method, target, _ = request_line
+                try:
+                    status, headers_out, body = self.respond(method, target, headers)
+                    if isinstance(body, RenderStream):
+                        # Wait for the first chunk only, so a render that fails straight away is still a 500.
+                        chunks = body.__aiter__()
+                        body = await chunks.__anext__()
+                except Exception as error:
+                    print(f"Request failed for {target}: {type(error).__name__}: {error}", file=sys.stderr)
+                    status, headers_out, body = HTTPStatus.INTERNAL_SERVER_ERROR, {"Content-Type": "text/plain"}, b"Request failed\n"
+                    chunks = None
+
+            if chunks is None:
+                headers_out = {**headers_out, "Content-Length": str(len(body)), "Connection": "close"}
+            else:
+                headers_out = {**headers_out, "Transfer-Encoding": "chunked", "Connection": "close"}
+            lines: List[str] = [f"HTTP/1.1 {status.value} {status.phrase}"]
+            lines.extend(f"{name}: {value}" for name, value in headers_out.items())
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            if chunks is None:
+                if method != "HEAD":
+                    writer.write(body)
+            else:
+                await self._send_chunked(writer, body, chunks, target)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _send_chunked(
+        self, writer: asyncio.StreamWriter, first: bytes, chunks: AsyncIterator[bytes], target: str
+    ) -> None:
+        writer.write(_chunk(first))
+        await writer.drain()
+        try:
+            async for chunk in chunks:
+                writer.write(_chunk(chunk))
+                await writer.drain()
+        except ConnectionError:
+            raise
+        except Exception as error:
+            # Headers are gone already; dropping the connection without the last chunk marks the body incomplete.
+            print(f"Render failed mid-stream for {target}: {type(error).__name__}: {error}", file=sys.stderr)
+            return
+        writer.write(b"0\r\n\r\n")
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self.manager.shutdown()
+        self.readers.shutdown(cancel_futures=True)
+
+
+def _chunk(data: bytes) -> bytes:
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+async def serve(service: BrochureService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    server = await asyncio.start_server(service.handle, host, port)
+    addresses = ", ".join(f"http://{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+    print(f"Serving brochures on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve listing brochures rendered on demand.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--listings",
+        type=Path,
+        default=brochure.LISTINGS_PATH,
+        help="Listings export to serve (default: data/listings.json).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: one per CPU).")
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=DEFAULT_MAX_PENDING,
+        help=f"Renders queued or running before new ones get 503 (default: {DEFAULT_MAX_PENDING}).",
+    )
+    parser.add_argument("--kerning", action="store_true", help="Apply Helvetica kern pairs.")
+    parser.add_argument("--vector-logo", action="store_true", help="Draw the vector wordmark instead of the PNG logo.")
+    args = parser.parse_args()
+
+    brochure_service = BrochureService(
+        listings_path=args.listings,
+        workers=args.workers,
+        max_pending=args.max_pending,
+        config=RenderConfig(kerning=args.kerning, vector_logo=args.vector_logo),
+    )
+    try:
+        asyncio.run(serve(brochure_service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        brochure_service.close()
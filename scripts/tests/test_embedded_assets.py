@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+import embedded_assets
+
+
+def tracked_files() -> Set[str]:
+    try:
+        listing = subprocess.run(
+            ["git", "ls-files", "-z"], cwd=embedded_assets.ROOT, check=True, capture_output=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("not a git checkout")
+    return set(listing.decode("utf-8").split("\0")) - {""}
+
+
+@pytest.fixture
+def clean_checkout(tmp_path: Path) -> Path:
+    """The files the registry refers to, as a fresh clone would have them."""
+
+    tracked = tracked_files()
+    for asset in embedded_assets.load_registry():
+        for path in (asset.source, *asset.targets):
+            if path.as_posix() in tracked:
+                (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(embedded_assets.ROOT / path, tmp_path / path)
+    return tmp_path
+
+
+def test_no_target_is_tracked() -> None:
+    tracked = tracked_files()
+    targets = [target.as_posix() for asset in embedded_assets.load_registry() for target in asset.targets]
+
+    assert [target for target in targets if target in tracked] == []
+
+
+def test_check_passes_on_a_clean_checkout(clean_checkout: Path) -> None:
+    results = embedded_assets.restore_assets(embedded_assets.load_registry(), root=clean_checkout, check_only=True)
+
+    assert results
+    assert {result.status for result in results} <= {"ok", "missing"}
+
+
+def test_restore_matches_the_manifest_and_leaves_tracked_files_alone(clean_checkout: Path) -> None:
+    before = {path: path.read_bytes() for path in clean_checkout.rglob("*") if path.is_file()}
+
+    restored = embedded_assets.restore_assets(embedded_assets.load_registry(), root=clean_checkout)
+    checked = embedded_assets.restore_assets(embedded_assets.load_registry(), root=clean_checkout, check_only=True)
+
+    assert {result.status for result in restored} <= {"ok", "restored"}
+    assert {result.status for result in checked} == {"ok"}
+    assert all(path.read_bytes() == data for path, data in before.items())
+
+
+def test_check_reports_a_corrupt_target(clean_checkout: Path) -> None:
+    asset = embedded_assets.load_registry()[0]
+    target = clean_checkout / asset.targets[0]
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(b"not the asset")
+
+    results = embedded_assets.restore_assets([asset], root=clean_checkout, check_only=True)
+
+    assert results[0].status == "corrupt"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+COPY = ["Modern service. Local expertise. Trusted results."]
+
+
+def text_height(size: float, *, leading: Optional[float] = None, width: float = 200) -> float:
+    return brochure.TextNode(COPY, font="F2", size=size, leading=leading).measure(width)
+
+
+def test_copy_that_fits_keeps_the_maximum_size() -> None:
+    assert brochure.fit_font_size(text_height, 1000, minimum=10, maximum=26) == 26
+
+
+def test_copy_that_never_fits_falls_back_to_the_minimum() -> None:
+    tried: List[float] = []
+
+    def measure(size: float) -> float:
+        tried.append(size)
+        return text_height(size)
+
+    assert brochure.fit_font_size(measure, 5, minimum=10, maximum=26) == 10
+    assert 10 not in tried
+
+
+def test_single_line_gets_the_largest_size_that_stays_on_one_line() -> None:
+    def one_line(size: float) -> float:
+        return brochure.TextNode(COPY, font="F2", size=size).measure(1000)
+
+    size = brochure.fit_font_size(one_line, 30, minimum=10, maximum=40)
+
+    assert size == 25
+    assert one_line(size) == pytest.approx(size * 1.2)
+
+
+def test_fit_leading_only_tightens_as_far_as_needed() -> None:
+    def measure(leading: float) -> float:
+        return text_height(12, leading=leading)
+
+    loose = brochure.fit_leading(measure, 1000, minimum=12, preferred=16)
+    tight = brochure.fit_leading(measure, measure(14), minimum=12, preferred=16)
+
+    assert loose == 16
+    assert tight == 14
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Iterator, List
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+
+@pytest.fixture
+def measured(monkeypatch: pytest.MonkeyPatch) -> Iterator[List[brochure.TextNode]]:
+    """Record every wrap of a text node's own copy (not the flow engine's split halves)."""
+
+    calls: List[brochure.TextNode] = []
+    measure = brochure.TextNode._measure
+
+    def counting_measure(node: brochure.TextNode, width: float) -> float:
+        if not node.prewrapped:
+            calls.append(node)
+        return measure(node, width)
+
+    monkeypatch.setattr(brochure.TextNode, "_measure", counting_measure)
+    yield calls
+
+
+def test_brochure_tree_is_built_once() -> None:
+    assert brochure.brochure_tree() is brochure.brochure_tree()
+
+
+def test_repeat_render_reuses_measurements(measured: List[brochure.TextNode]) -> None:
+    first = brochure.brochure_document().build()
+    measured.clear()
+
+    second = brochure.brochure_document().build()
+
+    assert measured == []
+    assert second == first
+
+
+def test_update_only_rewraps_the_changed_node(measured: List[brochure.TextNode]) -> None:
+    brochure.brochure_document()
+    node = brochure.brochure_tree().faq_intro
+    paragraphs = list(node.paragraphs)
+    measured.clear()
+
+    try:
+        node.update(paragraphs=[*paragraphs, "One more line of guidance."])
+        brochure.brochure_document()
+
+        assert measured == [node]
+    finally:
+        node.update(paragraphs=paragraphs)
+
+
+def test_image_node_defaults_to_the_logo() -> None:
+    width, height = brochure.logo_size()
+    logo = brochure.ImageNode(220)
+
+    assert logo.measure(455) == pytest.approx(220 * height / width)
+    assert logo.render(10, 300, 455) == [brochure.draw_logo(10, 300 - logo.measure(455), 220)]
+
+
+def test_row_cards_share_the_tallest_column_height() -> None:
+    short = brochure.TextNode(["One line"], size=10, leading=13)
+    tall = brochure.TextNode(["First", "Second", "Third"], size=10, leading=13)
+    row = brochure.RowNode([short, tall], gap=5.0, fill_color=brochure.PALE_BLUE, padding_top=20.0, padding_bottom=10.0)
+
+    height = row.measure(205)
+    commands = row.render(0, 500, 205)
+
+    assert height == pytest.approx(20.0 + tall.measure(100) + 10.0)
+    assert commands[0] == brochure.filled_rect(0, 500 - height, 100, height, brochure.PALE_BLUE)
+    assert brochure.filled_rect(105, 500 - height, 100, height, brochure.PALE_BLUE) in commands
+
+
+def test_pricing_card_node_matches_the_drawn_card() -> None:
+    bullets = ["Tenant marketing across portals.", "Accompanied viewings and expert negotiation."]
+    node = brochure.pricing_card_node("Let Only", "7% of first year's rent", bullets)
+
+    measured = brochure.measure_pricing_card(630, 148, "Let Only", "7% of first year's rent", bullets)
+
+    assert node.measure(148) == pytest.approx(measured.height)
+
+
+def test_brochure_text_starts_below_the_cards() -> None:
+    tree = brochure.brochure_tree()
+    for nodes, top in ((tree.pricing, 670), (tree.areas, 700)):
+        (page,) = brochure.flow_pages(nodes, first_frame=brochure.Frame(70, top, 455), default_gap=24.0)
+        row_index = next(index for index, (_, _, _, node) in enumerate(page) if isinstance(node, brochure.RowNode))
+        _, row_top, width, row = page[row_index]
+        for _, text_top, _, node in page[row_index + 1 :]:
+            assert text_top < row_top - row.measure(width)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+import render_listing_brochures as render
+
+
+@pytest.fixture(scope="module")
+def listings() -> List[dict]:
+    return brochure.load_listings()[:3]
+
+
+@pytest.fixture(scope="module")
+def resources() -> brochure.SharedResources:
+    return brochure.prepare_shared_resources()
+
+
+def incremental(listings: List[dict], output_dir: Path) -> render.IncrementalReport:
+    return render.render_incremental(listings, output_dir, workers=1, chunk_size=1)
+
+
+def manifest_ids(output_dir: Path) -> List[str]:
+    return list(render.load_manifest(output_dir))
+
+
+# --- render_incremental ----------------------------------------------------
+
+
+def test_second_run_keeps_unchanged_brochures(tmp_path: Path, listings: List[dict]) -> None:
+    first = incremental(listings, tmp_path)
+    written = {path: path.stat().st_mtime_ns for path in tmp_path.glob("*.pdf")}
+
+    second = incremental(listings, tmp_path)
+
+    assert len(first.rendered) == 3 and first.unchanged == 0
+    assert second.rendered == [] and second.unchanged == 3 and second.removed == []
+    assert {path: path.stat().st_mtime_ns for path in tmp_path.glob("*.pdf")} == written
+
+
+def test_changed_and_missing_files_are_rendered_again(tmp_path: Path, listings: List[dict]) -> None:
+    incremental(listings, tmp_path)
+    changed = dict(listings[0], updateMd5Hash="changed")
+    (tmp_path / brochure.listing_filename(listings[1])).unlink()
+
+    report = incremental([changed, *listings[1:]], tmp_path)
+
+    assert sorted(result.listing_id for result in report.rendered) == sorted([listings[0]["id"], listings[1]["id"]])
+    assert report.unchanged == 1
+
+
+def test_archived_and_missing_listings_are_removed(tmp_path: Path, listings: List[dict]) -> None:
+    incremental(listings, tmp_path)
+    unrelated = tmp_path / "keep-me.pdf"
+    unrelated.write_bytes(b"%PDF")
+    archived = dict(listings[1], archived=True)
+
+    report = incremental([listings[0], archived], tmp_path)
+
+    assert sorted(path.name for path in report.removed) == sorted(
+        brochure.listing_filename(listing) for listing in listings[1:]
+    )
+    assert sorted(path.name for path in tmp_path.glob("*.pdf")) == sorted(
+        [brochure.listing_filename(listings[0]), "keep-me.pdf"]
+    )
+    assert manifest_ids(tmp_path) == [str(listings[0]["id"])]
+
+
+def test_interrupted_run_records_only_what_was_rendered(
+    tmp_path: Path, listings: List[dict], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    build = brochure.build_listing_brochure
+
+    def interrupted(listing: dict, resources: brochure.SharedResources) -> bytes:
+        if listing["id"] == listings[1]["id"]:
+            raise KeyboardInterrupt
+        return build(listing, resources)
+
+    monkeypatch.setattr(brochure, "build_listing_brochure", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        incremental(listings, tmp_path)
+    assert manifest_ids(tmp_path) == [str(listings[0]["id"])]
+
+    monkeypatch.setattr(brochure, "build_listing_brochure", build)
+    report = incremental(listings, tmp_path)
+
+    assert sorted(result.listing_id for result in report.rendered) == sorted(
+        listing["id"] for listing in listings[1:]
+    )
+    assert report.unchanged == 1
+    assert sorted(manifest_ids(tmp_path)) == sorted(str(listing["id"]) for listing in listings)
+
+
+def test_manifest_from_another_version_renders_everything(tmp_path: Path, listings: List[dict]) -> None:
+    incremental(listings, tmp_path)
+    manifest = tmp_path / render.MANIFEST_NAME
+    payload = json.loads(manifest.read_text(encoding="utf-8"))
+    manifest.write_text(json.dumps(dict(payload, version=render.MANIFEST_VERSION + 1)), encoding="utf-8")
+
+    assert len(incremental(listings, tmp_path).rendered) == 3
+
+
+# --- bundle_document ---------------------------------------------------------
+
+
+def outline_titles(pdf: bytes) -> List[str]:
+    return [bytes.fromhex(title.decode("ascii"))[2:].decode("utf-16-be") for title in re.findall(rb"/Title <([0-9A-F]+)>", pdf)]
+
+
+def test_bundle_has_every_listing_and_the_static_pages_once(
+    listings: List[dict], resources: brochure.SharedResources
+) -> None:
+    pdf = brochure.bundle_document(listings, resources).build()
+    listing_page_count = sum(
+        len(brochure.listing_pages(listing, resources, include_static=False)) for listing in listings
+    )
+    page_count = listing_page_count + len(resources.static_pages)
+
+    assert pdf.count(b"/Type /Page ") == page_count
+    assert f"/Count {page_count}".encode("ascii") in pdf
+    for static_page in resources.static_pages:
+        assert pdf.count(static_page.encode("latin-1")) == 1
+    assert brochure.footer(page_count).encode("latin-1") in pdf
+    assert outline_titles(pdf) == [
+        ", ".join(part for part in brochure.listing_title(listing) if part) for listing in listings
+    ]
+
+
+def test_bundle_without_listings_is_an_error(resources: brochure.SharedResources) -> None:
+    with pytest.raises(ValueError, match="No listings"):
+        brochure.bundle_document([], resources)
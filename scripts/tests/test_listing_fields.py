@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-05", "5 Jan 2024"),
+        ("2024-12-31T09:30:00Z", "31 Dec 2024"),
+        ("2024/01/05", None),
+        ("2024-13-01", None),
+        ("soon", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_format_date_treats_bad_dates_as_missing(value, expected) -> None:
+    assert brochure._format_date(value) == expected
+
+
+def test_bad_availability_date_falls_back_to_available_now() -> None:
+    listing = {"status": "available", "dateAvailableFrom": "2024-13-01"}
+
+    assert brochure._listing_availability(listing) == "Available now"
+
+
+@pytest.mark.parametrize(
+    "current, potential, expected",
+    [
+        (72, 85, "Current rating C (72), potential B (85)."),
+        ("72", "85", "Current rating C (72), potential B (85)."),
+        ("72", "n/a", "Current rating C (72)."),
+        ("C", None, "EPC rating available on request."),
+        (None, None, "EPC rating available on request."),
+    ],
+)
+def test_epc_scores_are_coerced(current, potential, expected) -> None:
+    listing = {"epcEeCurrent": current, "epcEePotential": potential}
+
+    assert brochure._listing_epc(listing) == expected
+
+
+def test_listing_with_malformed_fields_still_renders() -> None:
+    listing = {
+        "id": "bad-record",
+        "status": "available",
+        "dateAvailableFrom": "2024/01/05",
+        "epcEeCurrent": "sixty",
+        "epcEePotential": {"value": 80},
+    }
+
+    pdf = brochure.listing_document(listing, brochure.prepare_shared_resources()).build()
+
+    assert pdf.startswith(b"%PDF")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import generate_aktonz_logo as logo
+
+
+def test_valid_variant_parses() -> None:
+    variant = logo.parse_variant({"name": "branch-e1", "word": "AKTONZ E1", "width": 640, "png": [[320, 80]]})
+
+    assert variant.style.word == "AKTONZ E1"
+    assert variant.png_sizes == ((320, 80),)
+
+
+@pytest.mark.parametrize(
+    "entry, message",
+    [
+        ({"scale": "10"}, "scale must be a number"),
+        ({"scale": 0}, "scale must be positive"),
+        ({"spacing": -1}, "spacing must be positive"),
+        ({"width": 400.5}, "width must be a whole number"),
+        ({"height": True}, "height must be a whole number"),
+        ({"png": [[0, 0]]}, "positive whole pixels"),
+        ({"png": [["32", 32]]}, "positive whole pixels"),
+        ({"png": [[32]]}, "positive whole pixels"),
+        ({"svg": "no"}, "svg must be true or false"),
+        ({"word": "AKTONZ!"}, "no glyph for '!'"),
+        ({"word": "aktonz"}, "no glyph for"),
+        ({"word": ""}, "word must not be empty"),
+        ({"word": 42}, "word must be a string"),
+        ({"scale": 40}, "more than the 400x160 canvas"),
+    ],
+)
+def test_bad_variants_are_rejected(entry: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        logo.parse_variant({"name": "bad", **entry})
+
+
+def test_bad_spec_fails_before_anything_is_written(tmp_path: Path) -> None:
+    spec = tmp_path / "variants.json"
+    spec.write_text(json.dumps([{"name": "good"}, {"name": "bad", "png": [[0, 0]]}]), encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    with pytest.raises(ValueError):
+        logo.render_variants(logo.load_variants(spec), output_dir)
+
+    assert not output_dir.exists()
+
+
+def test_shipped_variants_are_valid() -> None:
+    assert logo.load_variants(Path(logo.__file__).resolve().parent.parent / "data" / "aktonz-logo-variants.json")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+from pathlib import Path
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+
+class FailingSink(brochure.OutputSink):
+    def close(self, size: int, digest: str) -> bool:
+        raise OSError("disk full")
+
+
+def test_publish_writes_every_sink(tmp_path: Path) -> None:
+    first, second = brochure.FileSink(tmp_path / "a.pdf"), brochure.FileSink(tmp_path / "b.pdf")
+    digest, changed = brochure.publish([b"%PDF", b"-1.4\n"], [first, second])
+
+    assert digest == hashlib.sha256(b"%PDF-1.4\n").hexdigest()
+    assert changed == [True, True]
+    assert (tmp_path / "b.pdf").read_bytes() == b"%PDF-1.4\n"
+    assert brochure.publish([b"%PDF-1.4\n"], [brochure.FileSink(tmp_path / "a.pdf")])[1] == [False]
+
+
+def test_publish_removes_temporary_files_when_a_sink_fails_to_close(tmp_path: Path) -> None:
+    sinks = [brochure.FileSink(tmp_path / "a.pdf"), FailingSink(), brochure.FileSink(tmp_path / "b.pdf")]
+
+    with pytest.raises(OSError, match="disk full"):
+        brochure.publish([b"%PDF-1.4\n"], sinks)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.pdf"]
+
+
+def test_publish_aborts_every_sink_when_rendering_fails(tmp_path: Path) -> None:
+    def chunks():
+        yield b"%PDF"
+        raise ValueError("render failed")
+
+    with pytest.raises(ValueError, match="render failed"):
+        brochure.publish(chunks(), [brochure.FileSink(tmp_path / "a.pdf"), brochure.FileSink(tmp_path / "b.pdf")])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def module_payload(path: Path) -> bytes:
+    text = path.read_bytes()
+    assert text.startswith(brochure.INLINE_MODULE_PREFIX) and text.endswith(brochure.INLINE_MODULE_SUFFIX)
+    return base64.b64decode(text[len(brochure.INLINE_MODULE_PREFIX) : -len(brochure.INLINE_MODULE_SUFFIX)])
+
+
+def test_base64_module_is_left_alone_when_unchanged(tmp_path: Path) -> None:
+    module = tmp_path / "inline.mjs"
+    pdf = bytes(range(256)) * (brochure.BASE64_CHUNK_SIZE // 100)
+    pieces = [pdf[:7], pdf[7 : brochure.BASE64_CHUNK_SIZE + 5], pdf[brochure.BASE64_CHUNK_SIZE + 5 :]]
+
+    assert brochure.publish([pdf], [brochure.Base64ModuleSink(module)])[1] == [True]
+    written = module.stat()
+    assert module_payload(module) == pdf
+
+    # Chunk boundaries that do not line up with the base64 pieces still compare equal.
+    assert brochure.publish(pieces, [brochure.Base64ModuleSink(module)])[1] == [False]
+    assert (module.stat().st_ino, module.stat().st_mtime_ns) == (written.st_ino, written.st_mtime_ns)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["inline.mjs"]
+
+
+PDF = b"%PDF-1.4\n" * 1000
+
+
+@pytest.mark.parametrize("updated", [PDF + b"X", PDF[:-1] + b"?"], ids=["longer", "edited"])
+def test_base64_module_is_rewritten_when_the_pdf_changes(tmp_path: Path, updated: bytes) -> None:
+    module = tmp_path / "inline.mjs"
+    brochure.publish([PDF], [brochure.Base64ModuleSink(module)])
+
+    assert brochure.publish([updated], [brochure.Base64ModuleSink(module)])[1] == [True]
+    assert module_payload(module) == updated
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["inline.mjs"]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Iterator, List
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+
+def test_stream_matches_the_built_document() -> None:
+    assert b"".join(brochure.brochure_chunks()) == brochure.brochure_document().build()
+
+
+def test_stream_yields_each_page_before_the_next_is_laid_out() -> None:
+    requested: List[int] = []
+
+    def pages() -> Iterator[str]:
+        for number in range(1, 4):
+            requested.append(number)
+            yield brochure.footer(number)
+
+    brochure.reset_font_usage()
+    chunks = brochure.stream_document(brochure.start_document(), pages())
+
+    assert next(chunks) == brochure.PDFBuilder.HEADER
+    assert requested == []
+    for chunk in chunks:
+        if requested:
+            break
+    assert requested == [1]
+    assert brochure.footer(1).encode("latin-1") in chunk
+    assert b"".join(chunks).endswith(b"%%EOF\n")
+    assert requested == [1, 2, 3]
+
+
+def test_objects_are_set_only_once() -> None:
+    builder = brochure.PDFBuilder()
+    obj = builder.reserve_object()
+    builder.set_object(obj, b"<< >>\n")
+
+    with pytest.raises(ValueError):
+        builder.set_object(obj, b"<< >>\n")
+
+
+def test_xref_offsets_point_at_their_objects() -> None:
+    builder = brochure.PDFBuilder()
+    late = builder.reserve_object()
+    early = builder.add_object(b"(early)\n")
+    builder.set_object(late, b"<< /Type /Catalog >>\n")
+    builder.set_root(late)
+
+    data = b"".join(builder.finish())
+    xref = data[data.index(b"\nxref\n") + 1 :].split(b"\n")
+    offsets = [int(line[:10]) for line in xref[3:5]]
+
+    assert data[offsets[late - 1] :].startswith(f"{late} 0 obj".encode("ascii"))
+    assert data[offsets[early - 1] :].startswith(f"{early} 0 obj".encode("ascii"))
+    assert data == builder.build()
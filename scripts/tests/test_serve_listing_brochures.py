@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Dict, Iterator, List, Tuple
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+import serve_listing_brochures as serve
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+@pytest.fixture(scope="module")
+def listing_ids() -> List[str]:
+    return [str(listing["id"]) for listing in json.loads(brochure.LISTINGS_PATH.read_text(encoding="utf-8"))[:2]]
+
+
+@pytest.fixture
+def service() -> Iterator[serve.BrochureService]:
+    brochure_service = serve.BrochureService(workers=1, max_pending=1)
+    try:
+        yield brochure_service
+    finally:
+        brochure_service.close()
+
+
+async def fetch(port: int, path: str) -> Response:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, body = raw.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        body = dechunk(body)
+    return int(status_line.split()[1]), headers, body
+
+
+def dechunk(data: bytes) -> bytes:
+    pieces: List[bytes] = []
+    while True:
+        size_line, _, data = data.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            assert data == b"\r\n", "missing final chunk"
+            return b"".join(pieces)
+        pieces.append(data[:size])
+        assert data[size : size + 2] == b"\r\n"
+        data = data[size + 2 :]
+
+
+def run_with_server(service: serve.BrochureService, scenario) -> object:
+    """Serve on an ephemeral port for the duration of ``scenario(port)``."""
+
+    async def main() -> object:
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        async with server:
+            return await asyncio.wait_for(scenario(server.sockets[0].getsockname()[1]), timeout=120)
+
+    return asyncio.run(main())
+
+
+def count_submissions(service: serve.BrochureService) -> List[tuple]:
+    submitted: List[tuple] = []
+    submit = service.executor.submit
+
+    def counting_submit(function, *args, **kwargs):
+        submitted.append((function.__name__, *args))
+        return submit(function, *args, **kwargs)
+
+    service.executor.submit = counting_submit
+    return submitted
+
+
+def test_listing_is_served_as_a_pdf(service: serve.BrochureService, listing_ids: List[str]) -> None:
+    status, headers, body = run_with_server(service, lambda port: fetch(port, f"/listings/{listing_ids[0]}.pdf"))
+
+    assert status == 200
+    assert headers["content-type"] == "application/pdf"
+    assert headers["transfer-encoding"] == "chunked"
+    assert "content-length" not in headers
+    assert body.startswith(b"%PDF-1.4\n")
+    assert body.rstrip().endswith(b"%%EOF")
+
+
+def test_streamed_listing_matches_the_built_pdf(service: serve.BrochureService, listing_ids: List[str]) -> None:
+    _, _, body = run_with_server(service, lambda port: fetch(port, f"/listings/{listing_ids[0]}.pdf"))
+    listing = service.listing(listing_ids[0])
+
+    assert body == brochure.listing_document(listing, brochure.prepare_shared_resources()).build()
+
+
+def test_identical_requests_share_one_render(service: serve.BrochureService, listing_ids: List[str]) -> None:
+    submitted = count_submissions(service)
+    path = f"/listings/{listing_ids[0]}.pdf"
+
+    first, second = run_with_server(service, lambda port: asyncio.gather(fetch(port, path), fetch(port, path)))
+
+    assert len(submitted) == 1
+    assert first[0] == second[0] == 200
+    assert first[2] == second[2]
+    assert first[1]["etag"] == second[1]["etag"]
+
+
+def test_full_queue_answers_503_with_retry_after(service: serve.BrochureService, listing_ids: List[str]) -> None:
+    async def scenario(port: int) -> Tuple[Response, Response]:
+        pending = asyncio.ensure_future(fetch(port, f"/listings/{listing_ids[0]}.pdf"))
+        while not service.inflight:
+            await asyncio.sleep(0.01)
+        refused = await fetch(port, f"/listings/{listing_ids[1]}.pdf")
+        return refused, await pending
+
+    (status, headers, body), (accepted_status, _, accepted_body) = run_with_server(service, scenario)
+
+    assert status == 503
+    assert headers["retry-after"] == "2"
+    assert body == b"Render queue is full\n"
+    assert accepted_status == 200
+    assert accepted_body.startswith(b"%PDF")
+
+
+def test_unknown_listing_is_404(service: serve.BrochureService) -> None:
+    status, _, _ = run_with_server(service, lambda port: fetch(port, "/listings/does-not-exist.pdf"))
+
+    assert status == 404
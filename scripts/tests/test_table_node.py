@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+
+def test_table_measures_rows_under_the_header() -> None:
+    table = brochure.TableNode(["Service", "Fee"], [["Let only", "8%"], ["Fully managed", ""]])
+
+    height = table.measure(400)
+
+    assert height == pytest.approx(table._header_height + sum(table._row_heights) + 2 * table.cell_padding)
+    assert len(table._row_heights) == 2
+    assert sum(table._widths) == pytest.approx(400)
+
+
+def test_empty_table_measures_to_its_minimum_height() -> None:
+    table = brochure.TableNode([], [])
+
+    one_line = table._cell_height(1, table.header_size, brochure._resolved_leading(table.header_size, None))
+
+    assert table.measure(400) == pytest.approx(one_line + 2 * table.cell_padding)
+    assert table.render(0, 500, 400)
+
+
+def test_table_without_rows_keeps_its_header() -> None:
+    table = brochure.TableNode(["Service", "Fee"], [])
+
+    assert table.measure(400) == table._header_height + 2 * table.cell_padding
+    assert table.split(1000, 400) is None
+
+
+def test_blank_cells_still_get_a_row() -> None:
+    table = brochure.TableNode(["Service", "Fee"], [["", ""]])
+
+    table.measure(400)
+
+    assert table._row_heights == [table._cell_height(1, table.size, table.leading)]
+
+
+@pytest.mark.parametrize("row", [["Let only"], ["Let only", "8%", "extra"], []])
+def test_ragged_rows_are_rejected(row) -> None:
+    with pytest.raises(ValueError, match="Table row 2 has"):
+        brochure.TableNode(["Service", "Fee"], [["Fully managed", "12%"], row])
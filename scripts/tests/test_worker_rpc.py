@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import List
+
+import create_aktonz_lettings_brochure as brochure
+
+
+def run_worker(*requests: object) -> List[dict]:
+    stdin = io.StringIO("".join(f"{json.dumps(request)}\n" for request in requests))
+    stdout = io.StringIO()
+    brochure.serve_worker(stdin, stdout)
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_requests_are_answered_with_their_id() -> None:
+    responses = run_worker({"jsonrpc": "2.0", "id": 7, "method": "ping"})
+
+    assert [response["id"] for response in responses] == [7]
+    assert "pid" in responses[0]["result"]
+
+
+def test_notifications_are_not_answered() -> None:
+    responses = run_worker(
+        {"jsonrpc": "2.0", "method": "ping"},
+        {"jsonrpc": "2.0", "method": "no_such_method"},
+        {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+        {"jsonrpc": "2.0", "method": "shutdown"},
+        {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+    )
+
+    assert [response["id"] for response in responses] == [1]
+
+
+def test_errors_are_reported_for_requests() -> None:
+    responses = run_worker({"jsonrpc": "2.0", "id": "a", "method": "no_such_method"})
+
+    assert responses[0]["id"] == "a"
+    assert responses[0]["error"]["code"] == brochure.RPC_METHOD_NOT_FOUND
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+import create_aktonz_lettings_brochure as brochure
+
+PARAGRAPHS = [
+    "Aktonz manages every stage of the letting journey, from valuation and marketing to "
+    "referencing, move-in and renewals, so landlords stay informed without chasing updates.",
+    "Our lettings team pairs local knowledge with clear reporting, and we keep fees transparent "
+    "with no hidden extras or surprise charges at renewal.",
+    "A a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a a.",
+]
+
+
+@pytest.fixture(params=[False, True], ids=["estimate", "kerned"])
+def kerning(request: pytest.FixtureRequest) -> Iterator[bool]:
+    previous = dict(brochure.KERNED_FONTS)
+    brochure.enable_kerning(request.param)
+    try:
+        yield request.param
+    finally:
+        brochure.KERNED_FONTS.clear()
+        brochure.KERNED_FONTS.update(previous)
+
+
+@pytest.mark.parametrize("width", [120, 190, 260, 430])
+@pytest.mark.parametrize("paragraph", PARAGRAPHS)
+def test_optimal_is_never_taller_than_greedy(kerning: bool, paragraph: str, width: float) -> None:
+    greedy = brochure.wrapped_lines([paragraph], width=width, size=11)
+    optimal = brochure.wrapped_lines([paragraph], width=width, size=11, mode="optimal")
+
+    assert len(optimal) <= len(greedy)
+    assert " ".join(" ".join(optimal).split()) == " ".join(paragraph.split())
+
+
+@pytest.mark.parametrize("width", [120, 190, 260, 430])
+@pytest.mark.parametrize("paragraph", PARAGRAPHS)
+def test_optimal_lines_fit_the_width(kerning: bool, paragraph: str, width: float) -> None:
+    lines = brochure.wrapped_bullets([paragraph], width=width, size=11, mode="optimal")
+
+    for line in lines:
+        if kerning:
+            assert brochure.text_width(line, font="F1", size=11) <= width + 1e-6
+        else:
+            assert len(line) <= int(width / (11 * brochure.CHAR_WIDTH_ESTIMATE["F1"]))
+
+
+def test_benchmark_reports_slack_in_points() -> None:
+    report = brochure.benchmark_wrapping([PARAGRAPHS[:2]], width=190, repeat=1)
+
+    assert set(report) == {"pages", "paragraphs", *brochure.WRAP_MODES}
+    assert report["optimal"]["lines"] <= report["greedy"]["lines"]
+    assert report["optimal"]["raggedness"] <= report["greedy"]["raggedness"]